@@ -0,0 +1,38 @@
+"""user comment history index
+
+Partial composite index for keyset pagination of
+GET /comments/user/comments on (user_id, created_at, id), limited to
+comments that are not deleted. Built CONCURRENTLY so commenting
+continues while it is created.
+
+Revision ID: 10bc18893a72
+Revises: 6bcce92f0aeb
+Create Date: 2026-10-18 09:33:26.150839
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '10bc18893a72'
+down_revision = '6bcce92f0aeb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_user_created_at_id",
+            "comments",
+            ["user_id", "created_at", "id"],
+            postgresql_where=sa.text("is_deleted = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_comments_user_created_at_id", table_name="comments", postgresql_concurrently=True)
@@ -0,0 +1,44 @@
+"""initial schema
+
+Creates the comments table the service used to create only through
+Base.metadata.create_all at startup; databases that already have it are
+left unchanged.
+
+Revision ID: 6bcce92f0aeb
+Revises: 
+Create Date: 2026-10-18 09:14:52.667120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '6bcce92f0aeb'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if "comments" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    op.create_table(
+        "comments",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("content_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("parent_comment_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("comments.id"), nullable=True),
+        sa.Column("comment_text", sa.Text(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False)
+    )
+    op.create_index("ix_comments_user_id", "comments", ["user_id"])
+    op.create_index("ix_comments_content_id", "comments", ["content_id"])
+    op.create_index("ix_comments_parent_comment_id", "comments", ["parent_comment_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("comments")
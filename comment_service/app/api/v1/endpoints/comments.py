@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response, Query
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from sqlalchemy import tuple_
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 import logging
 
@@ -9,6 +10,7 @@ from app.models.comment import Comment
 from app.db.base import get_db
 from app.api.dependencies import get_current_user, require_role
 from app.core.security import sanitize_html
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -288,33 +290,63 @@ async def delete_comment(
 
 @router.get("/user/comments")
 async def get_user_comments(
+    response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user),
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500)
 ):
     """
-    Get all comments created by the current user.
+    Get the comments created by the current user, newest first.
+    
+    Pages are keyset-paginated on (created_at, id) using the partial
+    ix_comments_user_created_at_id index, so every page costs the same.
+    When more comments follow, the X-Next-Cursor response header holds
+    the cursor for the next page.
     
     Args:
+        response: Response, for the next-page cursor header
         current_user: Current authenticated user
         db: Database session
-        skip: Number of records to skip
+        cursor: Cursor from the previous page's X-Next-Cursor header
+        skip: Number of records to skip (deprecated; ignored with a cursor)
         limit: Maximum number of records to return
         
     Returns:
         List of user's comments
+        
+    Raises:
+        HTTPException: 400 if the cursor is invalid, 500 on database error
     """
     try:
-        comments = db.query(Comment).filter(
+        query = db.query(Comment).filter(
             Comment.user_id == UUID(current_user["user_id"]),
             Comment.is_deleted == False
-        ).order_by(
-            Comment.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        )
+        if cursor:
+            created_at, comment_id = decode_cursor(cursor)
+            query = query.filter(tuple_(Comment.created_at, Comment.id) < tuple_(created_at, comment_id))
+        elif skip:
+            query = query.offset(skip)
+        
+        # One extra row tells whether another page follows
+        comments = query.order_by(
+            Comment.created_at.desc(),
+            Comment.id.desc()
+        ).limit(limit + 1).all()
+        
+        if len(comments) > limit:
+            comments = comments[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(comments[-1].created_at, comments[-1].id)
         
         return comments
         
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting user comments: {e}")
         raise HTTPException(
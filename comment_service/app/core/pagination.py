@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+import base64
+
+# Response header carrying the cursor of the next page; absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+    
+    Args:
+        timestamp: Timestamp of the last row
+        row_id: ID of the last row (breaks timestamp ties)
+        
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{timestamp.isoformat()}|{row_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        
+    Returns:
+        (timestamp, row_id) of the last row of the previous page
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        timestamp, row_id = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split("|")
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -29,6 +29,16 @@ class Comment(Base):
     is_deleted = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
+    # Keyset pagination of a user's comment history, newest first;
+    # deleted comments are never listed, so they are left out
+    __table_args__ = (
+        Index(
+            'ix_comments_user_created_at_id',
+            'user_id', 'created_at', 'id',
+            postgresql_where=(is_deleted == False)
+        ),
+    )
+    
     # Relationship for nested comments
     replies = relationship(
         "Comment",
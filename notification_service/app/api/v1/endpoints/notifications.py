@@ -3,7 +3,7 @@ from typing import List, Dict, Any
 from datetime import datetime, timezone
 from bson import ObjectId
 
-from app.schemas.notification import NotificationOut, NotificationMarkRead
+from app.schemas.notification import NotificationOut, NotificationMarkRead, NotificationBatchCreate
 from app.api.dependencies import get_current_user
 from app.db.mongodb import get_collection
 
@@ -148,3 +148,42 @@ async def get_unread_count(
     })
     
     return {"unread_count": count}
+
+
+@router.post("/batch", status_code=status.HTTP_201_CREATED)
+async def create_notifications_batch(
+    data: NotificationBatchCreate,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Create many notifications in one request.
+    
+    Used by other services to deliver events (e.g. saved search alerts
+    from the Search Service). Only service and admin tokens may call it.
+    
+    Args:
+        data: Notifications to create
+        current_user: Current authenticated user from JWT token
+        
+    Returns:
+        Success message with count of created notifications
+    """
+    if current_user.get("role") not in ["service", "admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to create notifications"
+        )
+    
+    now = datetime.now(timezone.utc)
+    documents = [
+        {**notification.model_dump(), "timestamp": now, "is_read": False}
+        for notification in data.notifications
+    ]
+    
+    collection = get_collection("notifications")
+    result = await collection.insert_many(documents, ordered=False)
+    
+    return {
+        "message": f"Created {len(result.inserted_ids)} notification(s)",
+        "count": len(result.inserted_ids)
+    }
@@ -32,3 +32,8 @@ class NotificationOut(BaseModel):
 class NotificationMarkRead(BaseModel):
     """Schema for marking notifications as read."""
     notification_ids: list[str]
+
+
+class NotificationBatchCreate(BaseModel):
+    """Schema for creating notifications in bulk (service-to-service)."""
+    notifications: list[NotificationCreate] = Field(..., min_length=1, max_length=1000)
@@ -0,0 +1,54 @@
+from fastapi import Request
+from app.core.config import settings
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import contextlib
+
+
+class ClientDisconnectedError(Exception):
+    """Raised when the HTTP client goes away before the result is ready."""
+
+
+async def run_cancellable(
+    request: Request,
+    awaitable: Awaitable,
+    on_disconnect: Optional[Callable[[], Awaitable]] = None
+) -> Any:
+    """
+    Await a result, abandoning it if the HTTP client disconnects.
+    
+    The awaitable runs as a task while the connection is polled every
+    SEARCH_DISCONNECT_POLL_SECONDS. On disconnect the task is cancelled,
+    which also closes its in-flight backend request, and on_disconnect
+    is awaited to clean up remote work (e.g. cancel the search task).
+    
+    Args:
+        request: Incoming HTTP request
+        awaitable: Work to run on behalf of the request
+        on_disconnect: Optional cleanup coroutine function
+        
+    Returns:
+        Result of the awaitable
+        
+    Raises:
+        ClientDisconnectedError: If the client disconnected first
+    """
+    task = asyncio.ensure_future(awaitable)
+    
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=settings.SEARCH_DISCONNECT_POLL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                break
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError, Exception):
+        await task
+    if on_disconnect:
+        await on_disconnect()
+    raise ClientDisconnectedError()
@@ -1,33 +1,92 @@
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, BackgroundTasks, Request
 from typing import Optional, List
-from app.schemas.search import SearchResponse, IndexContent
-from app.db.elasticsearch import search_content, index_content, update_content, delete_content
+from app.schemas.search import (
+    SearchResponse,
+    SuggestResponse,
+    MultiSearchRequest,
+    MultiSearchResponse,
+    SimilarResponse,
+    IndexContent,
+    BulkIndexRequest,
+    BulkIndexResponse,
+    SavedSearchCreate,
+    SavedSearchOut,
+    VoteTallyBatch,
+    QueryAnalyticsReport
+)
+from app.db.backend import (
+    SearchBackend,
+    DocumentNotFoundError,
+    SearchTimeoutError,
+    SearchUnavailableError,
+    get_search_backend,
+    is_browse_query
+)
+from app.api.cancellation import run_cancellable, ClientDisconnectedError
+from app.core.alerts import alert_saved_searches
+from app.core.tallies import tally_consumer
+from app.core.analytics import query_analytics
+from app.core.config import settings
 from app.api.dependencies import get_current_user
 from typing import Dict, Any
 import logging
+import time
+import uuid
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Non-standard status for requests abandoned by the client (as in nginx)
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+
+def elapsed_ms(started: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return (time.perf_counter() - started) * 1000
+
 
 @router.get("/query", response_model=SearchResponse)
 async def search_query(
-    query: str = Query(..., min_length=1, max_length=500, description="Search query string"),
+    request: Request,
+    query: str = Query("*", max_length=500, description="Search query string (empty or * to browse)"),
     status_filter: Optional[str] = Query(None, alias="status", description="Filter by verification status"),
     tags: Optional[str] = Query(None, description="Comma-separated list of tags"),
     page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(10, ge=1, le=100, description="Results per page")
+    per_page: int = Query(10, ge=1, le=100, description="Results per page"),
+    facets: bool = Query(False, description="Include tag, status and date facet counts"),
+    facet_interval: str = Query(
+        "month",
+        pattern="^(day|week|month|quarter|year)$",
+        description="Calendar interval for the submission date facet"
+    ),
+    min_votes: Optional[int] = Query(None, ge=0, description="Minimum total votes"),
+    sort: str = Query("date", pattern="^(date|votes)$", description="Sort by newest or most voted"),
+    backend: SearchBackend = Depends(get_search_backend)
 ):
     """
     Search for content using full-text search with filters.
     
+    An empty or "*" query browses the newest content matching the
+    filters without full-text scoring. Facet counts, when requested,
+    are computed in the same Elasticsearch request as the hits so
+    filter sidebars need no extra round trips.
+    
+    The search runs under a deadline and is cancelled if the client
+    disconnects; results cut short by shard timeouts are flagged partial.
+    
     Args:
-        query: Search query string
+        request: Incoming HTTP request (watched for disconnects)
+        query: Search query string (default: * to browse)
         status_filter: Optional filter by verification status
         tags: Optional comma-separated list of tags
         page: Page number (default: 1)
         per_page: Results per page (default: 10, max: 100)
+        facets: Whether to include facet counts (default: False)
+        facet_interval: Submission date histogram interval (default: month)
+        min_votes: Optional minimum total votes
+        sort: date (newest first, default) or votes (most voted first)
+        backend: Configured search backend
         
     Returns:
         SearchResponse with matching content items
@@ -38,17 +97,53 @@ async def search_query(
         if tags:
             tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
         
-        # Search Elasticsearch
-        result = await search_content(
-            query=query,
-            status=status_filter,
-            tags=tags_list,
-            page=page,
-            per_page=per_page
+        filters = {
+            "status": status_filter,
+            "tags": tags_list,
+            "min_votes": min_votes,
+            "sort": sort,
+            "facets": facets or None
+        }
+        
+        # Search the configured backend
+        started = time.perf_counter()
+        opaque_id = uuid.uuid4().hex
+        result = await run_cancellable(
+            request,
+            backend.search_content(
+                query=query,
+                status=status_filter,
+                tags=tags_list,
+                page=page,
+                per_page=per_page,
+                facets=facets,
+                facet_interval=facet_interval,
+                min_votes=min_votes,
+                sort=sort,
+                opaque_id=opaque_id
+            ),
+            on_disconnect=lambda: backend.cancel_search(opaque_id)
         )
         
+        query_analytics.record("query", query, filters, elapsed_ms(started), result)
         return result
         
+    except ClientDisconnectedError:
+        raise HTTPException(
+            status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+            detail="Client closed request"
+        )
+    except SearchTimeoutError:
+        query_analytics.record("query", query, filters, elapsed_ms(started), outcome="timeout")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Search timed out"
+        )
+    except SearchUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable"
+        )
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(
@@ -57,20 +152,434 @@ async def search_query(
         )
 
 
+@router.get("/author/{author_id}", response_model=SearchResponse)
+async def search_author(
+    request: Request,
+    author_id: str,
+    query: str = Query("*", max_length=500, description="Search query string (empty or * to browse)"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by verification status"),
+    tags: Optional[str] = Query(None, description="Comma-separated list of tags"),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(10, ge=1, le=100, description="Results per page"),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Search within one author's content.
+    
+    When the content index is routed by author, the search is sent to
+    the single shard holding the author's documents instead of all shards.
+    
+    Args:
+        request: Incoming HTTP request (watched for disconnects)
+        author_id: ID of the author whose content to search
+        query: Search query string (default: * to browse)
+        status_filter: Optional filter by verification status
+        tags: Optional comma-separated list of tags
+        page: Page number (default: 1)
+        per_page: Results per page (default: 10, max: 100)
+        backend: Configured search backend
+        
+    Returns:
+        SearchResponse with the author's matching content items
+    """
+    try:
+        # Parse tags if provided
+        tags_list = None
+        if tags:
+            tags_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        
+        filters = {"status": status_filter, "tags": tags_list}
+        
+        started = time.perf_counter()
+        opaque_id = uuid.uuid4().hex
+        result = await run_cancellable(
+            request,
+            backend.search_content(
+                query=query,
+                status=status_filter,
+                tags=tags_list,
+                page=page,
+                per_page=per_page,
+                author_id=author_id,
+                opaque_id=opaque_id
+            ),
+            on_disconnect=lambda: backend.cancel_search(opaque_id)
+        )
+        
+        query_analytics.record("author", query, filters, elapsed_ms(started), result)
+        return result
+        
+    except ClientDisconnectedError:
+        raise HTTPException(
+            status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+            detail="Client closed request"
+        )
+    except SearchTimeoutError:
+        query_analytics.record("author", query, filters, elapsed_ms(started), outcome="timeout")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Search timed out"
+        )
+    except SearchUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable"
+        )
+    except Exception as e:
+        logger.error(f"Author search error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Author search failed"
+        )
+
+
+@router.post("/multi", response_model=MultiSearchResponse)
+async def search_multi(
+    request: Request,
+    searches: MultiSearchRequest,
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Run several searches in a single request.
+    
+    With Elasticsearch all searches are sent as one _msearch call, so a
+    dashboard with several widgets costs one HTTP request and one
+    cluster round trip. Each search reports its own result or error.
+    
+    Args:
+        request: Incoming HTTP request (watched for disconnects)
+        searches: Batch of searches, each shaped like a /query request
+        backend: Configured search backend
+        
+    Returns:
+        MultiSearchResponse with one entry per search, in request order
+    """
+    try:
+        started = time.perf_counter()
+        opaque_id = uuid.uuid4().hex
+        responses = await run_cancellable(
+            request,
+            backend.multi_search_content(
+                [search.model_dump() for search in searches.searches],
+                opaque_id=opaque_id
+            ),
+            on_disconnect=lambda: backend.cancel_search(opaque_id)
+        )
+        
+        latency_ms = elapsed_ms(started)
+        for search, response in zip(searches.searches, responses):
+            if response["result"] is not None:
+                filters = search.model_dump(include={"status", "tags", "min_votes", "sort"})
+                query_analytics.record("multi", search.query, filters, latency_ms, response["result"])
+        
+        return {"responses": responses}
+        
+    except ClientDisconnectedError:
+        raise HTTPException(
+            status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+            detail="Client closed request"
+        )
+    except SearchTimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Multi-search timed out"
+        )
+    except SearchUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable"
+        )
+    except Exception as e:
+        logger.error(f"Multi-search error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Multi-search operation failed"
+        )
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+async def search_suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Query prefix typed so far"),
+    size: int = Query(5, ge=1, le=20, description="Maximum number of suggestions"),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Get type-ahead suggestions for a partially typed query.
+    
+    Intended to be called on every keystroke instead of /query, so it
+    only returns short suggestion strings from the completion index.
+    
+    Args:
+        q: Query prefix typed so far
+        size: Maximum number of suggestions (default: 5, max: 20)
+        backend: Configured search backend
+        
+    Returns:
+        SuggestResponse with matching suggestion strings
+    """
+    try:
+        suggestions = await backend.suggest_content(prefix=q, size=size)
+        
+        return {
+            "query": q,
+            "suggestions": suggestions
+        }
+        
+    except SearchUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable"
+        )
+    except Exception as e:
+        logger.error(f"Suggest error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Suggest operation failed"
+        )
+
+
+@router.get("/similar/{content_id}", response_model=SimilarResponse)
+async def search_similar(
+    content_id: str,
+    size: int = Query(10, ge=1, le=50, description="Number of similar items"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by verification status"),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Find claims similar to a content item.
+    
+    Uses approximate kNN over locally computed text embeddings, so related
+    fact-checks are found by overall wording rather than keyword overlap.
+    
+    Args:
+        content_id: ID of the content to find similar items for
+        size: Number of similar items (default: 10, max: 50)
+        status_filter: Optional filter by verification status
+        backend: Configured search backend
+        
+    Returns:
+        SimilarResponse with the most similar items first
+    """
+    try:
+        results = await backend.similar_content(content_id, size=size, status=status_filter)
+        
+        return {
+            "content_id": content_id,
+            "results": results
+        }
+        
+    except DocumentNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Content not found"
+        )
+    except SearchUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Search is temporarily unavailable"
+        )
+    except Exception as e:
+        logger.error(f"Similar search error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Similar search failed"
+        )
+
+
+@router.get("/analytics", response_model=QueryAnalyticsReport)
+async def get_query_analytics(
+    hours: float = Query(24, gt=0, le=24 * 90, description="Reporting window in hours"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum entries per list"),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Report the most frequent and the slowest recent searches.
+    
+    Built from the sampled query log: popularity counts only uniformly
+    sampled searches, while every search slower than
+    ANALYTICS_SLOW_QUERY_MS is listed. Admin only.
+    
+    Args:
+        hours: Reporting window in hours (default: 24)
+        limit: Maximum entries per list (default: 20, max: 100)
+        current_user: Current authenticated user (from JWT)
+        
+    Returns:
+        QueryAnalyticsReport with top and slow queries
+        
+    Raises:
+        HTTPException: 403 if not an admin
+    """
+    if current_user.get("role") != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view query analytics"
+        )
+    
+    try:
+        return await query_analytics.report(hours, limit)
+        
+    except Exception as e:
+        logger.error(f"Query analytics report error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to build query analytics report"
+        )
+
+
+@router.post("/saved", response_model=SavedSearchOut, status_code=status.HTTP_201_CREATED)
+async def create_saved_search(
+    search: SavedSearchCreate,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Save a search to be alerted about new matching content.
+    
+    Saved searches are stored as percolator queries, so each newly
+    indexed batch is matched against all of them in one request instead
+    of re-running every saved search.
+    
+    Args:
+        search: Query and filters to save
+        current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
+        
+    Returns:
+        The created saved search
+        
+    Raises:
+        HTTPException: If the search matches everything or the user has
+            reached the saved search limit
+    """
+    if is_browse_query(search.query) and not search.status and not search.tags:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Saved search needs a query or at least one filter"
+        )
+    
+    try:
+        existing = await backend.list_saved_searches(current_user["user_id"])
+        if len(existing) >= settings.SAVED_SEARCH_MAX_PER_USER:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Saved search limit of {settings.SAVED_SEARCH_MAX_PER_USER} reached"
+            )
+        
+        return await backend.save_search(
+            current_user["user_id"],
+            search.name,
+            search.model_dump(exclude={"name"})
+        )
+        
+    except HTTPException:
+        raise
+    except NotImplementedError:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Saved searches are not supported by the configured search backend"
+        )
+    except Exception as e:
+        logger.error(f"Save search error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to save search"
+        )
+
+
+@router.get("/saved", response_model=List[SavedSearchOut])
+async def get_saved_searches(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    List the current user's saved searches, newest first.
+    
+    Args:
+        current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
+        
+    Returns:
+        List of saved searches
+    """
+    try:
+        return await backend.list_saved_searches(current_user["user_id"])
+        
+    except NotImplementedError:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Saved searches are not supported by the configured search backend"
+        )
+    except Exception as e:
+        logger.error(f"List saved searches error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to list saved searches"
+        )
+
+
+@router.delete("/saved/{search_id}", status_code=status.HTTP_200_OK)
+async def delete_saved_search(
+    search_id: str,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Delete one of the current user's saved searches.
+    
+    Args:
+        search_id: ID of the saved search
+        current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
+        
+    Returns:
+        Success message
+    """
+    try:
+        await backend.delete_saved_search(current_user["user_id"], search_id)
+        
+        return {
+            "message": "Saved search deleted successfully",
+            "search_id": search_id
+        }
+        
+    except DocumentNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved search not found"
+        )
+    except NotImplementedError:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Saved searches are not supported by the configured search backend"
+        )
+    except Exception as e:
+        logger.error(f"Delete saved search error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to delete saved search"
+        )
+
+
 @router.post("/index", status_code=status.HTTP_201_CREATED)
 async def index_document(
     content: IndexContent,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
 ):
     """
-    Index a new content document in Elasticsearch.
+    Index a new content document in the search backend.
     
     This endpoint is typically called internally by the Content Service
-    after a new content item is created.
+    after a new content item is created. Saved search alerts for the new
+    document are sent in the background after the response.
     
     Args:
         content: Content data to index
+        background_tasks: Background task queue for saved search alerts
         current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
         
     Returns:
         Success message
@@ -80,8 +589,12 @@ async def index_document(
         content_data = content.model_dump()
         content_id = content_data.pop("content_id")
         
-        # Index in Elasticsearch
-        await index_content(content_id, content_data)
+        # Index in the search backend
+        await backend.index_content(content_id, content_data)
+        
+        background_tasks.add_task(
+            alert_saved_searches, backend, [{"content_id": content_id, **content_data}]
+        )
         
         return {
             "message": "Content indexed successfully",
@@ -96,14 +609,98 @@ async def index_document(
         )
 
 
+@router.post("/index/bulk", response_model=BulkIndexResponse)
+async def bulk_index_documents(
+    request: BulkIndexRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
+):
+    """
+    Index a batch of content documents in one request.
+    
+    Derived fields such as embeddings are computed for the whole batch
+    at once and documents are written with a single bulk call, which is
+    much cheaper than one /index request per document for backfills.
+    The indexed batch is percolated once against all saved searches in
+    the background.
+    
+    Args:
+        request: Documents to index
+        background_tasks: Background task queue for saved search alerts
+        current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
+        
+    Returns:
+        Number of indexed documents and per-document errors
+    """
+    try:
+        documents = [document.model_dump() for document in request.documents]
+        result = await backend.bulk_index_content(documents)
+        
+        failed = {error["content_id"] for error in result["errors"]}
+        background_tasks.add_task(
+            alert_saved_searches,
+            backend,
+            [document for document in documents if document["content_id"] not in failed]
+        )
+        
+        return {
+            "message": "Bulk indexing completed",
+            **result
+        }
+        
+    except Exception as e:
+        logger.error(f"Bulk indexing error: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to bulk index content"
+        )
+
+
+@router.post("/index/tallies", status_code=status.HTTP_202_ACCEPTED)
+async def submit_vote_tallies(
+    batch: VoteTallyBatch,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    """
+    Queue vote tallies to be written into search documents.
+    
+    Called by the Voting Service when votes change. Tallies are coalesced
+    per content item and applied in the background as bulk partial
+    updates, so search results carry vote counts and status without a
+    call to the Voting Service per hit.
+    
+    Args:
+        batch: Vote tallies to apply
+        current_user: Current authenticated user (from JWT)
+        
+    Returns:
+        Number of accepted tallies
+    """
+    if current_user.get("role") not in ["service", "admin"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to submit vote tallies"
+        )
+    
+    tally_consumer.submit([tally.model_dump() for tally in batch.tallies])
+    
+    return {
+        "message": "Vote tallies accepted",
+        "accepted": len(batch.tallies)
+    }
+
+
 @router.put("/index/{content_id}", status_code=status.HTTP_200_OK)
 async def update_document(
     content_id: str,
     content: IndexContent,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
 ):
     """
-    Update a content document in Elasticsearch.
+    Update a content document in the search backend.
     
     This endpoint is called when content is updated in the Content Service
     to keep the search index synchronized.
@@ -112,6 +709,7 @@ async def update_document(
         content_id: ID of content to update
         content: Updated content data
         current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
         
     Returns:
         Success message
@@ -121,8 +719,8 @@ async def update_document(
         content_data = content.model_dump()
         content_data.pop("content_id", None)
         
-        # Update in Elasticsearch
-        await update_content(content_id, content_data)
+        # Update in the search backend
+        await backend.update_content(content_id, content_data)
         
         return {
             "message": "Content updated successfully",
@@ -140,10 +738,11 @@ async def update_document(
 @router.delete("/index/{content_id}", status_code=status.HTTP_200_OK)
 async def delete_document(
     content_id: str,
-    current_user: Dict[str, Any] = Depends(get_current_user)
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    backend: SearchBackend = Depends(get_search_backend)
 ):
     """
-    Delete a content document from Elasticsearch.
+    Delete a content document from the search backend.
     
     This endpoint is called when content is deleted in the Content Service
     to keep the search index synchronized.
@@ -151,13 +750,14 @@ async def delete_document(
     Args:
         content_id: ID of content to delete
         current_user: Current authenticated user (from JWT)
+        backend: Configured search backend
         
     Returns:
         Success message
     """
     try:
-        # Delete from Elasticsearch
-        await delete_content(content_id)
+        # Delete from the search backend
+        await backend.delete_content(content_id)
         
         return {
             "message": "Content deleted successfully",
@@ -0,0 +1,92 @@
+from app.core.config import settings
+from app.core.security import create_service_token
+from app.db.backend import SearchBackend
+from typing import List
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Maximum notifications accepted by one notification_service batch call
+NOTIFICATION_BATCH_SIZE = 1000
+
+
+def build_alert_notifications(matches: List[dict], documents: List[dict]) -> List[dict]:
+    """
+    Turn percolation matches into notification payloads.
+    
+    Users are not alerted about content they submitted themselves.
+    
+    Args:
+        matches: Saved searches with the content_ids they matched
+        documents: The newly indexed content documents
+        
+    Returns:
+        List of NotificationCreate-shaped dictionaries
+    """
+    authors = {document["content_id"]: document.get("author_id") for document in documents}
+    notifications = []
+    
+    for match in matches:
+        for content_id in match["content_ids"]:
+            if authors.get(content_id) == match["user_id"]:
+                continue
+            notifications.append({
+                "user_id": match["user_id"],
+                "type": "system",
+                "sender": {"id": "search_service", "name": "Saved search"},
+                "target": content_id,
+                "message": f"New content matches your saved search \"{match['name']}\""
+            })
+    
+    return notifications
+
+
+async def send_notifications(notifications: List[dict]):
+    """
+    Deliver notifications through the Notification Service batch endpoint.
+    
+    Args:
+        notifications: NotificationCreate-shaped dictionaries
+    """
+    url = f"{settings.NOTIFICATION_SERVICE_URL}/api/v1/notifications/batch"
+    headers = {"Authorization": f"Bearer {create_service_token()}"}
+    
+    async with httpx.AsyncClient(timeout=settings.NOTIFICATION_TIMEOUT_SECONDS) as client:
+        for start in range(0, len(notifications), NOTIFICATION_BATCH_SIZE):
+            chunk = notifications[start:start + NOTIFICATION_BATCH_SIZE]
+            response = await client.post(url, json={"notifications": chunk}, headers=headers)
+            response.raise_for_status()
+
+
+async def alert_saved_searches(backend: SearchBackend, documents: List[dict]):
+    """
+    Percolate newly indexed documents and notify matching saved searches.
+    
+    Runs as a background task after indexing, so failures are logged
+    rather than surfaced to the indexing caller.
+    
+    Args:
+        backend: Configured search backend
+        documents: Newly indexed content documents, each with content_id
+    """
+    if not documents:
+        return
+    
+    try:
+        matches = await backend.percolate_content(documents)
+    except NotImplementedError:
+        return
+    except Exception as e:
+        logger.error(f"Saved search percolation failed: {e}")
+        return
+    
+    notifications = build_alert_notifications(matches, documents)
+    if not notifications:
+        return
+    
+    try:
+        await send_notifications(notifications)
+        logger.info(f"Sent {len(notifications)} saved search alert(s)")
+    except Exception as e:
+        logger.error(f"Failed to send saved search alerts: {e}")
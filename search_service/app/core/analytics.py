@@ -0,0 +1,276 @@
+from app.core.config import settings
+from app.db.backend import is_browse_query
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import sqlite3
+import time
+
+logger = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS query_log (
+    recorded_at REAL NOT NULL,
+    endpoint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    filters TEXT NOT NULL,
+    took_ms INTEGER,
+    latency_ms REAL NOT NULL,
+    total INTEGER,
+    cache TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    sampled INTEGER NOT NULL
+)
+"""
+
+CREATE_INDEX_SQL = "CREATE INDEX IF NOT EXISTS query_log_recorded_at ON query_log (recorded_at)"
+
+INSERT_SQL = """
+INSERT INTO query_log (
+    recorded_at, endpoint, query, filters, took_ms, latency_ms, total, cache, outcome, sampled
+) VALUES (
+    :recorded_at, :endpoint, :query, :filters, :took_ms, :latency_ms, :total, :cache, :outcome, :sampled
+)
+"""
+
+# Only uniformly sampled rows count towards popularity, so always-kept
+# slow searches do not inflate their own query's share
+TOP_QUERIES_SQL = """
+SELECT query, COUNT(*) AS count, AVG(took_ms) AS avg_took_ms,
+       MAX(took_ms) AS max_took_ms, AVG(total) AS avg_total
+FROM query_log
+WHERE recorded_at >= ? AND sampled = 1
+GROUP BY query
+ORDER BY count DESC, query
+LIMIT ?
+"""
+
+SLOW_QUERIES_SQL = """
+SELECT recorded_at, endpoint, query, filters, took_ms, latency_ms, total, cache, outcome
+FROM query_log
+WHERE recorded_at >= ? AND latency_ms >= ?
+ORDER BY latency_ms DESC
+LIMIT ?
+"""
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """
+    Normalize a query string so equivalent searches group together.
+    
+    Args:
+        query: Raw query string
+        
+    Returns:
+        Lowercased query with collapsed whitespace, or "*" for browsing
+    """
+    if is_browse_query(query):
+        return "*"
+    return " ".join(query.lower().split())
+
+
+def normalize_filters(filters: Dict[str, Any]) -> str:
+    """
+    Serialize search filters to a stable JSON string.
+    
+    Unset filters are dropped and tag lists sorted, so the same filters
+    always produce the same string.
+    
+    Args:
+        filters: Filter values keyed by parameter name
+        
+    Returns:
+        JSON object with sorted keys
+    """
+    normalized = {}
+    for key, value in filters.items():
+        if value is None or value == []:
+            continue
+        if key == "tags":
+            value = sorted(tag.lower() for tag in value)
+        normalized[key] = value
+    return json.dumps(normalized, sort_keys=True)
+
+
+class QueryAnalytics:
+    """
+    Record a sample of searches and write them to SQLite in batches.
+    
+    Searches are recorded with probability ANALYTICS_SAMPLE_RATE, and
+    always when slower than ANALYTICS_SLOW_QUERY_MS. Records are kept
+    in memory and written every ANALYTICS_FLUSH_INTERVAL_SECONDS in one
+    transaction off the event loop; when the buffer is full new records
+    are dropped rather than slowing searches down.
+    """
+    
+    def __init__(self):
+        self._buffer: List[dict] = []
+        self._task: Optional[asyncio.Task] = None
+        self._initialized = False
+        self.counters: Counter = Counter()
+    
+    def record(
+        self,
+        endpoint: str,
+        query: Optional[str],
+        filters: Dict[str, Any],
+        latency_ms: float,
+        result: Optional[dict] = None,
+        outcome: str = "ok"
+    ):
+        """
+        Record one search if it is sampled or slow.
+        
+        Args:
+            endpoint: Search endpoint name (query, author, multi)
+            query: Raw query string
+            filters: Filter values of the search
+            latency_ms: Time spent serving the search in the service
+            result: Search result with took and total, if the search completed
+            outcome: ok, partial or timeout
+        """
+        if not settings.ANALYTICS_ENABLED:
+            return
+        
+        sampled = random.random() < settings.ANALYTICS_SAMPLE_RATE
+        if not sampled and latency_ms < settings.ANALYTICS_SLOW_QUERY_MS:
+            return
+        
+        if len(self._buffer) >= settings.ANALYTICS_BUFFER_MAX_RECORDS:
+            self.counters["dropped"] += 1
+            return
+        
+        if result is not None and result.get("partial"):
+            outcome = "partial"
+        
+        self._buffer.append({
+            "recorded_at": time.time(),
+            "endpoint": endpoint,
+            "query": normalize_query(query),
+            "filters": normalize_filters(filters),
+            "took_ms": result.get("took") if result else None,
+            "latency_ms": round(latency_ms, 2),
+            "total": result.get("total") if result else None,
+            # The service has no result cache yet; every search is served
+            # by the backend
+            "cache": result.get("cache", "none") if result else "none",
+            "outcome": outcome,
+            "sampled": int(sampled)
+        })
+        self.counters["recorded"] += 1
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the analytics database, creating it on first use."""
+        path = Path(settings.ANALYTICS_DB_PATH)
+        if not self._initialized:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        
+        connection = sqlite3.connect(path)
+        if not self._initialized:
+            with connection:
+                connection.execute(CREATE_TABLE_SQL)
+                connection.execute(CREATE_INDEX_SQL)
+            self._initialized = True
+        return connection
+    
+    def _write(self, records: List[dict]):
+        """Insert records and prune expired ones in one transaction."""
+        cutoff = time.time() - settings.ANALYTICS_RETENTION_DAYS * 86400
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(INSERT_SQL, records)
+                connection.execute("DELETE FROM query_log WHERE recorded_at < ?", (cutoff,))
+        finally:
+            connection.close()
+    
+    async def flush(self):
+        """Write all buffered records."""
+        if not self._buffer:
+            return
+        
+        records, self._buffer = self._buffer, []
+        try:
+            await asyncio.to_thread(self._write, records)
+            self.counters["flushed"] += len(records)
+        except Exception as e:
+            logger.error(f"Error writing {len(records)} query analytics records: {e}")
+            self.counters["flush_errors"] += 1
+            self.counters["dropped"] += len(records)
+    
+    def _read_report(self, since: float, limit: int) -> Dict[str, Any]:
+        """Query the top and slow search lists since a timestamp."""
+        connection = self._connect()
+        connection.row_factory = sqlite3.Row
+        try:
+            top = connection.execute(TOP_QUERIES_SQL, (since, limit)).fetchall()
+            slow = connection.execute(
+                SLOW_QUERIES_SQL,
+                (since, settings.ANALYTICS_SLOW_QUERY_MS, limit)
+            ).fetchall()
+        finally:
+            connection.close()
+        
+        return {
+            "top_queries": [dict(row) for row in top],
+            "slow_queries": [
+                {**dict(row), "filters": json.loads(row["filters"])}
+                for row in slow
+            ]
+        }
+    
+    async def report(self, hours: float, limit: int) -> Dict[str, Any]:
+        """
+        Summarize the most frequent and the slowest recent searches.
+        
+        Buffered records are flushed first so the report is current.
+        
+        Args:
+            hours: Length of the reporting window
+            limit: Maximum entries per list
+            
+        Returns:
+            Dictionary with top_queries and slow_queries
+        """
+        await self.flush()
+        since = time.time() - hours * 3600
+        report = await asyncio.to_thread(self._read_report, since, limit)
+        
+        return {
+            "hours": hours,
+            "sample_rate": settings.ANALYTICS_SAMPLE_RATE,
+            "slow_query_ms": settings.ANALYTICS_SLOW_QUERY_MS,
+            **report
+        }
+    
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.ANALYTICS_FLUSH_INTERVAL_SECONDS)
+            await self.flush()
+    
+    def start(self):
+        """Start the background flush loop."""
+        if settings.ANALYTICS_ENABLED:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop and write what is still buffered."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+    
+    def metrics(self) -> Dict[str, int]:
+        """Return recorder counters and the number of buffered records."""
+        return {"buffered": len(self._buffer), **self.counters}
+
+
+# Global query analytics recorder
+query_analytics = QueryAnalytics()
@@ -10,9 +10,102 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "VeridiaApp Search Service"
     
+    # Search Backend Settings ("elasticsearch" or "embedded")
+    SEARCH_BACKEND: str = "elasticsearch"
+    EMBEDDED_INDEX_PATH: str = "/tmp/veridiapp_search/content_index.log"
+    
     # Elasticsearch Settings
     ELASTICSEARCH_URL: str = "http://localhost:9200"
     ELASTICSEARCH_INDEX: str = "content_index"
+    ELASTICSEARCH_NUMBER_OF_SHARDS: int = 1
+    
+    # Elasticsearch Client Settings (ELASTICSEARCH_URL may list several
+    # comma-separated nodes)
+    ELASTICSEARCH_CONNECTIONS_PER_NODE: int = 25
+    ELASTICSEARCH_REQUEST_TIMEOUT_SECONDS: float = 10.0
+    ELASTICSEARCH_HTTP_COMPRESS: bool = True
+    ELASTICSEARCH_MAX_RETRIES: int = 2
+    ELASTICSEARCH_RETRY_BUDGET_RATIO: float = 0.1  # retries per request
+    ELASTICSEARCH_RETRY_BUDGET_MAX_TOKENS: float = 10.0
+    ELASTICSEARCH_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    ELASTICSEARCH_CIRCUIT_RESET_SECONDS: float = 10.0
+    ELASTICSEARCH_HEDGE_DELAY_MS: int = 0  # 0 disables hedged reads
+    
+    # Route documents to shards by author_id so author-scoped searches
+    # hit one shard (applies to newly created indexes; migrate existing
+    # ones with python -m app.db.reindex)
+    ROUTE_BY_AUTHOR: bool = False
+    
+    # Sort index segments by submission_date (newest first) so date-sorted
+    # searches can stop early per segment (applies to newly created indexes)
+    INDEX_SORT_BY_DATE: bool = True
+    
+    # Content Service MongoDB (source of truth for the consistency checker)
+    CONTENT_MONGODB_URL: str = "mongodb://localhost:27017"
+    CONTENT_MONGODB_DB_NAME: str = "veridiapp_content_db"
+    CONTENT_COLLECTION: str = "contents"
+    
+    # Consistency Checker Settings (python -m app.db.consistency)
+    CONSISTENCY_RANGES: int = 256  # initial id ranges
+    CONSISTENCY_FANOUT: int = 16  # sub-ranges per mismatching range
+    CONSISTENCY_LEAF_SIZE: int = 1000  # diff ids directly at or below this count
+    CONSISTENCY_PAGE_SIZE: int = 1000
+    
+    # Browse Settings (query empty or "*")
+    BROWSE_TRACK_TOTAL_HITS: int = 1000
+    
+    # Multi-search Settings
+    MULTI_SEARCH_MAX_QUERIES: int = 20
+    
+    # Highlight Settings
+    HIGHLIGHT_FRAGMENT_SIZE: int = 150
+    HIGHLIGHT_NUMBER_OF_FRAGMENTS: int = 3
+    
+    # Bulk Indexing Settings
+    BULK_INDEX_MAX_DOCUMENTS: int = 1000
+    BULK_INDEX_CHUNK_SIZE: int = 500
+    
+    # Similar Content Settings (hashed n-gram embeddings + kNN)
+    EMBEDDING_DIMS: int = 256
+    SIMILAR_NUM_CANDIDATES: int = 100
+    
+    # Suggestion Settings
+    SUGGEST_MAX_INPUT_LENGTH: int = 50
+    
+    # Facet Settings
+    FACET_TAGS_SIZE: int = 20
+    
+    # Search Deadline Settings
+    SEARCH_TIMEOUT_MS: int = 2000  # per-shard search timeout inside Elasticsearch
+    SEARCH_REQUEST_TIMEOUT_SECONDS: float = 5.0  # client-side deadline per request
+    ALLOW_PARTIAL_SEARCH_RESULTS: bool = True
+    SEARCH_DISCONNECT_POLL_SECONDS: float = 0.1
+    
+    # Degraded mode: drop fuzziness when this many searches are in flight
+    SEARCH_DEGRADED_IN_FLIGHT: int = 50
+    
+    # Vote Tally Settings (denormalized from voting_service)
+    TALLY_FLUSH_INTERVAL_SECONDS: float = 1.0
+    TALLY_FLUSH_MAX_IDS: int = 500
+    
+    # Query Analytics Settings (sampled, batched into a local SQLite file;
+    # searches slower than ANALYTICS_SLOW_QUERY_MS are always recorded)
+    ANALYTICS_ENABLED: bool = True
+    ANALYTICS_DB_PATH: str = "/tmp/veridiapp_search/query_analytics.db"
+    ANALYTICS_SAMPLE_RATE: float = 0.1
+    ANALYTICS_SLOW_QUERY_MS: float = 500.0
+    ANALYTICS_FLUSH_INTERVAL_SECONDS: float = 5.0
+    ANALYTICS_BUFFER_MAX_RECORDS: int = 10000
+    ANALYTICS_RETENTION_DAYS: int = 30
+    
+    # Saved Search Settings (percolator alerts)
+    SAVED_SEARCH_INDEX: str = "content_saved_searches"
+    SAVED_SEARCH_MAX_PER_USER: int = 50
+    PERCOLATE_PAGE_SIZE: int = 500
+    
+    # Notification Service Settings (for saved search alerts)
+    NOTIFICATION_SERVICE_URL: str = "http://localhost:8005"
+    NOTIFICATION_TIMEOUT_SECONDS: float = 5.0
     
     # JWT Settings (must match user_service)
     JWT_SECRET_KEY: str
@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import hashlib
+import struct
+
+# Content fields owned by the Content Service, covered by the digest
+DIGEST_FIELDS = ["author_id", "content_url", "content_text", "tags", "submission_date", "media_attachment"]
+
+# Separators of the digest string; neither occurs in content fields
+FIELD_SEPARATOR = "\x1f"
+TAG_SEPARATOR = "\x1e"
+
+# Digests keep the low 32 bits of the hash so range sums stay exact
+DIGEST_MASK = 0xFFFFFFFF
+
+# Canonical BSON type of strings, hashed ahead of the value
+BSON_STRING_TYPE = 15
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def date_millis(value) -> Optional[int]:
+    """Milliseconds since the epoch, as MongoDB stores dates."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(milliseconds=1)
+
+
+def hashed_index_key(value: str) -> int:
+    """
+    Hash a string the way MongoDB's $toHashedIndexKey does.
+    
+    MongoDB takes the first 8 bytes, little-endian, of the MD5 of a zero
+    seed, the canonical type and the BSON encoding of the value.
+    
+    Args:
+        value: String to hash
+        
+    Returns:
+        Signed 64-bit hash
+    """
+    encoded = value.encode("utf-8")
+    data = struct.pack("<iii", 0, BSON_STRING_TYPE, len(encoded) + 1) + encoded + b"\0"
+    return struct.unpack("<q", hashlib.md5(data).digest()[:8])[0]
+
+
+def digest_string(content_id: str, document: dict) -> str:
+    """
+    Normalize the Content Service fields of a document into one string.
+    
+    Strings are prefixed with "s" and missing values written as "n", so
+    None and "" differ; tags are sorted and dates reduced to milliseconds,
+    matching mongo_digest_string.
+    
+    Args:
+        content_id: ID of the content
+        document: Content fields from MongoDB or the content index
+        
+    Returns:
+        Digest input string
+    """
+    parts = [content_id]
+    for field in DIGEST_FIELDS:
+        value = document.get(field)
+        if field == "tags":
+            parts.append("t" + "".join(TAG_SEPARATOR + tag for tag in sorted(value or [])))
+        elif field == "submission_date":
+            millis = date_millis(value)
+            parts.append("n" if millis is None else f"d{millis}")
+        else:
+            parts.append(f"s{value}" if isinstance(value, str) else "n")
+    return FIELD_SEPARATOR.join(parts)
+
+
+def content_digest(content_id: str, document: dict) -> int:
+    """
+    Digest the Content Service fields of a document.
+    
+    Stored in the content index as content_digest and computed by MongoDB
+    with mongo_digest_expression, so both stores can sum an id range's
+    digests server-side.
+    
+    Args:
+        content_id: ID of the content
+        document: Content fields from MongoDB or the content index
+        
+    Returns:
+        Non-negative 32-bit digest
+    """
+    return hashed_index_key(digest_string(content_id, document)) & DIGEST_MASK
+
+
+def mongo_digest_string() -> dict:
+    """MongoDB aggregation expression building digest_string of a content document."""
+    parts = [{"$toString": "$_id"}]
+    for field in DIGEST_FIELDS:
+        if field == "tags":
+            parts.append({"$concat": ["t", {"$reduce": {
+                "input": {"$sortArray": {"input": {"$ifNull": ["$tags", []]}, "sortBy": 1}},
+                "initialValue": "",
+                "in": {"$concat": ["$$value", TAG_SEPARATOR, "$$this"]}
+            }}]})
+        elif field == "submission_date":
+            parts.append({"$cond": [
+                {"$eq": [{"$type": "$submission_date"}, "date"]},
+                {"$concat": ["d", {"$toString": {"$toLong": "$submission_date"}}]},
+                "n"
+            ]})
+        else:
+            parts.append({"$cond": [{"$eq": [{"$type": f"${field}"}, "string"]}, {"$concat": ["s", f"${field}"]}, "n"]})
+    
+    joined = [parts[0]]
+    for part in parts[1:]:
+        joined.extend([FIELD_SEPARATOR, part])
+    return {"$concat": joined}
+
+
+def mongo_digest_expression() -> dict:
+    """MongoDB aggregation expression computing content_digest (MongoDB 7.0+)."""
+    return {"$bitAnd": [{"$toHashedIndexKey": mongo_digest_string()}, DIGEST_MASK]}
@@ -0,0 +1,119 @@
+from app.core.config import settings
+from functools import lru_cache
+from typing import List, Optional
+import hashlib
+import re
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# Relative weights of the hashed feature families
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 1.0
+TRIGRAM_WEIGHT = 0.5
+
+
+@lru_cache(maxsize=200000)
+def _feature_slot(feature: str, dims: int) -> tuple:
+    """
+    Hash a feature to a vector slot and sign.
+    
+    Uses a stable hash (blake2b) rather than hash(), which is
+    randomized per process and would make vectors differ between workers.
+    
+    Args:
+        feature: Feature string
+        dims: Vector dimensionality
+        
+    Returns:
+        (slot index, +1.0 or -1.0)
+    """
+    value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+    return value % dims, 1.0 if value >> 63 else -1.0
+
+
+def _features(text: str):
+    """
+    Yield weighted features of a text.
+    
+    Word unigrams and bigrams capture topical overlap, while character
+    trigrams of each word keep near-duplicates close despite typos and
+    inflections.
+    
+    Args:
+        text: Text to featurize
+        
+    Yields:
+        (feature string, weight) pairs
+    """
+    words = TOKEN_PATTERN.findall(text.lower())
+    for i, word in enumerate(words):
+        yield f"w:{word}", WORD_WEIGHT
+        if i:
+            yield f"b:{words[i - 1]} {word}", BIGRAM_WEIGHT
+        padded = f"#{word}#"
+        for j in range(len(padded) - 2):
+            yield f"c:{padded[j:j + 3]}", TRIGRAM_WEIGHT
+
+
+def embedding_text(content_data: dict) -> str:
+    """
+    Build the text embedded for a content document.
+    
+    Args:
+        content_data: Dictionary containing content fields
+        
+    Returns:
+        content_text followed by the tags
+    """
+    tags = " ".join(content_data.get("tags") or [])
+    return f"{content_data.get('content_text') or ''} {tags}".strip()
+
+
+def embed_texts(texts: List[str], dims: Optional[int] = None) -> np.ndarray:
+    """
+    Compute hashed n-gram embeddings for a batch of texts.
+    
+    Features of every text are hashed into (row, slot, value) triples and
+    scattered into one matrix in a single vectorized step, so embedding a
+    batch costs one pass over the features plus one NumPy accumulation.
+    Rows are L2-normalized so cosine similarity is a dot product.
+    
+    Args:
+        texts: Texts to embed
+        dims: Vector dimensionality (defaults to EMBEDDING_DIMS)
+        
+    Returns:
+        Float32 array of shape (len(texts), dims); empty texts give zero rows
+    """
+    dims = dims or settings.EMBEDDING_DIMS
+    rows, slots, values = [], [], []
+    
+    for row, text in enumerate(texts):
+        for feature, weight in _features(text or ""):
+            slot, sign = _feature_slot(feature, dims)
+            rows.append(row)
+            slots.append(slot)
+            values.append(sign * weight)
+            
+    matrix = np.zeros((len(texts), dims), dtype=np.float32)
+    np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(slots, dtype=np.intp)), values)
+    
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def embed_documents(documents: List[dict]) -> List[Optional[List[float]]]:
+    """
+    Compute embeddings for a batch of content documents.
+    
+    Args:
+        documents: Content dictionaries
+        
+    Returns:
+        Embedding per document as a list of floats, or None when the
+        document has no text (zero vectors are invalid for cosine kNN)
+    """
+    matrix = embed_texts([embedding_text(document) for document in documents])
+    return [row.tolist() if row.any() else None for row in matrix]
@@ -23,3 +23,25 @@ def decode_token(token: str) -> Dict[str, Any]:
         algorithms=[settings.JWT_ALGORITHM]
     )
     return payload
+
+
+def create_service_token(expires_minutes: int = 5) -> str:
+    """
+    Create a short-lived access token identifying this service.
+    
+    Used to authenticate calls to other services that require a
+    service role, such as bulk notification delivery.
+    
+    Args:
+        expires_minutes: Token lifetime in minutes
+        
+    Returns:
+        Encoded JWT token string
+    """
+    payload = {
+        "sub": "search_service",
+        "role": "service",
+        "type": "access",
+        "exp": datetime.utcnow() + timedelta(minutes=expires_minutes)
+    }
+    return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
@@ -0,0 +1,100 @@
+from app.core.config import settings
+from app.db.backend import get_search_backend
+from collections import Counter
+from typing import Dict, List, Optional
+import asyncio
+import contextlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TallyConsumer:
+    """
+    Buffer vote tallies and write them to the search backend in batches.
+    
+    Tallies are coalesced per content_id, keeping only the newest
+    version, so a burst of votes on one item costs a single partial
+    update. Pending tallies are flushed every TALLY_FLUSH_INTERVAL_SECONDS,
+    or sooner once TALLY_FLUSH_MAX_IDS items are waiting.
+    """
+    
+    def __init__(self):
+        self._pending: Dict[str, dict] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.counters: Counter = Counter()
+    
+    def submit(self, tallies: List[dict]):
+        """
+        Queue tallies for the next flush.
+        
+        Args:
+            tallies: Dictionaries with content_id, version and tally fields
+        """
+        for tally in tallies:
+            current = self._pending.get(tally["content_id"])
+            if current is None or tally["version"] > current["version"]:
+                self._pending[tally["content_id"]] = tally
+            else:
+                self.counters["superseded"] += 1
+        self.counters["received"] += len(tallies)
+        
+        if len(self._pending) >= settings.TALLY_FLUSH_MAX_IDS:
+            self._wakeup.set()
+    
+    async def flush(self):
+        """Write all pending tallies, one bulk request per batch."""
+        while self._pending:
+            content_ids = list(self._pending)[:settings.TALLY_FLUSH_MAX_IDS]
+            batch = [self._pending.pop(content_id) for content_id in content_ids]
+            
+            try:
+                result = await get_search_backend().apply_tallies(batch)
+                self.counters["flushed"] += len(batch)
+                self.counters["missing"] += result["missing"]
+                self.counters["failed"] += result["failed"]
+            except asyncio.CancelledError:
+                # stop() cancelled the loop mid-flush and writes the batch again
+                self._requeue(batch)
+                raise
+            except Exception as e:
+                logger.error(f"Error flushing {len(batch)} vote tallies: {e}")
+                self.counters["flush_errors"] += 1
+                self._requeue(batch)
+                return
+    
+    def _requeue(self, batch: List[dict]):
+        """Put unwritten tallies back unless a newer tally arrived meanwhile."""
+        for tally in batch:
+            current = self._pending.get(tally["content_id"])
+            if current is None or tally["version"] > current["version"]:
+                self._pending[tally["content_id"]] = tally
+    
+    async def _run(self):
+        while True:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), settings.TALLY_FLUSH_INTERVAL_SECONDS)
+            self._wakeup.clear()
+            await self.flush()
+    
+    def start(self):
+        """Start the background flush loop."""
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop and write what is still pending."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+    
+    def metrics(self) -> Dict[str, int]:
+        """Return consumer counters and the number of pending tallies."""
+        return {"pending": len(self._pending), **self.counters}
+
+
+# Global tally consumer
+tally_consumer = TallyConsumer()
@@ -0,0 +1,237 @@
+from app.core.config import settings
+from abc import ABC, abstractmethod
+from typing import Optional, List, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Vote tallies denormalized from voting_service into content documents
+TALLY_FIELDS = ["authentic_count", "false_count", "total_votes"]
+
+# Document fields returned with search hits (full text is highlighted instead)
+SEARCH_RESULT_FIELDS = [
+    "content_id",
+    "author_id",
+    "content_url",
+    "tags",
+    "status",
+    "submission_date",
+    *TALLY_FIELDS
+]
+
+
+def is_browse_query(query: Optional[str]) -> bool:
+    """
+    Check whether a query string requests a browse listing.
+    
+    Args:
+        query: Search query string
+        
+    Returns:
+        True if the query is empty or the "*" wildcard
+    """
+    return query is None or query.strip() in ("", "*")
+
+
+def build_suggest_inputs(content_data: dict) -> list:
+    """
+    Build completion suggester inputs for a content document.
+    
+    Each tag becomes an input, plus the leading words of content_text
+    trimmed to SUGGEST_MAX_INPUT_LENGTH at a word boundary.
+    
+    Args:
+        content_data: Dictionary containing content fields
+        
+    Returns:
+        List of suggestion input strings
+    """
+    inputs = [tag for tag in content_data.get("tags") or [] if tag]
+    
+    text = " ".join((content_data.get("content_text") or "").split())
+    if text:
+        max_length = settings.SUGGEST_MAX_INPUT_LENGTH
+        if len(text) > max_length:
+            text = text[:max_length].rsplit(" ", 1)[0]
+        inputs.append(text)
+        
+    return inputs
+
+
+class DocumentNotFoundError(KeyError):
+    """Raised by backends when a content document does not exist."""
+
+
+class SearchTimeoutError(TimeoutError):
+    """Raised by backends when a search misses its request deadline."""
+
+
+class SearchUnavailableError(Exception):
+    """Raised by backends that are failing fast while their cluster is unhealthy."""
+
+
+class SearchBackend(ABC):
+    """
+    Interface implemented by search backends.
+    
+    The API layer only talks to this interface, so the Elasticsearch
+    implementation and the embedded in-process engine are interchangeable
+    via the SEARCH_BACKEND setting. Every backend implements the abstract
+    methods; the saved search methods are optional and raise
+    NotImplementedError (answered with 501) where unsupported.
+    """
+    name: str = "base"
+    
+    @abstractmethod
+    async def connect(self):
+        """Open connections or load index files."""
+    
+    @abstractmethod
+    async def disconnect(self):
+        """Close connections and flush pending state."""
+    
+    @abstractmethod
+    async def index_content(self, content_id: str, content_data: dict):
+        """Index (create or replace) a content document."""
+    
+    @abstractmethod
+    async def bulk_index_content(self, documents: List[dict]) -> Dict[str, Any]:
+        """Index a batch of documents (each with content_id); returns counts and errors."""
+    
+    @abstractmethod
+    async def update_content(self, content_id: str, content_data: dict):
+        """Apply a partial update to a content document."""
+    
+    @abstractmethod
+    async def delete_content(self, content_id: str):
+        """Delete a content document."""
+    
+    @abstractmethod
+    async def search_content(
+        self,
+        query: str,
+        status: Optional[str] = None,
+        tags: Optional[list] = None,
+        page: int = 1,
+        per_page: int = 10,
+        facets: bool = False,
+        facet_interval: str = "month",
+        author_id: Optional[str] = None,
+        min_votes: Optional[int] = None,
+        sort: str = "date",
+        opaque_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Search content; returns a SearchResponse-shaped dictionary."""
+    
+    @abstractmethod
+    async def multi_search_content(
+        self,
+        searches: List[dict],
+        opaque_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Run several searches; returns a result or error per search."""
+    
+    async def cancel_search(self, opaque_id: str):
+        """Cancel in-flight searches tagged with opaque_id, if supported."""
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Return backend health counters for the metrics endpoint."""
+        return {}
+    
+    @abstractmethod
+    async def apply_tallies(self, tallies: List[dict]) -> Dict[str, int]:
+        """
+        Apply vote tallies (counts, status and version) as partial updates.
+        
+        Tallies older than the version already stored are ignored.
+        Returns counts of updated, missing and failed documents.
+        """
+    
+    @abstractmethod
+    async def suggest_content(self, prefix: str, size: int = 5) -> List[str]:
+        """Return type-ahead suggestion strings for a prefix."""
+    
+    @abstractmethod
+    async def similar_content(
+        self,
+        content_id: str,
+        size: int = 10,
+        status: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return documents most similar to content_id, best first."""
+    
+    async def save_search(self, user_id: str, name: str, search: dict) -> Dict[str, Any]:
+        """Store a saved search for alerting; returns the saved search."""
+        raise NotImplementedError
+    
+    async def list_saved_searches(self, user_id: str) -> List[Dict[str, Any]]:
+        """List a user's saved searches."""
+        raise NotImplementedError
+    
+    async def delete_saved_search(self, user_id: str, search_id: str):
+        """Delete a user's saved search."""
+        raise NotImplementedError
+    
+    async def percolate_content(self, documents: List[dict]) -> List[Dict[str, Any]]:
+        """Return saved searches matching a batch of new documents."""
+        raise NotImplementedError
+
+
+# Global search backend instance
+search_backend: Optional[SearchBackend] = None
+
+
+def create_search_backend(name: str) -> SearchBackend:
+    """
+    Create a search backend by name.
+    
+    Args:
+        name: Backend name ("elasticsearch" or "embedded")
+        
+    Returns:
+        Unconnected SearchBackend instance
+        
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name == "elasticsearch":
+        from app.db.elasticsearch import ElasticsearchBackend
+        return ElasticsearchBackend()
+    if name == "embedded":
+        from app.db.embedded import EmbeddedSearchBackend
+        return EmbeddedSearchBackend(settings.EMBEDDED_INDEX_PATH)
+    raise ValueError(f"Unknown search backend: {name}")
+
+
+def get_search_backend() -> SearchBackend:
+    """
+    Get the configured search backend instance.
+    
+    Returns:
+        Connected SearchBackend
+    """
+    if search_backend is None:
+        raise RuntimeError("Search backend not initialized")
+    return search_backend
+
+
+async def connect_search_backend():
+    """
+    Create and connect the backend selected by SEARCH_BACKEND.
+    """
+    global search_backend
+    
+    backend = create_search_backend(settings.SEARCH_BACKEND)
+    await backend.connect()
+    search_backend = backend
+    logger.info(f"Using search backend: {backend.name}")
+
+
+async def disconnect_search_backend():
+    """
+    Disconnect the active search backend.
+    """
+    global search_backend
+    if search_backend:
+        await search_backend.disconnect()
+        search_backend = None
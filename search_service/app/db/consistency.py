@@ -0,0 +1,361 @@
+"""
+Check the content index against the Content Service's MongoDB collection.
+
+The ObjectId space between the smallest and largest content id is split
+into CONSISTENCY_RANGES ranges. Every document carries a 32-bit digest
+of the fields the Content Service owns: MongoDB computes it in an
+aggregation pipeline and the index stores it as content_digest at index
+time. For each range both stores return only a document count and the
+sum of the digests, so matching ranges cost one aggregation per store
+and no documents leave either store. A mismatching range is split into
+CONSISTENCY_FANOUT sub-ranges and checked again, until a range holds at
+most CONSISTENCY_LEAF_SIZE documents; only then are per-document digests
+compared and only the missing or stale documents read from MongoDB.
+They are re-indexed with bulk upserts and documents no longer in MongoDB
+are deleted, so transfer and repair cost grow with the number of
+mismatches, not the corpus. MongoDB 7.0 or later is required for
+$toHashedIndexKey.
+
+Each run first copies _id into content_id for documents indexed without
+it, since ranges are queried on content_id. Documents indexed before
+content_digest existed do not match their range and are rewritten, so
+the first run after upgrading repairs every such document once.
+
+status and vote tallies are written by the Voting Service and are not
+compared; repairs of existing documents leave them untouched.
+
+Usage (from the search_service directory):
+    python -m app.db.consistency --dry-run
+"""
+from motor.motor_asyncio import AsyncIOMotorClient
+from elasticsearch.helpers import async_bulk
+from bson import ObjectId
+from collections import Counter
+from datetime import timezone
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import json
+import logging
+
+from app.core.config import settings
+from app.core.digests import DIGEST_FIELDS, mongo_digest_expression
+from app.db import elasticsearch as es
+from app.db.reindex import wait_for_task
+
+logger = logging.getLogger(__name__)
+
+# ObjectIds are 12 bytes, written as 24 lowercase hex characters
+ID_PATTERN = "[0-9a-f]{24}"
+
+# Keys documents indexed without content_id by their _id
+BACKFILL_CONTENT_ID_SCRIPT = "ctx._source.content_id = ctx._id"
+BACKFILL_POLL_SECONDS = 5.0
+
+
+def format_id(value: int) -> str:
+    """Format an integer position in the id space as an ObjectId string."""
+    return f"{value:024x}"
+
+
+def id_match(low: int, high: int) -> dict:
+    """MongoDB filter of an inclusive id range."""
+    return {"_id": {"$gte": ObjectId(format_id(low)), "$lte": ObjectId(format_id(high))}}
+
+
+def id_range_query(low: int, high: int) -> dict:
+    """Elasticsearch query of an inclusive id range."""
+    return {"range": {"content_id": {"gte": format_id(low), "lte": format_id(high)}}}
+
+
+def split_range(low: int, high: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split an inclusive id range into at most parts contiguous ranges.
+    
+    Args:
+        low: First id of the range
+        high: Last id of the range
+        parts: Number of sub-ranges
+        
+    Returns:
+        List of inclusive (low, high) ranges covering the input
+    """
+    size = high - low + 1
+    step = max(1, -(-size // parts))
+    return [(start, min(start + step - 1, high)) for start in range(low, high + 1, step)]
+
+
+def mongo_to_search_document(document: dict) -> dict:
+    """Convert a MongoDB content document into an index document."""
+    submission_date = document["submission_date"]
+    if submission_date.tzinfo is None:
+        submission_date = submission_date.replace(tzinfo=timezone.utc)
+    
+    return {
+        "content_id": str(document["_id"]),
+        "author_id": document["author_id"],
+        "content_url": document.get("content_url"),
+        "content_text": document.get("content_text"),
+        "tags": document.get("tags") or [],
+        "status": document.get("status", "pending"),
+        "submission_date": submission_date.isoformat(),
+        "media_attachment": document.get("media_attachment")
+    }
+
+
+class ConsistencyChecker:
+    """
+    Compare and repair the content index against MongoDB, range by range.
+    
+    Attributes:
+        report: Counters of checked ranges and repaired documents
+    """
+    
+    def __init__(self, collection, dry_run: bool = False):
+        self.collection = collection
+        self.dry_run = dry_run
+        self.report: Counter = Counter()
+    
+    async def mongo_range_digest(self, low: int, high: int) -> Tuple[int, int]:
+        """Count and sum the content digests of an id range inside MongoDB."""
+        cursor = self.collection.aggregate([
+            {"$match": id_match(low, high)},
+            {"$group": {"_id": None, "count": {"$sum": 1}, "digest": {"$sum": mongo_digest_expression()}}}
+        ])
+        async for group in cursor:
+            return group["count"], group["digest"]
+        return 0, 0
+    
+    async def index_range_digest(self, low: int, high: int) -> Tuple[int, int]:
+        """Count and sum the stored content digests of an id range inside Elasticsearch."""
+        response = await es.es_client.search(
+            index=settings.ELASTICSEARCH_INDEX,
+            query=id_range_query(low, high),
+            aggs={"digest": {"sum": {"field": "content_digest"}}},
+            size=0,
+            track_total_hits=True
+        )
+        # The sum is a double, exact while a range holds fewer than 2^21
+        # documents; a rounded sum only splits the range further
+        return response["hits"]["total"]["value"], int(response["aggregations"]["digest"]["value"])
+    
+    async def mongo_digests(self, low: int, high: int) -> AsyncIterator[Tuple[str, int]]:
+        """Yield (content_id, digest) pairs of an id range computed by MongoDB, by id."""
+        cursor = self.collection.aggregate([
+            {"$match": id_match(low, high)},
+            {"$sort": {"_id": 1}},
+            {"$project": {"digest": mongo_digest_expression()}}
+        ], batchSize=settings.CONSISTENCY_PAGE_SIZE)
+        async for document in cursor:
+            yield str(document["_id"]), document["digest"]
+    
+    async def index_digests(self, low: int, high: int) -> AsyncIterator[Tuple[str, Optional[int]]]:
+        """Yield (content_id, stored digest) pairs of an id range from the index, by id."""
+        search_after = None
+        while True:
+            response = await es.es_client.search(
+                index=settings.ELASTICSEARCH_INDEX,
+                query=id_range_query(low, high),
+                sort=[{"content_id": "asc"}],
+                source=["content_digest"],
+                size=settings.CONSISTENCY_PAGE_SIZE,
+                search_after=search_after,
+                track_total_hits=False
+            )
+            hits = response["hits"]["hits"]
+            for hit in hits:
+                yield hit["_id"], hit["_source"].get("content_digest")
+            
+            if len(hits) < settings.CONSISTENCY_PAGE_SIZE:
+                return
+            search_after = hits[-1]["sort"]
+    
+    async def backfill_content_ids(self):
+        """
+        Copy _id into the source of documents indexed without content_id.
+        
+        Id ranges are queried on content_id, so such documents would look
+        missing and, once deleted from MongoDB, never be found as extra.
+        """
+        query = {"bool": {"must_not": {"exists": {"field": "content_id"}}}}
+        if self.dry_run:
+            response = await es.es_client.count(index=settings.ELASTICSEARCH_INDEX, query=query)
+            self.report["unkeyed"] += response["count"]
+            return
+        
+        task = await es.es_client.update_by_query(
+            index=settings.ELASTICSEARCH_INDEX,
+            query=query,
+            script={"source": BACKFILL_CONTENT_ID_SCRIPT, "lang": "painless"},
+            conflicts="proceed",
+            refresh=True,
+            wait_for_completion=False
+        )
+        response = await wait_for_task(task["task"], BACKFILL_POLL_SECONDS)
+        self.report["backfilled"] += response["updated"]
+    
+    async def id_bounds(self) -> Optional[Tuple[int, int]]:
+        """
+        Find the smallest and largest content id in either store.
+        
+        Returns:
+            Inclusive (low, high) id range, or None if both stores are empty
+        """
+        ids = []
+        for direction in (1, -1):
+            async for document in self.collection.find({}, projection={"_id": True}).sort("_id", direction).limit(1):
+                ids.append(int(str(document["_id"]), 16))
+        
+        for order in ("asc", "desc"):
+            response = await es.es_client.search(
+                index=settings.ELASTICSEARCH_INDEX,
+                query={"regexp": {"content_id": ID_PATTERN}},
+                sort=[{"content_id": order}],
+                source=False,
+                size=1
+            )
+            for hit in response["hits"]["hits"]:
+                ids.append(int(hit["sort"][0], 16))
+        
+        return (min(ids), max(ids)) if ids else None
+    
+    async def check_range(self, low: int, high: int) -> List[Tuple[int, int]]:
+        """
+        Compare one id range, diffing or splitting it on mismatch.
+        
+        Args:
+            low: First id of the range
+            high: Last id of the range
+            
+        Returns:
+            Sub-ranges still to check
+        """
+        self.report["ranges_checked"] += 1
+        (mongo_count, mongo_digest), (index_count, index_digest) = await asyncio.gather(
+            self.mongo_range_digest(low, high),
+            self.index_range_digest(low, high)
+        )
+        if mongo_count == index_count and mongo_digest == index_digest:
+            return []
+        
+        self.report["ranges_mismatched"] += 1
+        if max(mongo_count, index_count) <= settings.CONSISTENCY_LEAF_SIZE or low == high:
+            await self.repair_range(low, high)
+            return []
+        
+        return split_range(low, high, settings.CONSISTENCY_FANOUT)
+    
+    async def repair_range(self, low: int, high: int):
+        """
+        Diff a small id range document by document and repair the index.
+        
+        Args:
+            low: First id of the range
+            high: Last id of the range
+        """
+        mongo = {content_id: digest async for content_id, digest in self.mongo_digests(low, high)}
+        indexed = {content_id: digest async for content_id, digest in self.index_digests(low, high)}
+        
+        missing = [content_id for content_id in mongo if content_id not in indexed]
+        stale = [content_id for content_id in mongo if content_id in indexed and indexed[content_id] != mongo[content_id]]
+        extra = [content_id for content_id in indexed if content_id not in mongo]
+        
+        self.report["missing"] += len(missing)
+        self.report["stale"] += len(stale)
+        self.report["extra"] += len(extra)
+        for label, ids in (("missing", missing), ("stale", stale), ("extra", extra)):
+            if ids:
+                logger.info(f"{len(ids)} {label} in {format_id(low)}..{format_id(high)}: {ids[:5]}")
+        
+        if self.dry_run:
+            return
+        
+        if missing or stale:
+            cursor = self.collection.find(
+                {"_id": {"$in": [ObjectId(content_id) for content_id in missing + stale]}},
+                projection={field: True for field in (*DIGEST_FIELDS, "status")}
+            )
+            await self.upsert_documents([mongo_to_search_document(document) async for document in cursor])
+        for content_id in extra:
+            await es.delete_content(content_id)
+            self.report["deleted"] += 1
+    
+    async def upsert_documents(self, documents: List[dict]):
+        """
+        Write MongoDB documents into the index with one bulk request.
+        
+        Existing documents are partially updated so the status and vote
+        tallies set by the Voting Service survive; missing ones are
+        created from the full MongoDB document.
+        
+        Args:
+            documents: Index documents built from MongoDB
+        """
+        actions = []
+        for document in es.prepare_documents(documents):
+            action = {
+                "_op_type": "update",
+                "_index": settings.ELASTICSEARCH_INDEX,
+                "_id": document["content_id"],
+                "doc": {key: value for key, value in document.items() if key != "status"},
+                "upsert": document
+            }
+            routing = es.document_routing(document)
+            if routing is not None:
+                action["_routing"] = routing
+            actions.append(action)
+        
+        repaired, errors = await async_bulk(
+            es.es_client,
+            actions,
+            chunk_size=settings.BULK_INDEX_CHUNK_SIZE,
+            raise_on_error=False
+        )
+        self.report["repaired"] += repaired
+        self.report["repair_errors"] += len(errors)
+        for error in errors[:5]:
+            logger.warning(f"Repair failed for {error['update']['_id']}: {error['update'].get('error')}")
+    
+    async def run(self, ranges: int) -> Dict[str, int]:
+        """
+        Check the whole id space.
+        
+        Args:
+            ranges: Number of initial id ranges
+            
+        Returns:
+            Counters of backfilled ids, checked ranges and missing,
+            stale, extra and repaired documents
+        """
+        await self.backfill_content_ids()
+        bounds = await self.id_bounds()
+        pending = split_range(*bounds, ranges) if bounds else []
+        
+        while pending:
+            low, high = pending.pop()
+            pending.extend(await self.check_range(low, high))
+        
+        logger.info(f"Consistency check finished: {dict(self.report)}")
+        return dict(self.report)
+
+
+async def main(ranges: int, dry_run: bool):
+    await es.connect_elasticsearch()
+    mongo_client = AsyncIOMotorClient(settings.CONTENT_MONGODB_URL)
+    try:
+        collection = mongo_client[settings.CONTENT_MONGODB_DB_NAME][settings.CONTENT_COLLECTION]
+        report = await ConsistencyChecker(collection, dry_run).run(ranges)
+        print(json.dumps(report, indent=2))
+    finally:
+        mongo_client.close()
+        await es.disconnect_elasticsearch()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ranges", type=int, default=settings.CONSISTENCY_RANGES, help="Initial id ranges")
+    parser.add_argument("--dry-run", action="store_true", help="Report mismatches without repairing them")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(main(args.ranges, args.dry_run))
@@ -1,13 +1,108 @@
-from elasticsearch import AsyncElasticsearch
+from elasticsearch import AsyncElasticsearch, ConnectionTimeout, NotFoundError
+from elasticsearch.helpers import async_bulk
 from app.core.config import settings
+from app.core.digests import DIGEST_FIELDS, content_digest
+from app.core.embeddings import embed_documents, embed_texts, embedding_text
+from app.db.resilience import create_elasticsearch_client
+from app.db.backend import (
+    SearchBackend,
+    DocumentNotFoundError,
+    SearchTimeoutError,
+    SEARCH_RESULT_FIELDS,
+    TALLY_FIELDS,
+    build_suggest_inputs,
+    is_browse_query
+)
+from datetime import datetime, timezone
 from typing import Optional
 import logging
+import uuid
 
 logger = logging.getLogger(__name__)
 
 # Global Elasticsearch client
 es_client: Optional[AsyncElasticsearch] = None
 
+# Whether the content index requires author_id routing (set on connect)
+route_by_author = False
+
+# Searches of this worker currently waiting on Elasticsearch
+in_flight_searches = 0
+
+# Field mappings for content_index documents
+CONTENT_INDEX_PROPERTIES = {
+    "content_id": {"type": "keyword"},
+    "author_id": {"type": "keyword"},
+    "content_url": {"type": "text"},
+    "content_text": {
+        "type": "text",
+        "analyzer": "standard",
+        "fields": {
+            "keyword": {"type": "keyword"}
+        }
+    },
+    "tags": {"type": "keyword"},
+    "status": {"type": "keyword"},
+    "submission_date": {"type": "date"},
+    "media_attachment": {"type": "text"},
+    # Digest of the Content Service fields, summed per id range by the
+    # consistency checker (app.db.consistency)
+    "content_digest": {"type": "long"},
+    # Completion suggester field for type-ahead lookups, populated
+    # from tags and the leading words of content_text at index time
+    "suggest": {
+        "type": "completion",
+        "analyzer": "simple",
+        "preserve_separators": True,
+        "max_input_length": settings.SUGGEST_MAX_INPUT_LENGTH
+    },
+    # Hashed n-gram embedding of content_text and tags for kNN lookups
+    "embedding": {
+        "type": "dense_vector",
+        "dims": settings.EMBEDDING_DIMS,
+        "index": True,
+        "similarity": "cosine"
+    },
+    # Vote tallies kept in sync by the tally consumer
+    "authentic_count": {"type": "integer"},
+    "false_count": {"type": "integer"},
+    "total_votes": {"type": "integer"},
+    "tally_version": {"type": "long"}
+}
+
+# Applies a tally unless a newer one is already stored, so batches
+# arriving out of order never move counts backwards
+APPLY_TALLY_SCRIPT = """
+if (ctx._source.tally_version != null && ctx._source.tally_version >= params.version) {
+    ctx.op = 'noop';
+} else {
+    ctx._source.putAll(params.tally);
+    ctx._source.tally_version = params.version;
+}
+"""
+
+
+# Index-time sort matching the default search sort (newest first)
+SUBMISSION_DATE_INDEX_SORT = {
+    "sort.field": "submission_date",
+    "sort.order": "desc"
+}
+
+# Content fields that saved search (percolator) queries can reference
+PERCOLATE_FIELDS = ["content_text", "content_url", "tags", "status"]
+
+# Field mappings for the saved searches index; content fields must be
+# mapped exactly as in content_index for percolation to match
+SAVED_SEARCH_PROPERTIES = {
+    "query": {"type": "percolator"},
+    "search_id": {"type": "keyword"},
+    "user_id": {"type": "keyword"},
+    "name": {"type": "keyword"},
+    "created_at": {"type": "date"},
+    "search": {"type": "object", "enabled": False},
+    **{field: CONTENT_INDEX_PROPERTIES[field] for field in PERCOLATE_FIELDS}
+}
+
 
 async def get_elasticsearch() -> AsyncElasticsearch:
     """
@@ -26,10 +121,10 @@ async def connect_elasticsearch():
     """
     Initialize connection to Elasticsearch and create index if it doesn't exist.
     """
-    global es_client
+    global es_client, route_by_author
     
     try:
-        es_client = AsyncElasticsearch([settings.ELASTICSEARCH_URL])
+        es_client = create_elasticsearch_client()
         
         # Test connection
         if await es_client.ping():
@@ -44,7 +139,21 @@ async def connect_elasticsearch():
             await create_content_index()
             logger.info(f"Created index: {index_name}")
         else:
+            await add_missing_fields(index_name)
             logger.info(f"Index already exists: {index_name}")
+        
+        # Routing is a property of the existing index, not of the setting
+        route_by_author = await index_requires_routing(index_name)
+        if settings.ROUTE_BY_AUTHOR and not route_by_author:
+            logger.warning(
+                f"ROUTE_BY_AUTHOR is set but {index_name} is not routed by author; "
+                f"run python -m app.db.reindex --route-by-author to migrate it"
+            )
+        
+        # Saved searches live in their own percolator index
+        if not await es_client.indices.exists(index=settings.SAVED_SEARCH_INDEX):
+            await create_saved_search_index()
+            logger.info(f"Created index: {settings.SAVED_SEARCH_INDEX}")
             
     except Exception as e:
         logger.error(f"Error connecting to Elasticsearch: {e}")
@@ -61,33 +170,39 @@ async def disconnect_elasticsearch():
         logger.info("Elasticsearch connection closed")
 
 
-async def create_content_index():
+async def create_content_index(
+    index_name: Optional[str] = None,
+    route_by_author: Optional[bool] = None,
+    sort_by_date: Optional[bool] = None
+):
     """
     Create the content_index with proper mapping for full-text search.
+    
+    When routed by author, every document must be written with its
+    author_id as routing value, so all of an author's documents share
+    one shard and author-scoped searches only query that shard.
+    
+    When sorted by date, segments are stored newest first, so searches
+    sorted by submission_date can stop collecting in each segment once
+    the requested page (and any total hit threshold) is filled.
+    
+    Args:
+        index_name: Index to create (defaults to ELASTICSEARCH_INDEX)
+        route_by_author: Require author_id routing (defaults to ROUTE_BY_AUTHOR)
+        sort_by_date: Sort segments by submission_date (defaults to INDEX_SORT_BY_DATE)
     """
-    index_name = settings.ELASTICSEARCH_INDEX
+    index_name = index_name or settings.ELASTICSEARCH_INDEX
+    if route_by_author is None:
+        route_by_author = settings.ROUTE_BY_AUTHOR
+    if sort_by_date is None:
+        sort_by_date = settings.INDEX_SORT_BY_DATE
     
     mapping = {
         "mappings": {
-            "properties": {
-                "content_id": {"type": "keyword"},
-                "author_id": {"type": "keyword"},
-                "content_url": {"type": "text"},
-                "content_text": {
-                    "type": "text",
-                    "analyzer": "standard",
-                    "fields": {
-                        "keyword": {"type": "keyword"}
-                    }
-                },
-                "tags": {"type": "keyword"},
-                "status": {"type": "keyword"},
-                "submission_date": {"type": "date"},
-                "media_attachment": {"type": "text"}
-            }
+            "properties": CONTENT_INDEX_PROPERTIES
         },
         "settings": {
-            "number_of_shards": 1,
+            "number_of_shards": settings.ELASTICSEARCH_NUMBER_OF_SHARDS,
             "number_of_replicas": 1,
             "analysis": {
                 "analyzer": {
@@ -100,9 +215,109 @@ async def create_content_index():
         }
     }
     
+    if route_by_author:
+        mapping["mappings"]["_routing"] = {"required": True}
+    if sort_by_date:
+        mapping["settings"].update(SUBMISSION_DATE_INDEX_SORT)
+    
     await es_client.indices.create(index=index_name, body=mapping)
 
 
+async def index_requires_routing(index_name: str) -> bool:
+    """
+    Check whether an index (or the index behind an alias) requires routing.
+    
+    Args:
+        index_name: Index or alias name
+        
+    Returns:
+        True if documents must be written with a routing value
+    """
+    response = await es_client.indices.get_mapping(index=index_name)
+    return any(
+        index["mappings"].get("_routing", {}).get("required", False)
+        for index in response.values()
+    )
+
+
+async def add_missing_fields(index_name: str):
+    """
+    Add the CONTENT_INDEX_PROPERTIES fields an existing index lacks.
+    
+    Fields the index already maps are left alone: changing an existing
+    field (e.g. EMBEDDING_DIMS or the suggest analyzer) would be rejected
+    as a mapping conflict and needs a new index built with
+    python -m app.db.reindex instead.
+    
+    Args:
+        index_name: Index or alias name
+    """
+    response = await es_client.indices.get_mapping(index=index_name)
+    for name, index in response.items():
+        existing = index["mappings"].get("properties", {})
+        missing = {field: mapping for field, mapping in CONTENT_INDEX_PROPERTIES.items() if field not in existing}
+        if missing:
+            await es_client.indices.put_mapping(index=name, properties=missing)
+            logger.info(f"Added fields to {name}: {', '.join(sorted(missing))}")
+
+
+def document_routing(document: dict) -> Optional[str]:
+    """Return the routing value for a content document, if routing is on."""
+    return document.get("author_id") if route_by_author else None
+
+
+async def create_saved_search_index():
+    """
+    Create the saved searches index holding percolator queries.
+    """
+    await es_client.indices.create(
+        index=settings.SAVED_SEARCH_INDEX,
+        mappings={"dynamic": False, "properties": SAVED_SEARCH_PROPERTIES},
+        settings={
+            "number_of_shards": 1,
+            "number_of_replicas": 1,
+            "analysis": {
+                "analyzer": {
+                    "standard": {
+                        "type": "standard",
+                        "stopwords": "_english_"
+                    }
+                }
+            }
+        }
+    )
+
+
+def prepare_documents(documents: list) -> list:
+    """
+    Add derived search fields to a batch of content documents.
+    
+    Suggestion inputs and embeddings are computed here, with all
+    embeddings of the batch vectorized in a single pass. Documents
+    carrying content_id and every Content Service field also get their
+    content_digest.
+    
+    Args:
+        documents: Content dictionaries
+        
+    Returns:
+        New dictionaries including suggest, embedding and content_digest
+        fields
+    """
+    prepared = []
+    for document, embedding in zip(documents, embed_documents(documents)):
+        document = {
+            **document,
+            "suggest": {"input": build_suggest_inputs(document)}
+        }
+        if embedding is not None:
+            document["embedding"] = embedding
+        if "content_id" in document and all(field in document for field in DIGEST_FIELDS):
+            document["content_digest"] = content_digest(document["content_id"], document)
+        prepared.append(document)
+    return prepared
+
+
 async def index_content(content_id: str, content_data: dict):
     """
     Index a content document in Elasticsearch.
@@ -112,12 +327,15 @@ async def index_content(content_id: str, content_data: dict):
         content_data: Dictionary containing content fields
     """
     index_name = settings.ELASTICSEARCH_INDEX
+    # content_id stays in the source so id-range queries can use it
+    document = prepare_documents([{"content_id": content_id, **content_data}])[0]
     
     try:
         await es_client.index(
             index=index_name,
             id=content_id,
-            document=content_data
+            document=document,
+            routing=document_routing(content_data)
         )
         logger.info(f"Indexed content: {content_id}")
     except Exception as e:
@@ -125,6 +343,51 @@ async def index_content(content_id: str, content_data: dict):
         raise
 
 
+async def bulk_index_content(documents: list) -> dict:
+    """
+    Index a batch of content documents with one bulk request.
+    
+    Args:
+        documents: Content dictionaries, each including content_id
+        
+    Returns:
+        Dictionary with the indexed count and per-document errors
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    
+    actions = []
+    for source in prepare_documents(documents):
+        # content_id stays in the source so id-range queries can use it
+        action = {"_index": index_name, "_id": source["content_id"], "_source": source}
+        routing = document_routing(source)
+        if routing is not None:
+            action["_routing"] = routing
+        actions.append(action)
+    
+    try:
+        indexed, errors = await async_bulk(
+            es_client,
+            actions,
+            chunk_size=settings.BULK_INDEX_CHUNK_SIZE,
+            raise_on_error=False
+        )
+        logger.info(f"Bulk indexed {indexed} of {len(actions)} documents")
+        
+        return {
+            "indexed": indexed,
+            "errors": [
+                {
+                    "content_id": error["index"]["_id"],
+                    "error": str(error["index"].get("error"))
+                }
+                for error in errors
+            ]
+        }
+    except Exception as e:
+        logger.error(f"Error bulk indexing content: {e}")
+        raise
+
+
 async def update_content(content_id: str, content_data: dict):
     """
     Update a content document in Elasticsearch.
@@ -134,12 +397,20 @@ async def update_content(content_id: str, content_data: dict):
         content_data: Dictionary containing updated fields
     """
     index_name = settings.ELASTICSEARCH_INDEX
+    document = {"content_id": content_id, **content_data}
+    if "content_text" in content_data or "tags" in content_data:
+        document = prepare_documents([document])[0]
+    if "content_digest" not in document and any(field in content_data for field in DIGEST_FIELDS):
+        # A partial update cannot recompute the digest; clearing it makes
+        # the consistency checker rewrite the document from MongoDB
+        document["content_digest"] = None
     
     try:
         await es_client.update(
             index=index_name,
             id=content_id,
-            doc=content_data
+            doc=document,
+            routing=document_routing(content_data)
         )
         logger.info(f"Updated content: {content_id}")
     except Exception as e:
@@ -151,107 +422,892 @@ async def delete_content(content_id: str):
     """
     Delete a content document from Elasticsearch.
     
+    On an author-routed index the routing value is not known from the id
+    alone, so the document is deleted by an ids query across all shards.
+    
     Args:
         content_id: Unique identifier for the content
     """
     index_name = settings.ELASTICSEARCH_INDEX
     
     try:
-        await es_client.delete(
-            index=index_name,
-            id=content_id
-        )
+        if route_by_author:
+            await es_client.delete_by_query(
+                index=index_name,
+                query={"ids": {"values": [content_id]}}
+            )
+        else:
+            await es_client.delete(
+                index=index_name,
+                id=content_id
+            )
         logger.info(f"Deleted content: {content_id}")
     except Exception as e:
         logger.error(f"Error deleting content {content_id}: {e}")
         raise
 
 
+async def apply_tallies(tallies: list) -> dict:
+    """
+    Write vote tallies into content documents with one bulk request.
+    
+    Each tally becomes a scripted partial update that only applies if
+    its version is newer than the stored one. Documents not indexed
+    (yet) are counted as missing rather than failed.
+    
+    Args:
+        tallies: Dictionaries with content_id, version and tally fields
+        
+    Returns:
+        Dictionary with updated, missing and failed counts
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    ids = [tally["content_id"] for tally in tallies]
+    
+    # Updates on an author-routed index need each document's routing
+    routings = {}
+    if route_by_author:
+        response = await es_client.search(
+            index=index_name,
+            query={"ids": {"values": ids}},
+            size=len(ids),
+            source=False
+        )
+        routings = {hit["_id"]: hit.get("_routing") for hit in response["hits"]["hits"]}
+    
+    actions = []
+    for tally in tallies:
+        action = {
+            "_op_type": "update",
+            "_index": index_name,
+            "_id": tally["content_id"],
+            "retry_on_conflict": 3,
+            "script": {
+                "source": APPLY_TALLY_SCRIPT,
+                "lang": "painless",
+                "params": {
+                    "version": tally["version"],
+                    "tally": {
+                        field: tally[field] for field in (*TALLY_FIELDS, "status")
+                    }
+                }
+            }
+        }
+        if route_by_author:
+            if tally["content_id"] not in routings:
+                continue
+            action["_routing"] = routings[tally["content_id"]]
+        actions.append(action)
+    
+    try:
+        updated, errors = await async_bulk(
+            es_client,
+            actions,
+            chunk_size=settings.BULK_INDEX_CHUNK_SIZE,
+            raise_on_error=False
+        )
+        
+        missing = len(tallies) - len(actions)
+        failed = 0
+        for error in errors:
+            if error["update"].get("status") == 404:
+                missing += 1
+            else:
+                failed += 1
+                logger.warning(f"Tally update failed for {error['update']['_id']}: {error['update'].get('error')}")
+        
+        logger.info(f"Applied {updated} vote tallies ({missing} missing, {failed} failed)")
+        return {"updated": updated, "missing": missing, "failed": failed}
+        
+    except Exception as e:
+        logger.error(f"Error applying vote tallies: {e}")
+        raise
+
+
+def build_facet_aggregations(facet_interval: str = "month") -> dict:
+    """
+    Build the facet aggregations attached to a search request.
+    
+    Args:
+        facet_interval: Calendar interval for the submission_date histogram
+        
+    Returns:
+        Dictionary of Elasticsearch aggregations
+    """
+    return {
+        "tags": {
+            "terms": {"field": "tags", "size": settings.FACET_TAGS_SIZE}
+        },
+        "status": {
+            "terms": {"field": "status", "size": 10}
+        },
+        "submission_date": {
+            "date_histogram": {
+                "field": "submission_date",
+                "calendar_interval": facet_interval,
+                "min_doc_count": 1
+            }
+        }
+    }
+
+
+def parse_facet_aggregations(aggregations: dict) -> dict:
+    """
+    Convert Elasticsearch aggregation buckets into facet counts.
+    
+    Args:
+        aggregations: Aggregations section of a search response
+        
+    Returns:
+        Dictionary mapping facet name to a list of key/count buckets
+    """
+    return {
+        "tags": [
+            {"key": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations["tags"]["buckets"]
+        ],
+        "status": [
+            {"key": bucket["key"], "count": bucket["doc_count"]}
+            for bucket in aggregations["status"]["buckets"]
+        ],
+        "submission_date": [
+            {"key": bucket["key_as_string"], "count": bucket["doc_count"]}
+            for bucket in aggregations["submission_date"]["buckets"]
+        ]
+    }
+
+
+def build_search_query(
+    query: Optional[str],
+    status: Optional[str] = None,
+    tags: Optional[list] = None,
+    author_id: Optional[str] = None,
+    fuzzy: bool = True,
+    min_votes: Optional[int] = None
+) -> dict:
+    """
+    Build the Elasticsearch query for a search request.
+    
+    Browse queries (empty or "*") skip full-text matching entirely and
+    run as a filter-only query, so no analysis, fuzzy expansion or
+    scoring is done for dashboard listings.
+    
+    Args:
+        query: Search query string
+        status: Filter by verification status
+        tags: List of tags to filter by
+        author_id: Restrict to one author's content
+        fuzzy: Expand terms with fuzzy matching (off in degraded mode)
+        min_votes: Minimum total_votes
+        
+    Returns:
+        Elasticsearch query dictionary
+    """
+    # Filter by status
+    filter_clauses = []
+    if status:
+        filter_clauses.append({"term": {"status": status}})
+    
+    # Filter by tags
+    if tags:
+        filter_clauses.append({"terms": {"tags": tags}})
+    
+    # Filter by author
+    if author_id:
+        filter_clauses.append({"term": {"author_id": author_id}})
+    
+    # Filter by vote count
+    if min_votes:
+        filter_clauses.append({"range": {"total_votes": {"gte": min_votes}}})
+    
+    if is_browse_query(query):
+        if not filter_clauses:
+            return {"match_all": {}}
+        return {"bool": {"filter": filter_clauses}}
+    
+    # Full-text search on content_text and content_url
+    multi_match = {
+        "query": query,
+        "fields": ["content_text^2", "content_url", "tags"],
+        "type": "best_fields"
+    }
+    if fuzzy:
+        multi_match["fuzziness"] = "AUTO"
+    
+    return {
+        "bool": {
+            "must": [{"multi_match": multi_match}],
+            "filter": filter_clauses
+        }
+    }
+
+
+def build_highlight() -> dict:
+    """
+    Build the highlight section of a search request.
+    
+    Returns matched content_text fragments, or the leading fragment of
+    the text when nothing matched (e.g. browse queries), so results can
+    show a snippet without shipping the full document.
+    
+    Returns:
+        Elasticsearch highlight dictionary
+    """
+    return {
+        "encoder": "html",
+        "pre_tags": ["<mark>"],
+        "post_tags": ["</mark>"],
+        "fields": {
+            "content_text": {
+                "fragment_size": settings.HIGHLIGHT_FRAGMENT_SIZE,
+                "number_of_fragments": settings.HIGHLIGHT_NUMBER_OF_FRAGMENTS,
+                "no_match_size": settings.HIGHLIGHT_FRAGMENT_SIZE
+            },
+            "tags": {"number_of_fragments": 0}
+        }
+    }
+
+
+def build_search_body(
+    query: str,
+    status: Optional[str] = None,
+    tags: Optional[list] = None,
+    page: int = 1,
+    per_page: int = 10,
+    facets: bool = False,
+    facet_interval: str = "month",
+    author_id: Optional[str] = None,
+    fuzzy: bool = True,
+    min_votes: Optional[int] = None,
+    sort: str = "date"
+) -> dict:
+    """
+    Build the Elasticsearch request body for a content search.
+    
+    Args:
+        query: Search query string
+        status: Filter by verification status
+        tags: List of tags to filter by
+        page: Page number (1-indexed)
+        per_page: Results per page
+        facets: Whether to attach tag, status and date facet counts
+        facet_interval: Calendar interval for the submission_date histogram
+        author_id: Restrict to one author's content
+        fuzzy: Expand terms with fuzzy matching (off in degraded mode)
+        min_votes: Minimum total_votes
+        sort: "date" for newest first, "votes" for most voted first
+        
+    Returns:
+        Search request body dictionary
+    """
+    order = [{"submission_date": {"order": "desc"}}]
+    if sort == "votes":
+        order.insert(0, {"total_votes": {"order": "desc", "missing": 0}})
+    
+    body = {
+        "query": build_search_query(query, status, tags, author_id, fuzzy, min_votes),
+        "from": (page - 1) * per_page,
+        "size": per_page,
+        # Shards still running at the deadline return what they have
+        "timeout": f"{settings.SEARCH_TIMEOUT_MS}ms",
+        "sort": order,
+        # Only ship display fields; text is returned as highlight snippets
+        "_source": {"includes": SEARCH_RESULT_FIELDS},
+        "highlight": build_highlight()
+    }
+    
+    # Browse listings only need an approximate total for paging
+    if is_browse_query(query):
+        body["track_total_hits"] = settings.BROWSE_TRACK_TOTAL_HITS
+    
+    # Facet aggregations are computed in the same request as the hits
+    if facets:
+        body["aggs"] = build_facet_aggregations(facet_interval)
+    
+    return body
+
+
+def parse_search_response(response: dict, page: int, per_page: int) -> dict:
+    """
+    Convert an Elasticsearch search response into a SearchResponse dict.
+    
+    Args:
+        response: Raw Elasticsearch search response
+        page: Page number (1-indexed)
+        per_page: Results per page
+        
+    Returns:
+        Dictionary with search results and metadata
+    """
+    hits = response["hits"]
+    results = []
+    
+    for hit in hits["hits"]:
+        result = hit["_source"]
+        result["_id"] = hit["_id"]
+        # Documents bulk-indexed by older versions omit content_id from the source
+        result.setdefault("content_id", hit["_id"])
+        result["_score"] = hit["_score"]
+        result["highlights"] = hit.get("highlight", {})
+        results.append(result)
+    
+    aggregations = response.get("aggregations")
+    timed_out = response.get("timed_out", False)
+    shards_failed = response.get("_shards", {}).get("failed", 0)
+    # Browse totals are capped by track_total_hits ("gte" past the cap)
+    total = hits["total"]["value"]
+    
+    return {
+        "results": results,
+        "total": total,
+        "total_is_lower_bound": hits["total"].get("relation") == "gte",
+        "page": page,
+        "per_page": per_page,
+        "pages": (total + per_page - 1) // per_page,
+        "facets": parse_facet_aggregations(aggregations) if aggregations else None,
+        "took": response.get("took"),
+        "timed_out": timed_out,
+        "partial": timed_out or shards_failed > 0
+    }
+
+
+def is_degraded() -> bool:
+    """Whether this worker is busy enough to drop fuzzy matching."""
+    return in_flight_searches >= settings.SEARCH_DEGRADED_IN_FLIGHT
+
+
+def search_client(opaque_id: Optional[str] = None) -> AsyncElasticsearch:
+    """
+    Return the client configured for deadline-bound search requests.
+    
+    Args:
+        opaque_id: Value sent as X-Opaque-Id so the search task can be
+            found and cancelled later
+        
+    Returns:
+        AsyncElasticsearch client with the search request timeout
+    """
+    return es_client.options(
+        request_timeout=settings.SEARCH_REQUEST_TIMEOUT_SECONDS,
+        opaque_id=opaque_id
+    )
+
+
+async def cancel_search(opaque_id: str):
+    """
+    Cancel in-flight Elasticsearch search tasks tagged with an opaque id.
+    
+    Used when the HTTP client disconnects or the request deadline passes,
+    so the cluster stops working on results nobody will read. Only parent
+    tasks are cancelled, which cancels their shard-level children too; a
+    task that finished or fails to cancel does not stop the others.
+    
+    Args:
+        opaque_id: X-Opaque-Id the searches were sent with
+    """
+    try:
+        response = await es_client.tasks.list(actions="*search*", detailed=True)
+    except Exception as e:
+        logger.warning(f"Error listing searches {opaque_id}: {e}")
+        return
+    
+    for node in response["nodes"].values():
+        for task_id, task in node["tasks"].items():
+            if task.get("parent_task_id") or task.get("headers", {}).get("X-Opaque-Id") != opaque_id:
+                continue
+            try:
+                await es_client.tasks.cancel(task_id=task_id)
+                logger.info(f"Cancelled search task {task_id}")
+            except Exception as e:
+                logger.warning(f"Error cancelling search task {task_id} of {opaque_id}: {e}")
+
+
 async def search_content(
     query: str,
     status: Optional[str] = None,
     tags: Optional[list] = None,
     page: int = 1,
-    per_page: int = 10
+    per_page: int = 10,
+    facets: bool = False,
+    facet_interval: str = "month",
+    author_id: Optional[str] = None,
+    min_votes: Optional[int] = None,
+    sort: str = "date",
+    opaque_id: Optional[str] = None
 ):
     """
     Search for content in Elasticsearch.
     
+    Author-scoped searches on an author-routed index are sent with the
+    author_id as routing value, so only the author's shard is searched.
+    
+    Each search runs under a shard-level timeout and a client-side
+    deadline; timed out shards yield partial results, which are flagged
+    in the response. While too many searches are in flight, full-text
+    queries skip fuzzy expansion and the response is flagged degraded.
+    
     Args:
         query: Search query string
         status: Filter by verification status
         tags: List of tags to filter by
         page: Page number (1-indexed)
         per_page: Results per page
+        facets: Whether to attach tag, status and date facet counts
+        facet_interval: Calendar interval for the submission_date histogram
+        author_id: Restrict to one author's content
+        min_votes: Minimum total_votes
+        sort: "date" for newest first, "votes" for most voted first
+        opaque_id: X-Opaque-Id used to cancel the search task
         
     Returns:
         Dictionary with search results and metadata
+        
+    Raises:
+        SearchTimeoutError: If Elasticsearch misses the request deadline
     """
+    global in_flight_searches
     index_name = settings.ELASTICSEARCH_INDEX
+    degraded = is_degraded()
     
-    # Calculate pagination
-    from_index = (page - 1) * per_page
+    body = build_search_body(
+        query,
+        status=status,
+        tags=tags,
+        page=page,
+        per_page=per_page,
+        facets=facets,
+        facet_interval=facet_interval,
+        author_id=author_id,
+        fuzzy=not degraded,
+        min_votes=min_votes,
+        sort=sort
+    )
     
-    # Build query
-    must_clauses = []
+    in_flight_searches += 1
+    try:
+        response = await search_client(opaque_id).search(
+            index=index_name,
+            routing=document_routing({"author_id": author_id}),
+            allow_partial_search_results=settings.ALLOW_PARTIAL_SEARCH_RESULTS,
+            **body
+        )
+        return {
+            **parse_search_response(response, page, per_page),
+            "degraded": degraded
+        }
+        
+    except ConnectionTimeout:
+        logger.warning(f"Search timed out after {settings.SEARCH_REQUEST_TIMEOUT_SECONDS}s")
+        if opaque_id:
+            await cancel_search(opaque_id)
+        raise SearchTimeoutError("Search request deadline exceeded")
+    except Exception as e:
+        logger.error(f"Error searching content: {e}")
+        raise
+    finally:
+        in_flight_searches -= 1
+
+
+async def multi_search_content(searches: list, opaque_id: Optional[str] = None):
+    """
+    Run several content searches in a single _msearch round trip.
     
-    # Full-text search on content_text and content_url
-    if query:
-        must_clauses.append({
-            "multi_match": {
-                "query": query,
-                "fields": ["content_text^2", "content_url", "tags"],
-                "type": "best_fields",
-                "fuzziness": "AUTO"
-            }
-        })
+    Each search is built exactly like search_content, including its
+    deadline and degraded mode. A failing search does not fail the
+    batch; its error is reported in place instead.
     
-    # Filter by status
-    filter_clauses = []
-    if status:
-        filter_clauses.append({"term": {"status": status}})
+    Args:
+        searches: List of dictionaries with search_content arguments
+        opaque_id: X-Opaque-Id used to cancel the search tasks
+        
+    Returns:
+        List of dictionaries with either a result or an error per search
+        
+    Raises:
+        SearchTimeoutError: If Elasticsearch misses the request deadline
+    """
+    global in_flight_searches
+    index_name = settings.ELASTICSEARCH_INDEX
+    degraded = is_degraded()
     
-    # Filter by tags
-    if tags:
-        filter_clauses.append({"terms": {"tags": tags}})
+    # _msearch takes alternating header and body lines
+    lines = []
+    for search in searches:
+        header = {"allow_partial_search_results": settings.ALLOW_PARTIAL_SEARCH_RESULTS}
+        routing = document_routing(search)
+        if routing:
+            header["routing"] = routing
+        lines.append(header)
+        lines.append(build_search_body(**search, fuzzy=not degraded))
     
-    # Build the full query
-    if must_clauses or filter_clauses:
-        search_query = {
-            "bool": {
-                "must": must_clauses if must_clauses else [{"match_all": {}}],
-                "filter": filter_clauses
+    in_flight_searches += 1
+    try:
+        response = await search_client(opaque_id).msearch(index=index_name, searches=lines)
+        
+        items = []
+        for search, item in zip(searches, response["responses"]):
+            if "error" in item:
+                error = item["error"]
+                reason = error.get("reason", error.get("type")) if isinstance(error, dict) else str(error)
+                items.append({"result": None, "error": reason})
+            else:
+                items.append({
+                    "result": {
+                        **parse_search_response(
+                            item,
+                            search.get("page", 1),
+                            search.get("per_page", 10)
+                        ),
+                        "degraded": degraded
+                    },
+                    "error": None
+                })
+        
+        return items
+        
+    except ConnectionTimeout:
+        logger.warning(f"Multi-search timed out after {settings.SEARCH_REQUEST_TIMEOUT_SECONDS}s")
+        if opaque_id:
+            await cancel_search(opaque_id)
+        raise SearchTimeoutError("Multi-search request deadline exceeded")
+    except Exception as e:
+        logger.error(f"Error running multi-search: {e}")
+        raise
+    finally:
+        in_flight_searches -= 1
+
+
+async def suggest_content(prefix: str, size: int = 5):
+    """
+    Get type-ahead suggestions for a query prefix.
+    
+    Uses the completion suggester on the suggest field, which answers
+    prefix lookups from an in-memory FST without scoring any documents.
+    
+    Args:
+        prefix: Query prefix typed by the user
+        size: Maximum number of suggestions to return
+        
+    Returns:
+        List of suggestion strings
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    
+    try:
+        response = await es_client.search(
+            index=index_name,
+            source=False,
+            suggest={
+                "content_suggest": {
+                    "prefix": prefix,
+                    "completion": {
+                        "field": "suggest",
+                        "size": size,
+                        "skip_duplicates": True
+                    }
+                }
             }
-        }
-    else:
-        search_query = {"match_all": {}}
+        )
+        
+        options = response["suggest"]["content_suggest"][0]["options"]
+        return [option["text"] for option in options]
+        
+    except Exception as e:
+        logger.error(f"Error getting suggestions: {e}")
+        raise
+
+
+async def get_content_source(content_id: str, fields: list) -> dict:
+    """
+    Fetch selected source fields of a content document by id.
+    
+    Args:
+        content_id: ID of the content document
+        fields: Source fields to return
+        
+    Returns:
+        Source dictionary with the requested fields
+        
+    Raises:
+        DocumentNotFoundError: If the content document does not exist
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    
+    # A get on an author-routed index needs the routing value, which is
+    # not known here; an ids query finds the document on any shard
+    if route_by_author:
+        response = await es_client.search(
+            index=index_name,
+            query={"ids": {"values": [content_id]}},
+            size=1,
+            source={"includes": fields}
+        )
+        hits = response["hits"]["hits"]
+        if not hits:
+            raise DocumentNotFoundError(content_id)
+        return hits[0]["_source"]
     
     try:
+        response = await es_client.get(index=index_name, id=content_id, source_includes=fields)
+        return response["_source"]
+    except NotFoundError:
+        raise DocumentNotFoundError(content_id)
+
+
+async def similar_content(
+    content_id: str,
+    size: int = 10,
+    status: Optional[str] = None
+):
+    """
+    Find content similar to a given document by approximate kNN.
+    
+    Uses the document's stored embedding, computing it from its text
+    when the document was indexed before embeddings existed.
+    
+    Args:
+        content_id: ID of the content to find neighbours for
+        size: Number of similar documents to return
+        status: Optional verification status filter
+        
+    Returns:
+        List of result dictionaries ordered by similarity
+        
+    Raises:
+        DocumentNotFoundError: If the content document does not exist
+    """
+    index_name = settings.ELASTICSEARCH_INDEX
+    
+    try:
+        source = await get_content_source(content_id, ["embedding", "content_text", "tags"])
+        
+        vector = source.get("embedding")
+        if vector is None:
+            vector = embed_texts([embedding_text(source)])[0].tolist()
+        if not any(vector):
+            return []
+        
+        filter_clauses = [{"bool": {"must_not": {"ids": {"values": [content_id]}}}}]
+        if status:
+            filter_clauses.append({"term": {"status": status}})
+        
         response = await es_client.search(
             index=index_name,
-            query=search_query,
-            from_=from_index,
-            size=per_page,
-            sort=[{"submission_date": {"order": "desc"}}]
+            knn={
+                "field": "embedding",
+                "query_vector": vector,
+                "k": size,
+                "num_candidates": max(settings.SIMILAR_NUM_CANDIDATES, size),
+                "filter": filter_clauses
+            },
+            size=size,
+            source={"includes": SEARCH_RESULT_FIELDS}
         )
         
-        hits = response["hits"]
-        results = []
+        return parse_search_response(response, 1, size)["results"]
         
-        for hit in hits["hits"]:
-            result = hit["_source"]
-            result["_id"] = hit["_id"]
-            result["_score"] = hit["_score"]
-            results.append(result)
+    except DocumentNotFoundError:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding content similar to {content_id}: {e}")
+        raise
+
+
+async def save_search(user_id: str, name: str, search: dict) -> dict:
+    """
+    Store a saved search as a percolator query.
+    
+    Args:
+        user_id: Owner of the saved search
+        name: Display name of the saved search
+        search: Dictionary with query, status and tags
         
-        return {
-            "results": results,
-            "total": hits["total"]["value"],
-            "page": page,
-            "per_page": per_page,
-            "pages": (hits["total"]["value"] + per_page - 1) // per_page
-        }
+    Returns:
+        Saved search dictionary
+    """
+    search_id = uuid.uuid4().hex
+    document = {
+        "search_id": search_id,
+        "user_id": user_id,
+        "name": name,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "search": search,
+        "query": build_search_query(search["query"], search.get("status"), search.get("tags"))
+    }
+    
+    try:
+        await es_client.index(
+            index=settings.SAVED_SEARCH_INDEX,
+            id=search_id,
+            document=document,
+            refresh="wait_for"
+        )
+        logger.info(f"Saved search {search_id} for user {user_id}")
+        return format_saved_search(document)
+    except Exception as e:
+        logger.error(f"Error saving search for user {user_id}: {e}")
+        raise
+
+
+def format_saved_search(document: dict) -> dict:
+    """Convert a saved search document into a SavedSearchOut dict."""
+    return {
+        "id": document["search_id"],
+        "name": document["name"],
+        "created_at": document["created_at"],
+        **document["search"]
+    }
+
+
+async def list_saved_searches(user_id: str) -> list:
+    """
+    List the saved searches of a user, newest first.
+    
+    Args:
+        user_id: Owner of the saved searches
         
+    Returns:
+        List of saved search dictionaries
+    """
+    try:
+        response = await es_client.search(
+            index=settings.SAVED_SEARCH_INDEX,
+            query={"term": {"user_id": user_id}},
+            sort=[{"created_at": {"order": "desc"}}],
+            size=settings.SAVED_SEARCH_MAX_PER_USER,
+            source={"excludes": ["query"]}
+        )
+        return [format_saved_search(hit["_source"]) for hit in response["hits"]["hits"]]
     except Exception as e:
-        logger.error(f"Error searching content: {e}")
+        logger.error(f"Error listing saved searches for user {user_id}: {e}")
         raise
+
+
+async def delete_saved_search(user_id: str, search_id: str):
+    """
+    Delete a saved search owned by a user.
+    
+    Args:
+        user_id: Owner of the saved search
+        search_id: ID of the saved search
+        
+    Raises:
+        DocumentNotFoundError: If no such saved search belongs to the user
+    """
+    response = await es_client.delete_by_query(
+        index=settings.SAVED_SEARCH_INDEX,
+        query={"bool": {"filter": [
+            {"term": {"search_id": search_id}},
+            {"term": {"user_id": user_id}}
+        ]}},
+        refresh=True
+    )
+    if response["deleted"] == 0:
+        raise DocumentNotFoundError(search_id)
+    logger.info(f"Deleted saved search {search_id} for user {user_id}")
+
+
+async def percolate_content(documents: list) -> list:
+    """
+    Find saved searches matching a batch of new documents.
+    
+    The whole batch is percolated in one query per page of matching
+    saved searches, so the cost grows with new documents rather than
+    with the number of saved searches times documents.
+    
+    Args:
+        documents: Content dictionaries, each including content_id
+        
+    Returns:
+        List of dictionaries with search_id, user_id, name and the
+        content_ids of the documents that matched
+    """
+    percolate_documents = [
+        {field: document.get(field) for field in PERCOLATE_FIELDS}
+        for document in documents
+    ]
+    
+    matches = []
+    search_after = None
+    try:
+        while True:
+            response = await es_client.search(
+                index=settings.SAVED_SEARCH_INDEX,
+                query={"percolate": {"field": "query", "documents": percolate_documents}},
+                size=settings.PERCOLATE_PAGE_SIZE,
+                sort=[{"search_id": "asc"}],
+                search_after=search_after,
+                source={"includes": ["search_id", "user_id", "name"]}
+            )
+            hits = response["hits"]["hits"]
+            
+            for hit in hits:
+                slots = hit.get("fields", {}).get("_percolator_document_slot", [0])
+                matches.append({
+                    **hit["_source"],
+                    "content_ids": [documents[slot]["content_id"] for slot in slots]
+                })
+            
+            if len(hits) < settings.PERCOLATE_PAGE_SIZE:
+                return matches
+            search_after = hits[-1]["sort"]
+            
+    except Exception as e:
+        logger.error(f"Error percolating {len(documents)} documents: {e}")
+        raise
+
+
+class ElasticsearchBackend(SearchBackend):
+    """SearchBackend backed by the Elasticsearch cluster at ELASTICSEARCH_URL."""
+    name = "elasticsearch"
+    
+    async def connect(self):
+        await connect_elasticsearch()
+    
+    async def disconnect(self):
+        await disconnect_elasticsearch()
+    
+    async def index_content(self, content_id: str, content_data: dict):
+        await index_content(content_id, content_data)
+    
+    async def bulk_index_content(self, documents: list):
+        return await bulk_index_content(documents)
+    
+    async def update_content(self, content_id: str, content_data: dict):
+        await update_content(content_id, content_data)
+    
+    async def delete_content(self, content_id: str):
+        await delete_content(content_id)
+    
+    async def search_content(self, query: str, **kwargs):
+        return await search_content(query, **kwargs)
+    
+    async def multi_search_content(self, searches: list, opaque_id: Optional[str] = None):
+        return await multi_search_content(searches, opaque_id)
+    
+    async def cancel_search(self, opaque_id: str):
+        await cancel_search(opaque_id)
+    
+    async def apply_tallies(self, tallies: list):
+        return await apply_tallies(tallies)
+    
+    def metrics(self):
+        return es_client.transport.metrics_snapshot() if es_client else {}
+    
+    async def suggest_content(self, prefix: str, size: int = 5):
+        return await suggest_content(prefix, size)
+    
+    async def similar_content(self, content_id: str, size: int = 10, status: Optional[str] = None):
+        return await similar_content(content_id, size, status)
+    
+    async def save_search(self, user_id: str, name: str, search: dict):
+        return await save_search(user_id, name, search)
+    
+    async def list_saved_searches(self, user_id: str):
+        return await list_saved_searches(user_id)
+    
+    async def delete_saved_search(self, user_id: str, search_id: str):
+        await delete_saved_search(user_id, search_id)
+    
+    async def percolate_content(self, documents: list):
+        return await percolate_content(documents)
@@ -0,0 +1,910 @@
+from app.core.config import settings
+from app.core.embeddings import embed_texts, embedding_text
+from app.db.backend import (
+    SearchBackend,
+    DocumentNotFoundError,
+    SEARCH_RESULT_FIELDS,
+    TALLY_FIELDS,
+    build_suggest_inputs,
+    is_browse_query
+)
+from collections import Counter, defaultdict
+from itertools import chain
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterable, Set
+import bisect
+import heapq
+import html
+import json
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+import time
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Tokenization mirrors the content_index analyzer: lowercase word tokens
+# with Lucene's English stopword list removed
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+ENGLISH_STOPWORDS = frozenset([
+    "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "if",
+    "in", "into", "is", "it", "no", "not", "of", "on", "or", "such", "that",
+    "the", "their", "then", "there", "these", "they", "this", "to", "was",
+    "will", "with"
+])
+
+# Field boosts, matching the multi_match fields used by Elasticsearch
+FIELD_WEIGHTS = {"content_text": 2, "content_url": 1, "tags": 1}
+
+# BM25 parameters (Lucene defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Fuzzy expansion per query term, as Elasticsearch's fuzziness "AUTO"
+FUZZY_MAX_EXPANSIONS = 50
+
+# On-disk log format: file header, then records of
+# (op: 1 byte, payload length: 4 bytes, JSON payload)
+FILE_HEADER = b"VRDXIDX1"
+RECORD_HEADER = struct.Struct(">BI")
+OP_PUT = 1
+OP_DELETE = 2
+
+# Rewrite the log once dead records make up this share of the file
+COMPACTION_RATIO = 0.5
+COMPACTION_MIN_BYTES = 1024 * 1024
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Split text into lowercase index terms.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        List of terms with stopwords removed
+    """
+    if not text:
+        return []
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in ENGLISH_STOPWORDS
+    ]
+
+
+def fuzziness(term: str) -> int:
+    """Edit distance allowed for a term under fuzziness "AUTO"."""
+    if len(term) < 3:
+        return 0
+    if len(term) < 6:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Damerau-Levenshtein distance (adjacent transpositions count as one
+    edit), giving up once it exceeds limit.
+    
+    Args:
+        a: First term
+        b: Second term
+        limit: Largest distance of interest
+        
+    Returns:
+        The distance, or limit + 1 if it is larger than limit
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    
+    previous = None
+    current = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        previous, before = current, previous
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+    return min(current[-1], limit + 1)
+
+
+def parse_date(value: Any) -> datetime:
+    """
+    Parse a submission date into a timezone-aware UTC datetime.
+    
+    Args:
+        value: ISO 8601 string or datetime
+        
+    Returns:
+        UTC datetime
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def bucket_date(value: datetime, interval: str) -> datetime:
+    """
+    Round a date down to the start of its calendar interval.
+    
+    Args:
+        value: UTC datetime
+        interval: One of day, week, month, quarter, year
+        
+    Returns:
+        Start of the calendar bucket containing value
+    """
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == "day":
+        return day
+    if interval == "week":
+        # Calendar weeks start on Monday, as in Elasticsearch
+        return day.fromordinal(day.toordinal() - day.weekday()).replace(tzinfo=timezone.utc)
+    if interval == "month":
+        return day.replace(day=1)
+    if interval == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    if interval == "year":
+        return day.replace(month=1, day=1)
+    raise ValueError(f"Unsupported facet interval: {interval}")
+
+
+def format_date(value: datetime) -> str:
+    """Format a UTC datetime the way Elasticsearch renders key_as_string."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def _json_default(value: Any):
+    """Serialize datetimes stored in documents as ISO 8601 strings."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def highlight_text(
+    text: str,
+    terms: Set[str],
+    fragment_size: int,
+    number_of_fragments: int
+) -> List[str]:
+    """
+    Build HTML-escaped highlight fragments for matched terms.
+    
+    Falls back to the leading fragment of the text when no term matches,
+    like Elasticsearch's no_match_size.
+    
+    Args:
+        text: Field text to highlight
+        terms: Query terms to mark
+        fragment_size: Approximate fragment length in characters
+        number_of_fragments: Maximum number of fragments
+        
+    Returns:
+        List of fragments with matches wrapped in <mark> tags
+    """
+    matches = [
+        match for match in TOKEN_PATTERN.finditer(text)
+        if match.group().lower() in terms
+    ]
+    
+    if not matches:
+        fragment = text[:fragment_size]
+        if len(text) > fragment_size and " " in fragment:
+            fragment = fragment.rsplit(" ", 1)[0]
+        return [html.escape(fragment)] if fragment else []
+        
+    fragments = []
+    covered_until = -1
+    for match in matches:
+        if len(fragments) >= number_of_fragments:
+            break
+        if match.start() < covered_until:
+            continue
+            
+        # Open the fragment a little before the match, on a word boundary
+        start = max(0, match.start() - fragment_size // 4)
+        if start > 0:
+            space = text.find(" ", start)
+            start = space + 1 if 0 <= space < match.start() else match.start()
+        end = min(len(text), start + fragment_size)
+        if end < len(text):
+            space = text.rfind(" ", match.end(), end)
+            end = space if space > 0 else end
+            
+        parts = []
+        position = start
+        for inner in matches:
+            if inner.start() < start or inner.end() > end:
+                continue
+            parts.append(html.escape(text[position:inner.start()]))
+            parts.append(f"<mark>{html.escape(inner.group())}</mark>")
+            position = inner.end()
+        parts.append(html.escape(text[position:end]))
+        
+        fragments.append("".join(parts))
+        covered_until = end
+        
+    return fragments
+
+
+class EmbeddedIndex:
+    """
+    In-process inverted index with BM25 scoring.
+    
+    Documents are persisted to an append-only log file which is memory
+    mapped for reads: only postings, filter sets and sort keys live on the
+    heap, while document sources are read from the mapped file when a hit
+    is rendered. The log is replayed on open and compacted once dead
+    records dominate it.
+    
+    The index is not safe for concurrent writers, so it is meant for a
+    single worker process (local development, CI, small deployments).
+    
+    Attributes:
+        path: Location of the index log file
+    """
+    
+    def __init__(self, path: str):
+        self.path = Path(path)
+        
+        # Inverted index: term -> {doc_id: weighted term frequency}
+        self._postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_length: Dict[str, int] = {}
+        self._total_length = 0
+        # Indexed terms by length, to find fuzzy expansion candidates
+        self._terms_by_length: Dict[int, Set[str]] = defaultdict(set)
+        
+        # Filter and sort structures
+        self._status: Dict[str, str] = {}
+        self._authors: Dict[str, str] = {}
+        self._votes: Dict[str, int] = {}
+        self._tags: Dict[str, List[str]] = {}
+        self._dates: Dict[str, datetime] = {}
+        self._days: Dict[str, datetime] = {}
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._by_author: Dict[str, Set[str]] = defaultdict(set)
+        
+        # Embeddings, computed in batches on first use
+        self._vectors: Dict[str, np.ndarray] = {}
+        
+        # Sorted (lowercase input, input, doc_id) tuples for prefix lookups
+        self._suggestions: List[tuple] = []
+        self._doc_suggestions: Dict[str, List[tuple]] = {}
+        
+        # Storage: doc_id -> (payload offset, payload length)
+        self._locations: Dict[str, tuple] = {}
+        self._live_bytes = len(FILE_HEADER)
+        self._writer = None
+        self._reader = None
+        self._mmap: Optional[mmap.mmap] = None
+        
+    def __len__(self) -> int:
+        return len(self._locations)
+        
+    # Storage
+    
+    def open(self):
+        """
+        Open the log file, creating it if needed, and replay it.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            with open(self.path, "wb") as f:
+                f.write(FILE_HEADER)
+                
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._remap()
+        
+        if self._mmap[:len(FILE_HEADER)] != FILE_HEADER:
+            raise ValueError(f"Not an embedded search index file: {self.path}")
+            
+        self._replay()
+        self._maybe_compact()
+        logger.info(f"Loaded embedded index with {len(self)} documents from {self.path}")
+        
+    def close(self):
+        """
+        Flush the log to disk and release file handles.
+        """
+        if self._writer:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._writer.close()
+            self._writer = None
+        if self._mmap:
+            self._mmap.close()
+            self._mmap = None
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+            
+    def _remap(self):
+        """Map the current extent of the log file."""
+        if self._mmap:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ)
+        
+    def _replay(self):
+        """Rebuild in-memory structures from the log file."""
+        data = self._mmap
+        offset = len(FILE_HEADER)
+        
+        while offset + RECORD_HEADER.size <= len(data):
+            op, length = RECORD_HEADER.unpack_from(data, offset)
+            payload_offset = offset + RECORD_HEADER.size
+            if payload_offset + length > len(data):
+                # Torn write at the tail of the log; drop it
+                logger.warning(f"Ignoring truncated record at offset {offset} in {self.path}")
+                break
+                
+            payload = json.loads(data[payload_offset:payload_offset + length])
+            if op == OP_PUT:
+                self._remove(payload["id"])
+                self._add(payload["id"], payload["doc"], (payload_offset, length))
+            elif op == OP_DELETE:
+                self._remove(payload["id"])
+            offset = payload_offset + length
+            
+        if offset < len(data):
+            self._writer.truncate(offset)
+            self._writer.seek(offset)
+            self._remap()
+            
+    def _append(self, op: int, payload: dict) -> tuple:
+        """
+        Append a record to the log.
+        
+        Returns:
+            (payload offset, payload length) of the written record
+        """
+        encoded = json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+        offset = self._writer.tell()
+        self._writer.write(RECORD_HEADER.pack(op, len(encoded)))
+        self._writer.write(encoded)
+        self._writer.flush()
+        return offset + RECORD_HEADER.size, len(encoded)
+        
+    def _read(self, doc_id: str) -> dict:
+        """Read a document source from the mapped log."""
+        offset, length = self._locations[doc_id]
+        if offset + length > len(self._mmap):
+            self._remap()
+        return json.loads(self._mmap[offset:offset + length])["doc"]
+        
+    def _maybe_compact(self):
+        """Rewrite the log without dead records if they dominate it."""
+        size = self._writer.tell()
+        if size < COMPACTION_MIN_BYTES or self._live_bytes >= size * (1 - COMPACTION_RATIO):
+            return
+        self.compact()
+        
+    def compact(self):
+        """
+        Rewrite the log file with only live documents.
+        """
+        temp_path = self.path.with_suffix(self.path.suffix + ".compact")
+        locations = {}
+        
+        with open(temp_path, "wb") as f:
+            f.write(FILE_HEADER)
+            for doc_id in self._locations:
+                encoded = json.dumps(
+                    {"id": doc_id, "doc": self._read(doc_id)},
+                    separators=(",", ":")
+                ).encode("utf-8")
+                offset = f.tell()
+                f.write(RECORD_HEADER.pack(OP_PUT, len(encoded)))
+                f.write(encoded)
+                locations[doc_id] = (offset + RECORD_HEADER.size, len(encoded))
+            f.flush()
+            os.fsync(f.fileno())
+            
+        self.close()
+        os.replace(temp_path, self.path)
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+        self._remap()
+        self._locations = locations
+        self._live_bytes = len(self._mmap)
+        logger.info(f"Compacted embedded index {self.path} to {self._live_bytes} bytes")
+        
+    # Indexing
+    
+    def _add(self, doc_id: str, doc: dict, location: tuple):
+        """Add a document to the in-memory structures."""
+        terms = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            value = doc.get(field)
+            if isinstance(value, list):
+                value = " ".join(value)
+            for term in tokenize(value):
+                terms[term] += weight
+                
+        for term, frequency in terms.items():
+            if term not in self._postings:
+                self._terms_by_length[len(term)].add(term)
+            self._postings[term][doc_id] = frequency
+        self._doc_terms[doc_id] = terms
+        self._doc_length[doc_id] = sum(terms.values())
+        self._total_length += self._doc_length[doc_id]
+        
+        status = doc.get("status")
+        tags = doc.get("tags") or []
+        self._status[doc_id] = status
+        self._tags[doc_id] = tags
+        self._dates[doc_id] = parse_date(doc["submission_date"])
+        self._days[doc_id] = bucket_date(self._dates[doc_id], "day")
+        self._by_status[status].add(doc_id)
+        self._authors[doc_id] = doc.get("author_id")
+        self._votes[doc_id] = doc.get("total_votes") or 0
+        self._by_author[self._authors[doc_id]].add(doc_id)
+        for tag in tags:
+            self._by_tag[tag].add(doc_id)
+            
+        entries = []
+        for text in build_suggest_inputs(doc):
+            entry = (text.lower(), text, doc_id)
+            bisect.insort(self._suggestions, entry)
+            entries.append(entry)
+        self._doc_suggestions[doc_id] = entries
+        
+        self._locations[doc_id] = location
+        self._live_bytes += RECORD_HEADER.size + location[1]
+        
+    def _remove(self, doc_id: str) -> bool:
+        """Remove a document from the in-memory structures."""
+        if doc_id not in self._locations:
+            return False
+            
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._terms_by_length[len(term)].discard(term)
+        self._total_length -= self._doc_length.pop(doc_id)
+        
+        status = self._status.pop(doc_id)
+        self._by_status[status].discard(doc_id)
+        self._by_author[self._authors.pop(doc_id)].discard(doc_id)
+        self._votes.pop(doc_id)
+        for tag in self._tags.pop(doc_id):
+            self._by_tag[tag].discard(doc_id)
+        self._dates.pop(doc_id)
+        self._days.pop(doc_id)
+        self._vectors.pop(doc_id, None)
+        
+        for entry in self._doc_suggestions.pop(doc_id):
+            position = bisect.bisect_left(self._suggestions, entry)
+            if position < len(self._suggestions) and self._suggestions[position] == entry:
+                del self._suggestions[position]
+                
+        _, length = self._locations.pop(doc_id)
+        self._live_bytes -= RECORD_HEADER.size + length
+        return True
+        
+    def put(self, doc_id: str, doc: dict):
+        """
+        Index (create or replace) a document.
+        
+        Args:
+            doc_id: Document identifier
+            doc: Document source
+        """
+        doc = json.loads(json.dumps(doc, default=_json_default))
+        location = self._append(OP_PUT, {"id": doc_id, "doc": doc})
+        self._remove(doc_id)
+        self._add(doc_id, doc, location)
+        self._maybe_compact()
+        
+    def get(self, doc_id: str) -> dict:
+        """
+        Get a document source.
+        
+        Raises:
+            DocumentNotFoundError: If the document does not exist
+        """
+        if doc_id not in self._locations:
+            raise DocumentNotFoundError(doc_id)
+        return self._read(doc_id)
+        
+    def update(self, doc_id: str, fields: dict):
+        """
+        Merge fields into an existing document.
+        
+        Raises:
+            DocumentNotFoundError: If the document does not exist
+        """
+        doc = self.get(doc_id)
+        doc.update(fields)
+        self.put(doc_id, doc)
+        
+    def delete(self, doc_id: str):
+        """
+        Delete a document.
+        
+        Raises:
+            DocumentNotFoundError: If the document does not exist
+        """
+        if doc_id not in self._locations:
+            raise DocumentNotFoundError(doc_id)
+        self._append(OP_DELETE, {"id": doc_id})
+        self._remove(doc_id)
+        self._maybe_compact()
+        
+    # Querying
+    
+    def _filter(
+        self,
+        status: Optional[str],
+        tags: Optional[list],
+        author_id: Optional[str] = None
+    ) -> Optional[Set[str]]:
+        """Return ids passing the filters, or None when unfiltered."""
+        allowed = None
+        if author_id:
+            allowed = set(self._by_author.get(author_id, ()))
+        if status:
+            matching = self._by_status.get(status, set())
+            allowed = set(matching) if allowed is None else allowed & matching
+        if tags:
+            tagged = set().union(*(self._by_tag.get(tag, ()) for tag in tags))
+            allowed = tagged if allowed is None else allowed & tagged
+        return allowed
+        
+    def _expand(self, terms: Iterable[str], fuzzy: bool) -> Dict[str, float]:
+        """
+        Expand query terms with indexed terms within their fuzziness.
+        
+        Like Elasticsearch, each term keeps its FUZZY_MAX_EXPANSIONS
+        closest matches, boosted by similarity (1 - edits / length).
+        
+        Args:
+            terms: Query terms
+            fuzzy: Whether to add fuzzy matches at all
+            
+        Returns:
+            Boost of every term to score, exact terms at 1.0
+        """
+        boosts = {term: 1.0 for term in terms}
+        if not fuzzy:
+            return boosts
+        
+        for term in terms:
+            edits = fuzziness(term)
+            candidates = []
+            for length in range(len(term) - edits, len(term) + edits + 1):
+                for candidate in self._terms_by_length.get(length, ()):
+                    distance = edit_distance(term, candidate, edits) if candidate != term else 0
+                    if 0 < distance <= edits:
+                        candidates.append((distance, candidate))
+            
+            for distance, candidate in heapq.nsmallest(FUZZY_MAX_EXPANSIONS, candidates):
+                boost = 1 - distance / min(len(term), len(candidate))
+                boosts[candidate] = max(boosts.get(candidate, 0.0), boost)
+        return boosts
+    
+    def _score(self, terms: Dict[str, float], allowed: Optional[Set[str]]) -> Dict[str, float]:
+        """Score documents containing any of the boosted terms with BM25."""
+        scores: Dict[str, float] = defaultdict(float)
+        count = len(self._locations)
+        if count == 0:
+            return scores
+        average_length = self._total_length / count
+        
+        for term, boost in terms.items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = boost * math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_length[doc_id] / average_length)
+                scores[doc_id] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                
+        return scores
+        
+    def _facets(self, doc_ids: Iterable[str], facet_interval: str) -> dict:
+        """Count tags, statuses and date buckets over matched documents."""
+        doc_ids = list(doc_ids)
+        tag_counts = Counter(chain.from_iterable(self._tags[doc_id] for doc_id in doc_ids))
+        status_counts = Counter(self._status[doc_id] for doc_id in doc_ids)
+        
+        # Count per day first so each distinct day is bucketed only once
+        date_counts = Counter()
+        day_counts = Counter(self._days[doc_id] for doc_id in doc_ids)
+        for day, count in day_counts.items():
+            date_counts[bucket_date(day, facet_interval)] += count
+            
+        return {
+            "tags": [
+                {"key": key, "count": count}
+                for key, count in tag_counts.most_common(settings.FACET_TAGS_SIZE)
+            ],
+            "status": [
+                {"key": key, "count": count}
+                for key, count in status_counts.most_common(10)
+            ],
+            "submission_date": [
+                {"key": format_date(key), "count": date_counts[key]}
+                for key in sorted(date_counts)
+            ]
+        }
+        
+    def _render(self, doc_id: str, score: Optional[float], terms: Set[str]) -> dict:
+        """Build a search result with display fields and highlights."""
+        source = self._read(doc_id)
+        result = {field: source.get(field) for field in SEARCH_RESULT_FIELDS}
+        result.update({field: source.get(field) or 0 for field in TALLY_FIELDS})
+        result["_id"] = doc_id
+        result["content_id"] = result["content_id"] or doc_id
+        result["_score"] = score
+        
+        highlights = {}
+        text = source.get("content_text")
+        if text:
+            highlights["content_text"] = highlight_text(
+                text,
+                terms,
+                settings.HIGHLIGHT_FRAGMENT_SIZE,
+                settings.HIGHLIGHT_NUMBER_OF_FRAGMENTS
+            )
+        matched_tags = [
+            f"<mark>{html.escape(tag)}</mark>"
+            for tag in source.get("tags") or []
+            if terms & set(tokenize(tag))
+        ]
+        if matched_tags:
+            highlights["tags"] = matched_tags
+        result["highlights"] = highlights
+        return result
+        
+    def search(
+        self,
+        query: Optional[str],
+        status: Optional[str] = None,
+        tags: Optional[list] = None,
+        page: int = 1,
+        per_page: int = 10,
+        facets: bool = False,
+        facet_interval: str = "month",
+        author_id: Optional[str] = None,
+        min_votes: Optional[int] = None,
+        sort: str = "date",
+        fuzzy: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Search documents, newest first, with the same semantics and
+        response shape as the Elasticsearch backend.
+        
+        Args:
+            query: Search query string (empty or "*" to browse)
+            status: Filter by verification status
+            tags: List of tags to filter by (any of)
+            page: Page number (1-indexed)
+            per_page: Results per page
+            facets: Whether to attach tag, status and date facet counts
+            facet_interval: Calendar interval for the submission_date histogram
+            author_id: Restrict to one author's content
+            min_votes: Minimum total_votes
+            sort: "date" for newest first, "votes" for most voted first
+            fuzzy: Also match terms within fuzziness "AUTO" edits
+            
+        Returns:
+            Dictionary with search results and metadata
+        """
+        started = time.perf_counter()
+        allowed = self._filter(status, tags, author_id)
+        if min_votes:
+            voted = {doc_id for doc_id, votes in self._votes.items() if votes >= min_votes}
+            allowed = voted if allowed is None else allowed & voted
+        browse = is_browse_query(query)
+        
+        if browse:
+            scores = None
+            matched = allowed if allowed is not None else self._locations.keys()
+            total = min(len(matched), settings.BROWSE_TRACK_TOTAL_HITS)
+            lower_bound = len(matched) > settings.BROWSE_TRACK_TOTAL_HITS
+            terms = set()
+        else:
+            boosts = self._expand(set(tokenize(query)), fuzzy)
+            terms = set(boosts)
+            scores = self._score(boosts, allowed)
+            matched = scores.keys()
+            total = len(matched)
+            lower_bound = False
+            
+        # Sorted top-k without sorting every match
+        start = (page - 1) * per_page
+        if sort == "votes":
+            key = lambda doc_id: (self._votes[doc_id], self._dates[doc_id], doc_id)
+        else:
+            key = lambda doc_id: (self._dates[doc_id], doc_id)
+        top = heapq.nlargest(start + per_page, matched, key=key)[start:]
+        
+        results = [
+            self._render(doc_id, scores[doc_id] if scores is not None else None, terms)
+            for doc_id in top
+        ]
+        
+        return {
+            "results": results,
+            "total": total,
+            "total_is_lower_bound": lower_bound,
+            "page": page,
+            "per_page": per_page,
+            "pages": (total + per_page - 1) // per_page,
+            "facets": self._facets(matched, facet_interval) if facets else None,
+            "took": int((time.perf_counter() - started) * 1000)
+        }
+        
+    def suggest(self, prefix: str, size: int = 5) -> List[str]:
+        """
+        Return distinct suggestion inputs starting with a prefix.
+        
+        Args:
+            prefix: Query prefix typed by the user
+            size: Maximum number of suggestions
+            
+        Returns:
+            List of suggestion strings
+        """
+        prefix = prefix.lower()
+        suggestions = []
+        position = bisect.bisect_left(self._suggestions, (prefix,))
+        
+        while position < len(self._suggestions) and len(suggestions) < size:
+            key, text, _ = self._suggestions[position]
+            if not key.startswith(prefix):
+                break
+            if text not in suggestions:
+                suggestions.append(text)
+            position += 1
+            
+        return suggestions
+        
+    def _embed_missing(self):
+        """Vectorize every document without a cached embedding in one batch."""
+        missing = [doc_id for doc_id in self._locations if doc_id not in self._vectors]
+        if not missing:
+            return
+            
+        matrix = embed_texts([embedding_text(self._read(doc_id)) for doc_id in missing])
+        for doc_id, vector in zip(missing, matrix):
+            self._vectors[doc_id] = vector
+            
+    def similar(self, doc_id: str, size: int = 10, status: Optional[str] = None) -> List[dict]:
+        """
+        Find the documents most similar to a document by cosine similarity.
+        
+        Exact nearest-neighbour search over the cached embeddings, which
+        is fast enough at the corpus sizes the embedded engine targets.
+        
+        Args:
+            doc_id: ID of the document to find neighbours for
+            size: Number of similar documents to return
+            status: Optional verification status filter
+            
+        Returns:
+            List of results ordered by similarity
+            
+        Raises:
+            DocumentNotFoundError: If the document does not exist
+        """
+        if doc_id not in self._locations:
+            raise DocumentNotFoundError(doc_id)
+            
+        self._embed_missing()
+        query = self._vectors[doc_id]
+        if not query.any():
+            return []
+            
+        allowed = self._filter(status, None)
+        candidates = [
+            candidate for candidate in (allowed if allowed is not None else self._locations)
+            if candidate != doc_id
+        ]
+        if not candidates:
+            return []
+            
+        scores = np.stack([self._vectors[candidate] for candidate in candidates]) @ query
+        count = min(size, len(candidates))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top])]
+        
+        return [self._render(candidates[i], float(scores[i]), set()) for i in top]
+
+
+class EmbeddedSearchBackend(SearchBackend):
+    """
+    SearchBackend running the EmbeddedIndex in-process.
+    
+    Needs no external services, so the search API can run in local
+    development and CI without Elasticsearch.
+    """
+    name = "embedded"
+    
+    def __init__(self, path: str):
+        self.index = EmbeddedIndex(path)
+        
+    async def connect(self):
+        self.index.open()
+        
+    async def disconnect(self):
+        self.index.close()
+        logger.info("Embedded search index closed")
+        
+    async def index_content(self, content_id: str, content_data: dict):
+        self.index.put(content_id, content_data)
+        logger.info(f"Indexed content: {content_id}")
+        
+    async def bulk_index_content(self, documents: list):
+        indexed = 0
+        errors = []
+        for document in documents:
+            document = dict(document)
+            content_id = document.pop("content_id")
+            try:
+                self.index.put(content_id, document)
+                indexed += 1
+            except Exception as e:
+                errors.append({"content_id": content_id, "error": str(e)})
+        logger.info(f"Bulk indexed {indexed} of {len(documents)} documents")
+        return {"indexed": indexed, "errors": errors}
+        
+    async def update_content(self, content_id: str, content_data: dict):
+        self.index.update(content_id, content_data)
+        logger.info(f"Updated content: {content_id}")
+        
+    async def delete_content(self, content_id: str):
+        self.index.delete(content_id)
+        logger.info(f"Deleted content: {content_id}")
+        
+    async def search_content(self, query: str, opaque_id: Optional[str] = None, **kwargs):
+        return self.index.search(query, **kwargs)
+        
+    async def multi_search_content(self, searches: list, opaque_id: Optional[str] = None):
+        items = []
+        for search in searches:
+            try:
+                items.append({"result": self.index.search(**search), "error": None})
+            except Exception as e:
+                items.append({"result": None, "error": str(e)})
+        return items
+        
+    async def apply_tallies(self, tallies: list):
+        updated = missing = 0
+        for tally in tallies:
+            try:
+                current = self.index.get(tally["content_id"]).get("tally_version")
+            except DocumentNotFoundError:
+                missing += 1
+                continue
+            if current is None or tally["version"] > current:
+                fields = {field: tally[field] for field in (*TALLY_FIELDS, "status")}
+                self.index.update(tally["content_id"], {**fields, "tally_version": tally["version"]})
+            updated += 1
+        logger.info(f"Applied {updated} vote tallies ({missing} missing)")
+        return {"updated": updated, "missing": missing, "failed": 0}
+        
+    async def suggest_content(self, prefix: str, size: int = 5):
+        return self.index.suggest(prefix, size)
+        
+    async def similar_content(self, content_id: str, size: int = 10, status: Optional[str] = None):
+        return self.index.similar(content_id, size, status)
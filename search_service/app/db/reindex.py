@@ -0,0 +1,166 @@
+"""
+Reindex the content index into a new index and switch over atomically.
+
+Used to migrate an existing content index to new index-level settings
+that cannot be changed in place, such as author_id routing or index
+sorting on submission_date. Documents are copied with the _reindex API
+into a timestamped index created by create_content_index, then
+ELASTICSEARCH_INDEX is pointed at the new index as an alias in a single
+update_aliases call.
+
+Writes made while the copy runs are not carried over; pause indexing or
+re-send recently changed content through /search/index/bulk afterwards.
+Restart the search service after switching so it picks up the routing
+of the new index.
+
+Usage (from the search_service directory):
+    python -m app.db.reindex --route-by-author --sort-by-date
+"""
+from datetime import datetime, timezone
+import argparse
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db import elasticsearch as es
+
+logger = logging.getLogger(__name__)
+
+# Painless scripts setting the routing of each copied document
+ROUTE_BY_AUTHOR_SCRIPT = "ctx._routing = ctx._source.author_id"
+CLEAR_ROUTING_SCRIPT = "ctx._routing = null"
+
+
+async def resolve_index(name: str) -> str:
+    """
+    Resolve an index or alias name to its single concrete index.
+    
+    Args:
+        name: Index or alias name
+        
+    Returns:
+        Concrete index name
+        
+    Raises:
+        ValueError: If the name points at more than one index
+    """
+    indices = list((await es.es_client.indices.get(index=name)).keys())
+    if len(indices) != 1:
+        raise ValueError(f"{name} resolves to {len(indices)} indices: {indices}")
+    return indices[0]
+
+
+async def wait_for_task(task_id: str, poll_seconds: float) -> dict:
+    """
+    Poll a background task until it completes.
+    
+    Args:
+        task_id: Elasticsearch task ID
+        poll_seconds: Delay between polls
+        
+    Returns:
+        The completed task's response
+    """
+    while True:
+        task = await es.es_client.tasks.get(task_id=task_id)
+        if task["completed"]:
+            return task["response"]
+        
+        progress = task["task"]["status"]
+        logger.info(f"Reindexed {progress['created'] + progress['updated']} of {progress['total']} documents")
+        await asyncio.sleep(poll_seconds)
+
+
+async def reindex_content_index(
+    route_by_author: bool,
+    sort_by_date: bool,
+    delete_old: bool = False,
+    poll_seconds: float = 5.0
+) -> str:
+    """
+    Copy the content index into a new index and switch the alias to it.
+    
+    Args:
+        route_by_author: Whether the new index is routed by author_id
+        sort_by_date: Whether the new index is sorted by submission_date
+        delete_old: Delete the previous index after switching
+        poll_seconds: Delay between reindex progress polls
+        
+    Returns:
+        Name of the new concrete index
+        
+    Raises:
+        RuntimeError: If the copy reports failures or document counts differ
+    """
+    alias = settings.ELASTICSEARCH_INDEX
+    source = await resolve_index(alias)
+    target = f"{alias}_{datetime.now(timezone.utc):%Y%m%d%H%M%S}"
+    
+    await es.create_content_index(target, route_by_author, sort_by_date)
+    logger.info(f"Created index {target} (route_by_author={route_by_author}, sort_by_date={sort_by_date})")
+    
+    task = await es.es_client.reindex(
+        source={"index": source},
+        dest={"index": target},
+        script={
+            "lang": "painless",
+            "source": ROUTE_BY_AUTHOR_SCRIPT if route_by_author else CLEAR_ROUTING_SCRIPT
+        },
+        slices="auto",
+        refresh=True,
+        wait_for_completion=False
+    )
+    response = await wait_for_task(task["task"], poll_seconds)
+    if response.get("failures"):
+        raise RuntimeError(f"Reindex into {target} failed: {response['failures'][:5]}")
+    
+    source_count = (await es.es_client.count(index=source))["count"]
+    target_count = (await es.es_client.count(index=target))["count"]
+    if source_count != target_count:
+        raise RuntimeError(f"Reindex copied {target_count} of {source_count} documents")
+    
+    # An alias cannot share its name with an index, so a concrete index
+    # named like the alias is removed in the same atomic switch
+    if source == alias:
+        actions = [{"remove_index": {"index": source}}]
+    else:
+        actions = [{"remove": {"index": source, "alias": alias}}]
+    actions.append({"add": {"index": target, "alias": alias}})
+    await es.es_client.indices.update_aliases(actions=actions)
+    logger.info(f"Switched {alias} from {source} to {target}")
+    
+    if delete_old and source != alias:
+        await es.es_client.indices.delete(index=source)
+        logger.info(f"Deleted index {source}")
+    
+    return target
+
+
+async def main(route_by_author: bool, sort_by_date: bool, delete_old: bool, poll_seconds: float):
+    await es.connect_elasticsearch()
+    try:
+        await reindex_content_index(route_by_author, sort_by_date, delete_old, poll_seconds)
+    finally:
+        await es.disconnect_elasticsearch()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--route-by-author",
+        action=argparse.BooleanOptionalAction,
+        default=settings.ROUTE_BY_AUTHOR,
+        help="Route documents of the new index by author_id (default: ROUTE_BY_AUTHOR)"
+    )
+    parser.add_argument(
+        "--sort-by-date",
+        action=argparse.BooleanOptionalAction,
+        default=settings.INDEX_SORT_BY_DATE,
+        help="Sort segments of the new index by submission_date (default: INDEX_SORT_BY_DATE)"
+    )
+    parser.add_argument("--delete-old", action="store_true", help="Delete the previous index after switching")
+    parser.add_argument("--poll-seconds", type=float, default=5.0, help="Delay between progress polls")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(main(args.route_by_author, args.sort_by_date, args.delete_old, args.poll_seconds))
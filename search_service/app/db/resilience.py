@@ -0,0 +1,285 @@
+from elasticsearch import AsyncElasticsearch
+from elastic_transport import AsyncTransport, ConnectionError, ConnectionTimeout
+from app.core.config import settings
+from app.db.backend import SearchUnavailableError
+from collections import Counter
+from typing import Any, Dict, Optional
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Circuit breaker states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Response statuses treated as cluster failures (brownout or overload)
+FAILURE_STATUSES = (429, 502, 503, 504)
+
+# Read endpoints that are safe to retry after a timeout and to hedge
+READ_ENDPOINTS = ("/_search", "/_msearch", "/_count", "/_mget")
+
+# Timeouts this close to a request's own deadline are the deadline's doing
+DEADLINE_SLACK_SECONDS = 0.05
+
+
+class CircuitOpenError(ConnectionError, SearchUnavailableError):
+    """Raised without contacting Elasticsearch while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+    
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail fast for reset_seconds. Then a single probe request is
+    let through (half-open): success closes the circuit, failure opens
+    it again.
+    
+    Attributes:
+        state: Current state (closed, open or half_open)
+    """
+    
+    def __init__(self, failure_threshold: int, reset_seconds: float, metrics: Counter):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.metrics = metrics
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+    
+    def _transition(self, state: str):
+        """Move to a new state, recording the transition."""
+        if state == self.state:
+            return
+        logger.warning(f"Elasticsearch circuit breaker {self.state} -> {state}")
+        self.metrics[f"circuit_{self.state}_to_{state}"] += 1
+        self.state = state
+    
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now."""
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                return False
+            self._transition(HALF_OPEN)
+        
+        if self.state == HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        
+        return True
+    
+    def release_probe(self):
+        """Let another probe through after one was abandoned."""
+        self._probing = False
+    
+    def record_success(self):
+        """Record a request that reached a healthy cluster."""
+        self._failures = 0
+        self._probing = False
+        self._transition(CLOSED)
+    
+    def record_failure(self):
+        """Record a failed request, opening the circuit when needed."""
+        self._failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a fraction of request volume.
+    
+    Every request deposits ratio tokens and every retry (or hedge)
+    withdraws one, so during a brownout retries add at most ratio extra
+    load instead of multiplying it.
+    """
+    
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+    
+    def deposit(self):
+        """Credit the budget for one request."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+    
+    def withdraw(self) -> bool:
+        """Spend one token if available."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+def is_read_request(method: str, target: str) -> bool:
+    """Whether a request only reads data and may be retried or hedged."""
+    if method in ("GET", "HEAD"):
+        return True
+    path = target.split("?", 1)[0]
+    return method == "POST" and path.endswith(READ_ENDPOINTS)
+
+
+class ResilientTransport(AsyncTransport):
+    """
+    Elasticsearch transport with a circuit breaker, a retry budget and
+    optional hedged reads.
+    
+    Built-in transport retries are disabled; retries happen here so they
+    can be gated by the breaker and the budget. Connection errors are
+    retried for any request, timeouts and overload statuses only for
+    reads. With ELASTICSEARCH_HEDGE_DELAY_MS set and several nodes
+    configured, a read that has not answered within the delay is sent
+    to a second node and the first response wins.
+    
+    A request_timeout passed with the request is a deadline for all
+    attempts together: each attempt (and hedge) gets only the time left,
+    and a timeout is not retried since it used up the deadline. Such a
+    timeout is not a breaker failure either, so expensive queries or
+    short client deadlines cannot open the circuit for all traffic.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics: Counter = Counter()
+        self.breaker = CircuitBreaker(
+            settings.ELASTICSEARCH_CIRCUIT_FAILURE_THRESHOLD,
+            settings.ELASTICSEARCH_CIRCUIT_RESET_SECONDS,
+            self.metrics
+        )
+        self.budget = RetryBudget(
+            settings.ELASTICSEARCH_RETRY_BUDGET_RATIO,
+            settings.ELASTICSEARCH_RETRY_BUDGET_MAX_TOKENS
+        )
+        self.hedge_delay = settings.ELASTICSEARCH_HEDGE_DELAY_MS / 1000
+    
+    async def perform_request(self, method: str, target: str, **kwargs: Any):
+        if not self.breaker.allow_request():
+            self.metrics["short_circuited"] += 1
+            raise CircuitOpenError("Elasticsearch circuit breaker is open")
+        
+        kwargs["max_retries"] = 0
+        read = is_read_request(method, target)
+        timeout = kwargs.get("request_timeout")
+        deadline = time.monotonic() + timeout if isinstance(timeout, (int, float)) else None
+        self.metrics["requests"] += 1
+        self.budget.deposit()
+        
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(method, target, read, kwargs, deadline)
+            except asyncio.CancelledError:
+                # An abandoned probe must not keep the circuit half-open
+                self.breaker.release_probe()
+                raise
+            except (ConnectionError, ConnectionTimeout) as e:
+                if isinstance(e, ConnectionTimeout) and deadline is not None and (
+                    time.monotonic() >= deadline - DEADLINE_SLACK_SECONDS
+                ):
+                    # The request ran out of its own time budget, which says
+                    # more about the query than about the cluster's health
+                    self.breaker.release_probe()
+                    self.metrics["deadline_timeouts"] += 1
+                else:
+                    self.breaker.record_failure()
+                    self.metrics["failures"] += 1
+                if isinstance(e, ConnectionTimeout):
+                    retryable = read and deadline is None
+                else:
+                    retryable = True
+                if not (retryable and self._may_retry(attempt, deadline)):
+                    raise
+            else:
+                if response.meta.status not in FAILURE_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                self.metrics["failures"] += 1
+                if not (read and self._may_retry(attempt, deadline)):
+                    return response
+            
+            attempt += 1
+            self.metrics["retries"] += 1
+    
+    def _may_retry(self, attempt: int, deadline: Optional[float]) -> bool:
+        """Whether another attempt is allowed by the limit, deadline, breaker and budget."""
+        if attempt >= settings.ELASTICSEARCH_MAX_RETRIES or self.breaker.state != CLOSED:
+            return False
+        if deadline is not None and deadline <= time.monotonic():
+            return False
+        if not self.budget.withdraw():
+            self.metrics["retries_denied"] += 1
+            return False
+        return True
+    
+    def _attempt_kwargs(self, kwargs: Dict[str, Any], deadline: Optional[float]) -> Dict[str, Any]:
+        """Request arguments for one attempt, limited to the time left before the deadline."""
+        if deadline is None:
+            return kwargs
+        return {**kwargs, "request_timeout": max(deadline - time.monotonic(), 0.001)}
+    
+    async def _send(self, method: str, target: str, read: bool, kwargs: Dict[str, Any], deadline: Optional[float]):
+        """Send one attempt, hedging reads when enabled."""
+        if not (read and self.hedge_delay > 0 and len(self.node_pool) > 1):
+            return await super().perform_request(method, target, **self._attempt_kwargs(kwargs, deadline))
+        
+        primary = asyncio.ensure_future(
+            super().perform_request(method, target, **self._attempt_kwargs(kwargs, deadline))
+        )
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if not done and self.budget.withdraw():
+                # The node pool rotates, so the hedge goes to another node
+                self.metrics["hedged"] += 1
+                tasks.append(asyncio.ensure_future(
+                    super().perform_request(method, target, **self._attempt_kwargs(kwargs, deadline))
+                ))
+            
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    if succeeded[0] is not primary:
+                        self.metrics["hedge_wins"] += 1
+                    return succeeded[0].result()
+                if not pending:
+                    return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Return the breaker state and request counters."""
+        return {"circuit_state": self.breaker.state, **self.metrics}
+
+
+def create_elasticsearch_client() -> AsyncElasticsearch:
+    """
+    Create the Elasticsearch client used by the service.
+    
+    ELASTICSEARCH_URL may list several comma-separated nodes, which lets
+    failed requests be retried and reads be hedged on another node.
+    
+    Returns:
+        AsyncElasticsearch client using ResilientTransport
+    """
+    hosts = [url.strip() for url in settings.ELASTICSEARCH_URL.split(",") if url.strip()]
+    
+    return AsyncElasticsearch(
+        hosts,
+        transport_class=ResilientTransport,
+        connections_per_node=settings.ELASTICSEARCH_CONNECTIONS_PER_NODE,
+        http_compress=settings.ELASTICSEARCH_HTTP_COMPRESS,
+        request_timeout=settings.ELASTICSEARCH_REQUEST_TIMEOUT_SECONDS,
+        dead_node_backoff_factor=1.0,
+        max_dead_node_backoff=30.0
+    )
@@ -3,7 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.db.elasticsearch import connect_elasticsearch, disconnect_elasticsearch
+from app.db.backend import connect_search_backend, disconnect_search_backend, get_search_backend
+from app.core.tallies import tally_consumer
+from app.core.analytics import query_analytics
 import logging
 
 # Configure logging
@@ -23,17 +25,22 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Search Service...")
     try:
-        await connect_elasticsearch()
-        logger.info("Elasticsearch connected successfully")
+        await connect_search_backend()
+        logger.info(f"Search backend '{settings.SEARCH_BACKEND}' connected successfully")
     except Exception as e:
-        logger.error(f"Failed to connect to Elasticsearch: {e}")
+        logger.error(f"Failed to connect search backend: {e}")
         raise
     
+    tally_consumer.start()
+    query_analytics.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Search Service...")
-    await disconnect_elasticsearch()
+    await tally_consumer.stop()
+    await query_analytics.stop()
+    await disconnect_search_backend()
     logger.info("Search Service shut down successfully")
 
 
@@ -74,3 +81,14 @@ async def health():
         "status": "healthy",
         "service": "search_service"
     }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Search backend counters (e.g. Elasticsearch circuit breaker state)."""
+    return {
+        "service": "search_service",
+        "search_backend": get_search_backend().metrics(),
+        "tally_consumer": tally_consumer.metrics(),
+        "query_analytics": query_analytics.metrics()
+    }
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from datetime import datetime
+from app.core.config import settings
 
 
 class ContentSearch(BaseModel):
@@ -8,8 +9,17 @@ class ContentSearch(BaseModel):
     query: str = Field(..., min_length=1, max_length=500, description="Search query string")
     status: Optional[str] = Field(None, description="Filter by verification status")
     tags: Optional[List[str]] = Field(None, description="Filter by tags")
+    author_id: Optional[str] = Field(None, description="Restrict to one author's content")
+    min_votes: Optional[int] = Field(None, ge=0, description="Minimum total votes")
+    sort: str = Field("date", pattern="^(date|votes)$", description="Sort by newest or most voted")
     page: int = Field(1, ge=1, description="Page number")
     per_page: int = Field(10, ge=1, le=100, description="Results per page")
+    facets: bool = Field(False, description="Include tag, status and date facet counts")
+    facet_interval: str = Field(
+        "month",
+        pattern="^(day|week|month|quarter|year)$",
+        description="Calendar interval for the submission date facet"
+    )
 
 
 class ContentResult(BaseModel):
@@ -23,16 +33,77 @@ class ContentResult(BaseModel):
     status: str
     submission_date: datetime
     media_attachment: Optional[str] = None
+    authentic_count: int = 0
+    false_count: int = 0
+    total_votes: int = 0
     _score: Optional[float] = None
+    highlights: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Highlighted fragments keyed by field name"
+    )
+
+
+class FacetBucket(BaseModel):
+    """Schema for a single facet value and its document count."""
+    key: str
+    count: int
+
+
+class SearchFacets(BaseModel):
+    """Schema for facet counts computed alongside search hits."""
+    tags: List[FacetBucket] = []
+    status: List[FacetBucket] = []
+    submission_date: List[FacetBucket] = []
 
 
 class SearchResponse(BaseModel):
     """Schema for search response."""
     results: List[ContentResult]
     total: int
+    total_is_lower_bound: bool = Field(
+        False,
+        description="Browse listings count at most BROWSE_TRACK_TOTAL_HITS matches; total and pages stop there"
+    )
     page: int
     per_page: int
     pages: int
+    facets: Optional[SearchFacets] = None
+    timed_out: bool = Field(False, description="Some shards hit the search timeout")
+    partial: bool = Field(False, description="Results are missing some shards (timeout or failure)")
+    degraded: bool = Field(False, description="Fuzzy matching was skipped because the service is under load")
+
+
+class MultiSearchRequest(BaseModel):
+    """Schema for a batch of content searches run in one round trip."""
+    searches: List[ContentSearch] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.MULTI_SEARCH_MAX_QUERIES,
+        description="Searches to execute"
+    )
+
+
+class MultiSearchItem(BaseModel):
+    """Schema for the outcome of one search in a batch."""
+    result: Optional[SearchResponse] = None
+    error: Optional[str] = None
+
+
+class MultiSearchResponse(BaseModel):
+    """Schema for multi-search response, in request order."""
+    responses: List[MultiSearchItem]
+
+
+class SuggestResponse(BaseModel):
+    """Schema for type-ahead suggestion response."""
+    query: str
+    suggestions: List[str]
+
+
+class SimilarResponse(BaseModel):
+    """Schema for similar content response, most similar first."""
+    content_id: str
+    results: List[ContentResult]
 
 
 class IndexContent(BaseModel):
@@ -45,3 +116,90 @@ class IndexContent(BaseModel):
     status: str = "pending"
     submission_date: datetime
     media_attachment: Optional[str] = None
+
+
+class BulkIndexRequest(BaseModel):
+    """Schema for indexing a batch of content documents."""
+    documents: List[IndexContent] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_INDEX_MAX_DOCUMENTS,
+        description="Documents to index"
+    )
+
+
+class BulkIndexError(BaseModel):
+    """Schema for a document that failed to index."""
+    content_id: str
+    error: str
+
+
+class BulkIndexResponse(BaseModel):
+    """Schema for bulk indexing response."""
+    message: str
+    indexed: int
+    errors: List[BulkIndexError] = []
+
+
+class SavedSearchCreate(BaseModel):
+    """Schema for creating a saved search alert."""
+    name: str = Field(..., min_length=1, max_length=100, description="Display name")
+    query: str = Field("*", min_length=1, max_length=500, description="Search query string (* to match any text)")
+    status: Optional[str] = Field(None, description="Filter by verification status")
+    tags: Optional[List[str]] = Field(None, description="Filter by tags")
+
+
+class SavedSearchOut(BaseModel):
+    """Schema for a saved search."""
+    id: str
+    name: str
+    query: str
+    status: Optional[str] = None
+    tags: Optional[List[str]] = None
+    created_at: datetime
+
+
+class VoteTally(BaseModel):
+    """Schema for a content item's vote tally published by the Voting Service."""
+    content_id: str
+    authentic_count: int = Field(..., ge=0)
+    false_count: int = Field(..., ge=0)
+    total_votes: int = Field(..., ge=0)
+    status: str = Field(..., description="Verification status derived from the votes")
+    version: int = Field(..., description="Monotonic tally version; older tallies are ignored")
+
+
+class VoteTallyBatch(BaseModel):
+    """Schema for a batch of vote tallies."""
+    tallies: List[VoteTally] = Field(..., min_length=1, max_length=1000)
+
+
+class TopQuery(BaseModel):
+    """Schema for a frequently searched normalized query."""
+    query: str
+    count: int = Field(..., description="Sampled searches for this query")
+    avg_took_ms: Optional[float] = None
+    max_took_ms: Optional[int] = None
+    avg_total: Optional[float] = None
+
+
+class SlowQuery(BaseModel):
+    """Schema for a recorded search slower than ANALYTICS_SLOW_QUERY_MS."""
+    recorded_at: datetime
+    endpoint: str
+    query: str
+    filters: Dict[str, Any]
+    took_ms: Optional[int] = None
+    latency_ms: float
+    total: Optional[int] = None
+    cache: str
+    outcome: str
+
+
+class QueryAnalyticsReport(BaseModel):
+    """Schema for the query analytics report."""
+    hours: float
+    sample_rate: float
+    slow_query_ms: float
+    top_queries: List[TopQuery]
+    slow_queries: List[SlowQuery]
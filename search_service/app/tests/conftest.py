@@ -0,0 +1,53 @@
+# Set test environment variables BEFORE any app imports
+# This ensures settings are loaded with test configuration
+import os
+os.environ["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "test-secret-key-for-testing-only-do-not-use-in-production")
+
+import pytest
+from app.db.embedded import EmbeddedIndex
+
+
+@pytest.fixture
+def index_path(tmp_path) -> str:
+    """Location of a fresh embedded index log."""
+    return str(tmp_path / "content_index.log")
+
+
+@pytest.fixture
+def index(index_path):
+    """Open an empty embedded index, closed after the test."""
+    index = EmbeddedIndex(index_path)
+    index.open()
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def sample_documents() -> dict:
+    """Content documents keyed by content_id."""
+    return {
+        "c1": {
+            "content_id": "c1",
+            "author_id": "a1",
+            "content_text": "New vaccine trial results published by the ministry",
+            "tags": ["health", "vaccines"],
+            "status": "verified",
+            "submission_date": "2024-03-01T10:00:00Z"
+        },
+        "c2": {
+            "content_id": "c2",
+            "author_id": "a2",
+            "content_text": "Election turnout figures disputed by observers",
+            "tags": ["politics"],
+            "status": "disputed",
+            "submission_date": "2024-03-02T10:00:00Z"
+        },
+        "c3": {
+            "content_id": "c3",
+            "author_id": "a1",
+            "content_text": "Vaccine side effects rumour spreads online",
+            "tags": ["health"],
+            "status": "false",
+            "submission_date": "2024-03-03T10:00:00Z"
+        }
+    }
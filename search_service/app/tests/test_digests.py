@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+from fastapi import BackgroundTasks
+import app.db.elasticsearch as es
+from app.api.v1.endpoints.search import index_document, update_document
+from app.core.digests import content_digest, digest_string, hashed_index_key
+from app.schemas.search import IndexContent
+
+
+class RecordingClient:
+    """Elasticsearch client stand-in recording indexed and updated documents."""
+    
+    def __init__(self):
+        self.indexed = {}
+        self.updated = {}
+    
+    async def index(self, index, id, document, routing=None):
+        self.indexed[id] = document
+    
+    async def update(self, index, id, doc, routing=None):
+        self.updated[id] = doc
+
+
+def content(**fields) -> IndexContent:
+    return IndexContent(
+        content_id="65f1c2a4e4b0a1b2c3d4e5f6",
+        author_id="a1",
+        content_text="Vaccine trial results published",
+        tags=["vaccines", "health"],
+        submission_date=datetime(2024, 3, 1, 10, 0, 0, 123456, tzinfo=timezone.utc),
+        **fields
+    )
+
+
+def test_hashed_index_key_matches_mongodb():
+    """Test the hash against MongoDB's documented $toHashedIndexKey example."""
+    assert hashed_index_key("string to hash") == 763543691661428748
+
+
+def test_digest_string_normalization():
+    """Test that tag order, date formats and None vs "" are handled like MongoDB."""
+    document = {"author_id": "a1", "tags": ["b", "a"], "submission_date": "2024-03-01T10:00:00.123Z", "content_url": ""}
+    same = {"author_id": "a1", "tags": ["a", "b"], "submission_date": datetime(2024, 3, 1, 10, 0, 0, 123999)}
+    
+    assert digest_string("c1", document).split("\x1f") == ["c1", "sa1", "s", "n", "t\x1ea\x1eb", "d1709287200123", "n"]
+    assert content_digest("c1", {**document, "content_url": None}) == content_digest("c1", same)
+    assert content_digest("c1", document) != content_digest("c1", same)
+    assert 0 <= content_digest("c1", document) < 2 ** 32
+
+
+async def test_index_route_keeps_content_id_and_digest(monkeypatch):
+    """Test that a document indexed through /index can be found by id range and digest."""
+    client = RecordingClient()
+    monkeypatch.setattr(es, "es_client", client)
+    
+    await index_document(content(), BackgroundTasks(), {"user_id": "u1"}, es.ElasticsearchBackend())
+    
+    document = client.indexed["65f1c2a4e4b0a1b2c3d4e5f6"]
+    assert document["content_id"] == "65f1c2a4e4b0a1b2c3d4e5f6"
+    assert document["content_digest"] == content_digest("65f1c2a4e4b0a1b2c3d4e5f6", content().model_dump())
+
+
+async def test_update_route_recomputes_digest(monkeypatch):
+    """Test that full updates rewrite the digest and partial ones clear it."""
+    client = RecordingClient()
+    monkeypatch.setattr(es, "es_client", client)
+    
+    await update_document("65f1c2a4e4b0a1b2c3d4e5f6", content(media_attachment="clip.mp4"), {"user_id": "u1"}, es.ElasticsearchBackend())
+    
+    document = client.updated["65f1c2a4e4b0a1b2c3d4e5f6"]
+    assert document["content_id"] == "65f1c2a4e4b0a1b2c3d4e5f6"
+    assert document["content_digest"] == content_digest("65f1c2a4e4b0a1b2c3d4e5f6", content(media_attachment="clip.mp4").model_dump())
+    
+    await es.update_content("65f1c2a4e4b0a1b2c3d4e5f6", {"content_url": "https://example.org"})
+    assert client.updated["65f1c2a4e4b0a1b2c3d4e5f6"]["content_digest"] is None
+    
+    await es.update_content("65f1c2a4e4b0a1b2c3d4e5f6", {"status": "verified"})
+    assert "content_digest" not in client.updated["65f1c2a4e4b0a1b2c3d4e5f6"]
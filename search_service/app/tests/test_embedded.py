@@ -0,0 +1,214 @@
+import pytest
+import app.db.embedded as embedded
+from app.db.backend import DocumentNotFoundError, SearchBackend
+from app.db.embedded import EmbeddedIndex, EmbeddedSearchBackend, edit_distance, fuzziness, RECORD_HEADER, OP_PUT
+
+
+def index_documents(index: EmbeddedIndex, documents: dict):
+    for content_id, document in documents.items():
+        index.put(content_id, document)
+
+
+def result_ids(response: dict) -> list:
+    return [result["content_id"] for result in response["results"]]
+
+
+def test_search_scores_and_filters(index: EmbeddedIndex, sample_documents: dict):
+    """Test full-text search with status, tag and author filters."""
+    index_documents(index, sample_documents)
+    
+    response = index.search("vaccine")
+    assert response["total"] == 2
+    assert result_ids(response) == ["c3", "c1"]
+    assert all(result["_score"] > 0 for result in response["results"])
+    assert "<mark>Vaccine</mark>" in response["results"][0]["highlights"]["content_text"][0]
+    
+    assert result_ids(index.search("vaccine", status="verified")) == ["c1"]
+    assert result_ids(index.search("vaccine", tags=["vaccines"])) == ["c1"]
+    assert result_ids(index.search("*", author_id="a1")) == ["c3", "c1"]
+    assert index.search("nonexistent")["total"] == 0
+
+
+def test_browse_sorts_newest_first(index: EmbeddedIndex, sample_documents: dict):
+    """Test that browse queries list every document newest first."""
+    index_documents(index, sample_documents)
+    
+    response = index.search("", per_page=2)
+    assert result_ids(response) == ["c3", "c2"]
+    assert response["total"] == 3
+    assert response["pages"] == 2
+    assert response["total_is_lower_bound"] is False
+    assert result_ids(index.search("*", page=2, per_page=2)) == ["c1"]
+
+
+def test_browse_total_is_lower_bound(index: EmbeddedIndex, sample_documents: dict, monkeypatch):
+    """Test that browse totals past BROWSE_TRACK_TOTAL_HITS are flagged."""
+    monkeypatch.setattr(embedded.settings, "BROWSE_TRACK_TOTAL_HITS", 2)
+    index_documents(index, sample_documents)
+    
+    response = index.search("*")
+    assert response["total"] == 2
+    assert response["total_is_lower_bound"] is True
+
+
+def test_fuzzy_matching(index: EmbeddedIndex, sample_documents: dict):
+    """Test that misspelled terms match like fuzziness AUTO."""
+    index_documents(index, sample_documents)
+    
+    response = index.search("vaccin")
+    assert set(result_ids(response)) == {"c1", "c3"}
+    assert "<mark>vaccine</mark>" in response["results"][1]["highlights"]["content_text"][0]
+    assert set(result_ids(index.search("elecion turnuot"))) == {"c2"}
+    
+    # Exact matches outrank fuzzy ones
+    index.put("c4", {**sample_documents["c1"], "content_id": "c4", "content_text": "vaccin", "tags": []})
+    scores = {result["content_id"]: result["_score"] for result in index.search("vaccin")["results"]}
+    assert scores["c4"] > scores["c1"]
+    
+    assert index.search("vaccin", fuzzy=False)["total"] == 1
+
+
+def test_fuzziness_and_edit_distance():
+    """Test the AUTO fuzziness bands and transposition-aware distance."""
+    assert [fuzziness(term) for term in ("ab", "abc", "abcde", "abcdef")] == [0, 1, 1, 2]
+    assert edit_distance("vaccin", "vaccine", 2) == 1
+    assert edit_distance("turnuot", "turnout", 2) == 1
+    assert edit_distance("kitten", "sitting", 2) == 3
+    assert edit_distance("abc", "abcdef", 2) == 3
+
+
+def test_update_and_delete(index: EmbeddedIndex, sample_documents: dict):
+    """Test partial updates and deletes of indexed documents."""
+    index_documents(index, sample_documents)
+    
+    index.update("c2", {"content_text": "Vaccine election claims", "status": "verified"})
+    assert index.get("c2")["tags"] == ["politics"]
+    assert set(result_ids(index.search("vaccine", status="verified"))) == {"c1", "c2"}
+    assert index.search("turnout")["total"] == 0
+    
+    index.delete("c1")
+    assert len(index) == 2
+    assert result_ids(index.search("vaccine")) == ["c3", "c2"]
+    with pytest.raises(DocumentNotFoundError):
+        index.get("c1")
+    with pytest.raises(DocumentNotFoundError):
+        index.delete("c1")
+    with pytest.raises(DocumentNotFoundError):
+        index.update("c1", {"status": "false"})
+
+
+def test_reopen_replays_log(index_path: str, sample_documents: dict):
+    """Test that a reopened index has the same documents and terms."""
+    index = EmbeddedIndex(index_path)
+    index.open()
+    index_documents(index, sample_documents)
+    index.update("c2", {"status": "verified"})
+    index.delete("c3")
+    index.close()
+    
+    reopened = EmbeddedIndex(index_path)
+    reopened.open()
+    try:
+        assert len(reopened) == 2
+        assert reopened.get("c2")["status"] == "verified"
+        assert result_ids(reopened.search("vaccine")) == ["c1"]
+        assert reopened.suggest("elec") == ["Election turnout figures disputed by observers"]
+    finally:
+        reopened.close()
+
+
+def test_reopen_drops_torn_tail(index_path: str, sample_documents: dict):
+    """Test that a partially written last record is ignored and truncated."""
+    index = EmbeddedIndex(index_path)
+    index.open()
+    index_documents(index, sample_documents)
+    index.close()
+    
+    size = len(open(index_path, "rb").read())
+    with open(index_path, "ab") as f:
+        f.write(RECORD_HEADER.pack(OP_PUT, 100) + b'{"id": "c4", "doc"')
+    
+    reopened = EmbeddedIndex(index_path)
+    reopened.open()
+    try:
+        assert len(reopened) == 3
+        reopened.put("c4", {**sample_documents["c1"], "content_id": "c4"})
+    finally:
+        reopened.close()
+    
+    assert len(open(index_path, "rb").read()) > size
+    again = EmbeddedIndex(index_path)
+    again.open()
+    try:
+        assert len(again) == 4
+    finally:
+        again.close()
+
+
+def test_compaction(index_path: str, sample_documents: dict, monkeypatch):
+    """Test that compaction drops dead records and keeps live documents."""
+    monkeypatch.setattr(embedded, "COMPACTION_MIN_BYTES", 0)
+    index = EmbeddedIndex(index_path)
+    index.open()
+    index_documents(index, sample_documents)
+    for status in ("pending", "verified", "false", "disputed"):
+        index.update("c2", {"status": status})
+    index.delete("c3")
+    
+    # Dead records were dropped automatically as they accumulated
+    log_size = len(open(index_path, "rb").read())
+    assert index._live_bytes > log_size * (1 - embedded.COMPACTION_RATIO)
+    
+    index.compact()
+    assert len(open(index_path, "rb").read()) == index._live_bytes
+    assert index.get("c2")["status"] == "disputed"
+    assert result_ids(index.search("vaccine")) == ["c1"]
+    index.close()
+    
+    reopened = EmbeddedIndex(index_path)
+    reopened.open()
+    try:
+        assert len(reopened) == 2
+        assert reopened.get("c2")["status"] == "disputed"
+        assert result_ids(reopened.search("election")) == ["c2"]
+    finally:
+        reopened.close()
+
+
+def test_facets(index: EmbeddedIndex, sample_documents: dict):
+    """Test tag, status and date facets over matched documents."""
+    index_documents(index, sample_documents)
+    
+    facets = index.search("vaccine", facets=True, facet_interval="month")["facets"]
+    assert {"key": "health", "count": 2} in facets["tags"]
+    assert sorted(bucket["key"] for bucket in facets["status"]) == ["false", "verified"]
+    assert facets["submission_date"] == [{"key": "2024-03-01T00:00:00.000Z", "count": 2}]
+
+
+async def test_backend_apply_tallies(index_path: str, sample_documents: dict):
+    """Test that tallies only apply when newer than the stored version."""
+    backend = EmbeddedSearchBackend(index_path)
+    await backend.connect()
+    try:
+        await backend.bulk_index_content([dict(document) for document in sample_documents.values()])
+        tally = {"content_id": "c1", "authentic_count": 3, "false_count": 1, "total_votes": 4, "status": "verified"}
+        
+        report = await backend.apply_tallies([{**tally, "version": 2}, {"content_id": "missing", "version": 1}])
+        assert report == {"updated": 1, "missing": 1, "failed": 0}
+        await backend.apply_tallies([{**tally, "total_votes": 1, "version": 1}])
+        
+        response = await backend.search_content("*", min_votes=2)
+        assert result_ids(response) == ["c1"]
+        assert response["results"][0]["total_votes"] == 4
+    finally:
+        await backend.disconnect()
+
+
+def test_backend_requires_abstract_methods():
+    """Test that backends missing required methods cannot be created."""
+    class IncompleteBackend(SearchBackend):
+        async def connect(self):
+            pass
+    
+    with pytest.raises(TypeError):
+        IncompleteBackend()
@@ -0,0 +1,62 @@
+import asyncio
+import pytest
+from elastic_transport import AsyncTransport, ConnectionTimeout
+from app.db import resilience
+from app.db.resilience import CLOSED, OPEN, create_elasticsearch_client
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """A resilient transport whose circuit opens after one failure."""
+    monkeypatch.setattr(resilience.settings, "ELASTICSEARCH_CIRCUIT_FAILURE_THRESHOLD", 1)
+    return create_elasticsearch_client().transport
+
+
+def node_timeout(calls: list, wait: bool):
+    """Node request stand-in that times out, after the request timeout when wait is set."""
+    async def perform_request(self, method, target, **kwargs):
+        calls.append(kwargs.get("request_timeout"))
+        if wait:
+            await asyncio.sleep(kwargs["request_timeout"])
+        raise ConnectionTimeout("timed out")
+    return perform_request
+
+
+async def test_deadline_timeout_is_not_a_breaker_failure(transport, monkeypatch):
+    """Test that running out of the request's own deadline keeps the circuit closed."""
+    calls = []
+    monkeypatch.setattr(AsyncTransport, "perform_request", node_timeout(calls, wait=True))
+    
+    with pytest.raises(ConnectionTimeout):
+        await transport.perform_request("POST", "/content_index/_search", request_timeout=0.1)
+    
+    assert len(calls) == 1
+    assert transport.breaker.state == CLOSED
+    assert transport.metrics["deadline_timeouts"] == 1
+    assert transport.metrics["failures"] == 0
+
+
+async def test_early_timeout_is_a_breaker_failure(transport, monkeypatch):
+    """Test that a timeout well before the deadline counts against the cluster."""
+    calls = []
+    monkeypatch.setattr(AsyncTransport, "perform_request", node_timeout(calls, wait=False))
+    
+    with pytest.raises(ConnectionTimeout):
+        await transport.perform_request("POST", "/content_index/_search", request_timeout=5.0)
+    
+    assert len(calls) == 1
+    assert transport.breaker.state == OPEN
+    assert transport.metrics["failures"] == 1
+
+
+async def test_timeout_without_deadline_is_retried(transport, monkeypatch):
+    """Test that reads using the client default timeout are retried on timeout."""
+    transport.breaker.failure_threshold = 10
+    calls = []
+    monkeypatch.setattr(AsyncTransport, "perform_request", node_timeout(calls, wait=False))
+    
+    with pytest.raises(ConnectionTimeout):
+        await transport.perform_request("POST", "/content_index/_search")
+    
+    assert len(calls) == 1 + resilience.settings.ELASTICSEARCH_MAX_RETRIES
+    assert transport.metrics["failures"] == len(calls)
@@ -0,0 +1,54 @@
+import asyncio
+import app.core.tallies as tallies
+from app.core.tallies import TallyConsumer
+
+
+class RecordingBackend:
+    """Search backend stub recording applied tallies, optionally blocking."""
+    
+    def __init__(self, block: bool = False):
+        self.applied = []
+        self.block = block
+        self.started = asyncio.Event()
+    
+    async def apply_tallies(self, batch: list):
+        self.started.set()
+        if self.block:
+            self.block = False
+            await asyncio.Event().wait()
+        self.applied.extend(batch)
+        return {"updated": len(batch), "missing": 0, "failed": 0}
+
+
+def tally(content_id: str, version: int) -> dict:
+    return {"content_id": content_id, "authentic_count": version, "false_count": 0, "total_votes": version, "version": version}
+
+
+async def test_submit_keeps_newest_version(monkeypatch):
+    """Test that tallies are coalesced per content item by version."""
+    backend = RecordingBackend()
+    monkeypatch.setattr(tallies, "get_search_backend", lambda: backend)
+    consumer = TallyConsumer()
+    
+    consumer.submit([tally("c1", 2), tally("c1", 1), tally("c2", 1), tally("c1", 3)])
+    await consumer.flush()
+    
+    assert sorted((t["content_id"], t["version"]) for t in backend.applied) == [("c1", 3), ("c2", 1)]
+    assert consumer.metrics()["superseded"] == 1
+
+
+async def test_stop_during_flush_keeps_batch(monkeypatch):
+    """Test that a batch in flight when stop() cancels the loop is written."""
+    backend = RecordingBackend(block=True)
+    monkeypatch.setattr(tallies, "get_search_backend", lambda: backend)
+    consumer = TallyConsumer()
+    consumer.start()
+    
+    consumer.submit([tally("c1", 1)])
+    consumer._wakeup.set()
+    await backend.started.wait()
+    consumer.submit([tally("c2", 1)])
+    await consumer.stop()
+    
+    assert sorted(t["content_id"] for t in backend.applied) == ["c1", "c2"]
+    assert consumer.metrics()["pending"] == 0
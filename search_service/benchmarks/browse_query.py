@@ -0,0 +1,89 @@
+"""
+Compare latency of browse queries before and after the match-all fast path.
+
+The legacy path sends query="*" through the fuzzy multi_match used for
+full-text search. The fast path runs the same request as a filter-only,
+date-sorted query with a capped total hit count.
+
+Usage (from the search_service directory):
+    python -m benchmarks.browse_query --docs 200000 --iterations 200
+"""
+from elasticsearch import AsyncElasticsearch
+import argparse
+import asyncio
+
+from app.core.config import settings
+from app.db.elasticsearch import build_search_query
+from benchmarks.common import load_elasticsearch_corpus, time_async, summarize
+
+BENCH_INDEX = "content_index_bench_browse"
+
+
+def legacy_browse_query(status=None, tags=None) -> dict:
+    """Build the query the search endpoint sent for query="*" previously."""
+    filter_clauses = []
+    if status:
+        filter_clauses.append({"term": {"status": status}})
+    if tags:
+        filter_clauses.append({"terms": {"tags": tags}})
+        
+    return {
+        "bool": {
+            "must": [{
+                "multi_match": {
+                    "query": "*",
+                    "fields": ["content_text^2", "content_url", "tags"],
+                    "type": "best_fields",
+                    "fuzziness": "AUTO"
+                }
+            }],
+            "filter": filter_clauses
+        }
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--status", default=None, help="Optional status filter")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark index")
+    args = parser.parse_args()
+    
+    client = AsyncElasticsearch([settings.ELASTICSEARCH_URL])
+    try:
+        print(f"Loading {args.docs} documents into {BENCH_INDEX}...")
+        await load_elasticsearch_corpus(client, BENCH_INDEX, args.docs)
+        
+        sort = [{"submission_date": {"order": "desc"}}]
+        
+        async def legacy():
+            await client.search(
+                index=BENCH_INDEX,
+                query=legacy_browse_query(status=args.status),
+                size=20,
+                sort=sort,
+                request_cache=False
+            )
+            
+        async def fast_path():
+            await client.search(
+                index=BENCH_INDEX,
+                query=build_search_query("*", status=args.status),
+                size=20,
+                sort=sort,
+                track_total_hits=settings.BROWSE_TRACK_TOTAL_HITS,
+                request_cache=False
+            )
+            
+        print(summarize("legacy fuzzy multi_match", await time_async(legacy, args.iterations)))
+        print(summarize("browse fast path", await time_async(fast_path, args.iterations)))
+        
+    finally:
+        if not args.keep:
+            await client.indices.delete(index=BENCH_INDEX, ignore_unavailable=True)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
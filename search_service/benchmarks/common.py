@@ -0,0 +1,138 @@
+"""
+Shared helpers for search_service benchmarks.
+
+Benchmarks run against the Elasticsearch cluster configured by
+ELASTICSEARCH_URL and load a synthetic corpus into a throwaway index so
+the production content_index is never touched.
+"""
+from datetime import datetime, timedelta, timezone
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import async_bulk
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+import random
+import statistics
+import time
+
+WORDS = [
+    "vaccine", "election", "climate", "study", "report", "claim", "video",
+    "photo", "senator", "minister", "economy", "inflation", "water", "virus",
+    "border", "police", "court", "ruling", "budget", "tax", "school", "energy",
+    "fuel", "price", "market", "storm", "flood", "fire", "health", "doctor",
+    "hospital", "protest", "crowd", "speech", "quote", "statistic", "survey",
+    "science", "research", "data", "official", "government", "law", "bill"
+]
+TAGS = [
+    "politics", "health", "science", "climate", "economy", "sports",
+    "technology", "world", "local", "entertainment"
+]
+STATUSES = ["pending", "verified", "disputed", "false"]
+
+
+def generate_documents(count: int, seed: int = 42) -> Iterator[Dict]:
+    """
+    Generate synthetic content documents shaped like IndexContent.
+    
+    Args:
+        count: Number of documents to generate
+        seed: Random seed for a reproducible corpus
+        
+    Yields:
+        Content document dictionaries including content_id
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    
+    for i in range(count):
+        yield {
+            "content_id": f"bench-{i:08d}",
+            "author_id": f"author-{rng.randrange(max(count // 50, 1)):06d}",
+            "content_url": None,
+            "content_text": " ".join(rng.choices(WORDS, k=rng.randint(20, 80))),
+            "tags": rng.sample(TAGS, k=rng.randint(1, 3)),
+            "status": rng.choice(STATUSES),
+            "submission_date": (start + timedelta(minutes=i)).isoformat(),
+            "media_attachment": None
+        }
+
+
+async def load_elasticsearch_corpus(
+    client: AsyncElasticsearch,
+    index_name: str,
+    docs: int,
+    settings: Optional[Dict] = None
+):
+    """
+    Recreate a benchmark index and bulk load a synthetic corpus into it.
+    
+    Args:
+        client: Elasticsearch client
+        index_name: Throwaway index to (re)create
+        docs: Number of documents to load
+        settings: Extra index settings merged over the defaults
+    """
+    from app.db.elasticsearch import CONTENT_INDEX_PROPERTIES
+    
+    if await client.indices.exists(index=index_name):
+        await client.indices.delete(index=index_name)
+    await client.indices.create(
+        index=index_name,
+        mappings={"properties": CONTENT_INDEX_PROPERTIES},
+        settings={"number_of_shards": 1, "number_of_replicas": 0, **(settings or {})}
+    )
+    
+    actions = (
+        {"_index": index_name, "_id": doc.pop("content_id"), "_source": doc}
+        for doc in generate_documents(docs)
+    )
+    await async_bulk(client, actions, chunk_size=2000)
+    await client.indices.refresh(index=index_name)
+
+
+async def time_async(
+    func: Callable[[], Awaitable],
+    iterations: int,
+    warmup: int = 10
+) -> List[float]:
+    """
+    Time repeated calls of an async function.
+    
+    Args:
+        func: Zero-argument coroutine function to time
+        iterations: Number of timed calls
+        warmup: Number of untimed calls made first
+        
+    Returns:
+        List of call latencies in milliseconds
+    """
+    for _ in range(warmup):
+        await func()
+        
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await func()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def summarize(name: str, latencies: List[float]) -> str:
+    """
+    Format latency percentiles for a benchmark run.
+    
+    Args:
+        name: Label for the benchmark case
+        latencies: Latencies in milliseconds
+        
+    Returns:
+        Single-line summary with mean, p50, p95 and p99
+    """
+    ordered = sorted(latencies)
+    
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+        
+    return (
+        f"{name:<28} mean={statistics.mean(ordered):8.2f}ms "
+        f"p50={percentile(0.50):8.2f}ms p95={percentile(0.95):8.2f}ms "
+        f"p99={percentile(0.99):8.2f}ms"
+    )
@@ -0,0 +1,103 @@
+"""
+Compare the embedded search backend against Elasticsearch on one corpus.
+
+Both backends are loaded with the same synthetic corpus and answer the
+same mix of text searches, filtered searches and browse listings through
+their SearchBackend search_content implementation. Pass --skip-es to
+only measure the embedded engine (no cluster required).
+
+Usage (from the search_service directory):
+    python -m benchmarks.embedded_vs_elasticsearch --docs 100000 --iterations 200
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import app.db.elasticsearch as elasticsearch_db
+from app.core.config import settings
+from app.db.elasticsearch import ElasticsearchBackend
+from app.db.embedded import EmbeddedSearchBackend
+from benchmarks.common import (
+    WORDS,
+    TAGS,
+    STATUSES,
+    generate_documents,
+    load_elasticsearch_corpus,
+    time_async,
+    summarize
+)
+
+BENCH_INDEX = "content_index_bench_embedded"
+
+
+def query_cases(seed: int = 7) -> dict:
+    """Build cycling argument generators for each benchmark case."""
+    rng = random.Random(seed)
+    text = [" ".join(rng.sample(WORDS, 2)) for _ in range(50)]
+    return {
+        "text search": itertools.cycle(
+            {"query": q} for q in text
+        ),
+        "text search + status": itertools.cycle(
+            {"query": q, "status": rng.choice(STATUSES)} for q in text
+        ),
+        "browse + tag filter": itertools.cycle(
+            {"query": "*", "tags": [tag]} for tag in TAGS
+        ),
+        "browse + facets": itertools.cycle(
+            [{"query": "*", "facets": True}]
+        )
+    }
+
+
+async def run_cases(name: str, backend, iterations: int):
+    """Time every query case against one backend."""
+    for case, arguments in query_cases().items():
+        async def call():
+            await backend.search_content(**next(arguments), per_page=20)
+        print(summarize(f"{name}: {case}", await time_async(call, iterations)))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--skip-es", action="store_true", help="Only benchmark the embedded engine")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        embedded = EmbeddedSearchBackend(str(Path(directory) / "bench.log"))
+        await embedded.connect()
+        
+        started = time.perf_counter()
+        for doc in generate_documents(args.docs):
+            await embedded.index_content(doc.pop("content_id"), doc)
+        print(f"embedded: indexed {args.docs} documents in {time.perf_counter() - started:.1f}s")
+        
+        await run_cases("embedded", embedded, args.iterations)
+        await embedded.disconnect()
+        
+    if args.skip_es:
+        return
+        
+    # Point the Elasticsearch backend at a throwaway index
+    settings.ELASTICSEARCH_INDEX = BENCH_INDEX
+    backend = ElasticsearchBackend()
+    await backend.connect()
+    try:
+        started = time.perf_counter()
+        await load_elasticsearch_corpus(elasticsearch_db.es_client, BENCH_INDEX, args.docs)
+        print(f"elasticsearch: indexed {args.docs} documents in {time.perf_counter() - started:.1f}s")
+        
+        await run_cases("elasticsearch", backend, args.iterations)
+    finally:
+        await elasticsearch_db.es_client.indices.delete(index=BENCH_INDEX, ignore_unavailable=True)
+        await backend.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+Compare date-sorted search latency with and without index sorting.
+
+Loads the same corpus into an unsorted index and an index sorted by
+submission_date (newest first), force-merges both to a fixed segment
+count, then times the date-sorted filter queries served by
+search_content. With index sorting, collection stops early in each
+segment once the page and the total hit threshold are filled.
+
+Usage (from the search_service directory):
+    python -m benchmarks.index_sorting --docs 1000000 --iterations 500
+"""
+from elasticsearch import AsyncElasticsearch
+import argparse
+import asyncio
+
+from app.core.config import settings
+from app.db.elasticsearch import SUBMISSION_DATE_INDEX_SORT, build_search_body
+from benchmarks.common import load_elasticsearch_corpus, time_async, summarize
+
+UNSORTED_INDEX = "content_index_bench_unsorted"
+SORTED_INDEX = "content_index_bench_sorted"
+
+# (label, build_search_body arguments, track_total_hits override)
+CASES = [
+    ("browse", {"query": "*"}, None),
+    ("browse no totals", {"query": "*"}, False),
+    ("status filter", {"query": "*", "status": "verified"}, None),
+    ("tags filter", {"query": "*", "tags": ["health", "science"]}, None),
+    ("status+tags no totals", {"query": "*", "status": "false", "tags": ["politics"]}, False),
+    # Full-text searches are date-sorted too but keep the default 10,000
+    # total hits, so collection cannot stop before that many matches
+    ("text search", {"query": "vaccine", "fuzzy": False}, None),
+]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=1000000)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--segments", type=int, default=10, help="Segments per index after force merge")
+    parser.add_argument("--skip-load", action="store_true", help="Reuse indexes from a previous --keep run")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark indexes")
+    args = parser.parse_args()
+    
+    client = AsyncElasticsearch([settings.ELASTICSEARCH_URL], request_timeout=3600)
+    try:
+        if not args.skip_load:
+            for index_name, index_settings in [(UNSORTED_INDEX, None), (SORTED_INDEX, SUBMISSION_DATE_INDEX_SORT)]:
+                print(f"Loading {args.docs} documents into {index_name}...")
+                await load_elasticsearch_corpus(client, index_name, args.docs, settings=index_settings)
+                await client.indices.forcemerge(index=index_name, max_num_segments=args.segments)
+        
+        for label, search, track_total_hits in CASES:
+            body = build_search_body(**search, per_page=20)
+            body.pop("highlight")
+            if track_total_hits is not None:
+                body["track_total_hits"] = track_total_hits
+            
+            for index_name, name in [(UNSORTED_INDEX, "unsorted"), (SORTED_INDEX, "sorted")]:
+                async def run():
+                    await client.search(index=index_name, request_cache=False, **body)
+                
+                print(summarize(f"{label} [{name}]", await time_async(run, args.iterations)))
+    
+    finally:
+        if not args.keep:
+            await client.indices.delete(index=[UNSORTED_INDEX, SORTED_INDEX], ignore_unavailable=True)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
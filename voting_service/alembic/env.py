@@ -10,7 +10,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 # Import models and config
 from app.db.base import Base
-from app.models import Vote
+from app.models import Vote, VoteTally, VoterReputation, VoteVelocity
 from app.core.config import settings
 
 # this is the Alembic Config object
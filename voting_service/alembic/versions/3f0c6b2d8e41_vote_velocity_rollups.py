@@ -0,0 +1,39 @@
+"""vote velocity rollups
+
+Minute and hour vote counts per content item for GET /votes/trending.
+Skipped if the table was already created by Base.metadata.create_all
+at startup.
+
+Revision ID: 3f0c6b2d8e41
+Revises: 759aeb57fd5e
+Create Date: 2026-10-18 14:05:22.617390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '3f0c6b2d8e41'
+down_revision = '759aeb57fd5e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if "vote_velocity" in sa.inspect(op.get_bind()).get_table_names():
+        return
+    
+    op.create_table(
+        "vote_velocity",
+        sa.Column("resolution", sa.String(length=10), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("content_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("vote_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("resolution", "bucket_start", "content_id")
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("vote_velocity")
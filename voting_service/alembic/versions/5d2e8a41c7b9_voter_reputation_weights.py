@@ -0,0 +1,62 @@
+"""voter reputation weights
+
+Adds the weight each vote was cast with, the per-type weighted sums of
+vote_tallies and the voter_reputations table. Columns and tables that
+already exist (created by Base.metadata.create_all at startup) are
+skipped. Votes cast so far all weigh 1, so newly added tally weights
+are backfilled from the counts.
+
+Revision ID: 5d2e8a41c7b9
+Revises: ad9f1976e679
+Create Date: 2026-10-19 10:02:37.411853
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2e8a41c7b9'
+down_revision = 'ad9f1976e679'
+branch_labels = None
+depends_on = None
+
+TALLY_WEIGHTS = {
+    "authentic_weight": "authentic_count",
+    "false_weight": "false_count",
+    "unsure_weight": "unsure_count"
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    
+    if "weight" not in {column["name"] for column in inspector.get_columns("votes")}:
+        op.add_column("votes", sa.Column("weight", sa.Float(), server_default="1", nullable=False))
+    
+    tally_columns = {column["name"] for column in inspector.get_columns("vote_tallies")}
+    added = [name for name in TALLY_WEIGHTS if name not in tally_columns]
+    for name in added:
+        op.add_column("vote_tallies", sa.Column(name, sa.Float(), server_default="0", nullable=False))
+    if added:
+        op.execute(
+            "UPDATE vote_tallies SET " + ", ".join(f"{name} = {TALLY_WEIGHTS[name]}" for name in added)
+        )
+    
+    if "voter_reputations" not in inspector.get_table_names():
+        op.create_table(
+            "voter_reputations",
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("weight", sa.Float(), nullable=False),
+            sa.Column("agreed_votes", sa.Integer(), nullable=False),
+            sa.Column("decided_votes", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False)
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("voter_reputations")
+    for name in TALLY_WEIGHTS:
+        op.drop_column("vote_tallies", name)
+    op.drop_column("votes", "weight")
@@ -0,0 +1,36 @@
+"""user vote history index
+
+Composite index for keyset pagination of GET /votes/user/votes on
+(user_id, voted_at, id). Built CONCURRENTLY so voting continues while
+it is created on a large votes table.
+
+Revision ID: 759aeb57fd5e
+Revises: 5d2e8a41c7b9
+Create Date: 2026-10-18 09:31:07.904512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '759aeb57fd5e'
+down_revision = '5d2e8a41c7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_votes_user_voted_at_id",
+            "votes",
+            ["user_id", "voted_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_votes_user_voted_at_id", table_name="votes", postgresql_concurrently=True)
@@ -0,0 +1,57 @@
+"""initial schema
+
+Creates the votes and vote_tallies tables the service used to create
+only through Base.metadata.create_all at startup. Tables that already
+exist (created that way) are left as they are.
+
+Revision ID: ad9f1976e679
+Revises: 
+Create Date: 2026-10-18 09:12:44.318276
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'ad9f1976e679'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+    
+    if "votes" not in tables:
+        op.create_table(
+            "votes",
+            sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("content_id", postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column("vote_type", sa.Enum("AUTHENTIC", "FALSE", "UNSURE", name="votetype"), nullable=False),
+            sa.Column("reasoning", sa.Text(), nullable=True),
+            sa.Column("voted_at", sa.DateTime(), nullable=False),
+            sa.UniqueConstraint("user_id", "content_id", name="uq_user_content_vote")
+        )
+        op.create_index("ix_votes_user_id", "votes", ["user_id"])
+        op.create_index("ix_votes_content_id", "votes", ["content_id"])
+    
+    if "vote_tallies" not in tables:
+        op.create_table(
+            "vote_tallies",
+            sa.Column("content_id", postgresql.UUID(as_uuid=True), primary_key=True),
+            sa.Column("authentic_count", sa.Integer(), nullable=False),
+            sa.Column("false_count", sa.Integer(), nullable=False),
+            sa.Column("unsure_count", sa.Integer(), nullable=False),
+            sa.Column("version", sa.BigInteger(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False)
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("vote_tallies")
+    op.drop_table("votes")
+    sa.Enum(name="votetype").drop(op.get_bind(), checkfirst=True)
@@ -1,16 +1,27 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks, Response, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, tuple_
 from sqlalchemy.exc import IntegrityError
-from typing import Dict, Any
+from datetime import datetime
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 import logging
 
-from app.schemas.vote import VoteCreate, VoteOut, VoteResults
-from app.models.vote import Vote, VoteType
-from app.db.base import get_db
+from app.schemas.vote import (
+    VoteCreate, VoteUpdate, VoteOut, VoteResults, VoteResultsBatchRequest, VoteResultsBatch,
+    UserVotesBatchRequest, UserVotesBatch, TrendingContent
+)
+from app.models.vote import Vote, VoteTally
+from app.db.base import get_db, SessionLocal
+from app.db.tallies import increment_tally, get_tallies
+from app.db.reputation import get_voter_weight
 from app.api.dependencies import get_current_user
 from app.core.config import settings
+from app.core.search_sync import publish_vote_tally
+from app.core.results_cache import results_cache
+from app.core.vote_ingest import vote_ingestor, IngestQueueFull
+from app.core.vote_velocity import vote_velocity, top_velocity
+from app.core.pagination import NEXT_CURSOR_HEADER, encode_cursor, decode_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -39,55 +50,296 @@ def calculate_verification_status(
         return "disputed"
 
 
+def build_vote_results(
+    content_id: UUID,
+    authentic_count: int,
+    false_count: int,
+    unsure_count: int,
+    authentic_weight: float,
+    false_weight: float,
+    unsure_weight: float
+) -> VoteResults:
+    """
+    Derive percentages and verification status from vote counts.
+    
+    The verification status is decided on reputation-weighted shares, so
+    voters who usually agree with final outcomes count for more.
+    
+    Args:
+        content_id: ID of the content
+        authentic_count: Number of authentic votes
+        false_count: Number of false votes
+        unsure_count: Number of unsure votes
+        authentic_weight: Weighted sum of authentic votes
+        false_weight: Weighted sum of false votes
+        unsure_weight: Weighted sum of unsure votes
+        
+    Returns:
+        Vote counts, raw and weighted percentages and verification status
+    """
+    # Calculate totals and percentages
+    total_votes = authentic_count + false_count + unsure_count
+    
+    if total_votes > 0:
+        authentic_percentage = (authentic_count / total_votes) * 100
+        false_percentage = (false_count / total_votes) * 100
+        unsure_percentage = (unsure_count / total_votes) * 100
+    else:
+        authentic_percentage = 0.0
+        false_percentage = 0.0
+        unsure_percentage = 0.0
+    
+    total_weight = authentic_weight + false_weight + unsure_weight
+    
+    if total_weight > 0:
+        weighted_authentic_share = authentic_weight / total_weight
+        weighted_false_share = false_weight / total_weight
+        weighted_unsure_share = unsure_weight / total_weight
+    else:
+        weighted_authentic_share = 0.0
+        weighted_false_share = 0.0
+        weighted_unsure_share = 0.0
+    
+    # Calculate verification status
+    if total_votes == 0 or total_weight <= 0:
+        verification_result = "pending"
+    else:
+        verification_result = calculate_verification_status(
+            weighted_authentic_share,
+            weighted_false_share
+        )
+    
+    return VoteResults(
+        content_id=content_id,
+        total_votes=total_votes,
+        authentic_count=authentic_count,
+        false_count=false_count,
+        unsure_count=unsure_count,
+        authentic_percentage=round(authentic_percentage, 2),
+        false_percentage=round(false_percentage, 2),
+        unsure_percentage=round(unsure_percentage, 2),
+        weighted_authentic_percentage=round(weighted_authentic_share * 100, 2),
+        weighted_false_percentage=round(weighted_false_share * 100, 2),
+        weighted_unsure_percentage=round(weighted_unsure_share * 100, 2),
+        verification_result=verification_result
+    )
+
+
+def tally_results(content_id: UUID, tally: Optional[VoteTally]) -> VoteResults:
+    """
+    Build vote results from a materialized tally.
+    
+    Args:
+        content_id: ID of the content
+        tally: The content's tally, or None if it has no votes
+        
+    Returns:
+        Vote counts, percentages and verification status
+    """
+    if tally is None:
+        return build_vote_results(content_id, 0, 0, 0, 0.0, 0.0, 0.0)
+    
+    return build_vote_results(
+        content_id,
+        tally.authentic_count,
+        tally.false_count,
+        tally.unsure_count,
+        tally.authentic_weight,
+        tally.false_weight,
+        tally.unsure_weight
+    )
+
+
+async def compute_vote_results(db: AsyncSession, content_id: UUID) -> VoteResults:
+    """
+    Read a content item's vote results from the cache or its tally.
+    
+    Args:
+        db: Database session
+        content_id: ID of content to get results for
+        
+    Returns:
+        Vote counts, percentages and verification status
+    """
+    cached = results_cache.get(content_id)
+    if cached is not None:
+        return cached
+    
+    generation = results_cache.generation
+    tally = await db.get(VoteTally, content_id)
+    results = tally_results(content_id, tally)
+    results_cache.put(content_id, tally.version if tally else 0, results, generation)
+    return results
+
+
+async def sync_vote_tally(content_id: UUID):
+    """
+    Read a content item's tally and publish it to the Search Service.
+    
+    Runs as a background task after a vote is committed, with its own
+    database session since the request's session is closed by then. The
+    tally is read from the database, not the cache, which may not have
+    seen this vote's notification yet.
+    
+    Args:
+        content_id: ID of content whose votes changed
+    """
+    try:
+        async with SessionLocal() as db:
+            tally = await db.get(VoteTally, content_id)
+    except Exception as e:
+        logger.error(f"Error reading vote tally for {content_id}: {e}")
+        return
+    
+    await publish_vote_tally(tally_results(content_id, tally), tally.version if tally else 0)
+
+
+async def flush_queued_vote(user_id: UUID, content_id: UUID):
+    """
+    Store a user's vote on a content item if write-behind still queues it.
+    
+    Votes queued by another worker are only seen once that worker
+    flushes them.
+    
+    Args:
+        user_id: ID of the voting user
+        content_id: ID of the voted content
+        
+    Raises:
+        HTTPException: 503 if the queued vote could not be stored yet
+    """
+    if not await vote_ingestor.flush_vote(user_id, content_id):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Your vote is still being processed, please retry"
+        )
+
+
+async def enqueue_vote(
+    vote_data: VoteCreate,
+    current_user: Dict[str, Any],
+    db: AsyncSession
+) -> Dict[str, Any]:
+    """
+    Queue a vote for write-behind insertion.
+    
+    Args:
+        vote_data: Vote information
+        current_user: Current authenticated user
+        db: Database session for the duplicate check
+        
+    Returns:
+        Queued vote
+        
+    Raises:
+        HTTPException: 409 if user already voted, 503 if the queue is full,
+            500 on error
+    """
+    try:
+        outcome, vote = await vote_ingestor.submit(
+            db,
+            UUID(current_user["user_id"]),
+            vote_data.content_id,
+            vote_data.vote_type,
+            vote_data.reasoning
+        )
+    except IngestQueueFull:
+        logger.warning(f"Vote queue full, rejecting vote: user={current_user['user_id']}, content={vote_data.content_id}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many votes are being processed, please retry"
+        )
+    except Exception as e:
+        logger.error(f"Error queueing vote: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to submit vote"
+        )
+    
+    if outcome == "duplicate":
+        logger.warning(f"Duplicate vote attempt: user={current_user['user_id']}, content={vote_data.content_id}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already voted on this content"
+        )
+    
+    return vote
+
+
 @router.post("/", response_model=VoteOut, status_code=status.HTTP_201_CREATED)
 async def submit_vote(
     vote_data: VoteCreate,
+    background_tasks: BackgroundTasks,
+    response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a vote on a content item.
     
     A user can only vote once per content item. Attempting to vote again
-    will result in a 409 Conflict error.
+    will result in a 409 Conflict error; use PUT on the user's vote to
+    change it. The content's updated tally is
+    published to the Search Service after the response is sent.
+    
+    With VOTE_WRITE_BEHIND_ENABLED the vote is queued instead and 202
+    Accepted returned; it is stored within VOTE_INGEST_FLUSH_INTERVAL_SECONDS.
     
     Args:
         vote_data: Vote information
+        background_tasks: Background task queue for search sync
+        response: Response, for the 202 status of queued votes
         current_user: Current authenticated user
         db: Database session
         
     Returns:
-        Created vote
+        Created (or queued) vote
         
     Raises:
-        HTTPException: 409 if user already voted, 500 on database error
+        HTTPException: 409 if user already voted, 503 if the vote queue is
+            full, 500 on database error
     """
+    if settings.VOTE_WRITE_BEHIND_ENABLED:
+        vote = await enqueue_vote(vote_data, current_user, db)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return vote
+    
     try:
-        # Create vote
+        # Create vote, weighted by the voter's current reputation
+        user_id = UUID(current_user["user_id"])
         vote = Vote(
-            user_id=UUID(current_user["user_id"]),
+            user_id=user_id,
             content_id=vote_data.content_id,
             vote_type=vote_data.vote_type,
-            reasoning=vote_data.reasoning
+            reasoning=vote_data.reasoning,
+            weight=await get_voter_weight(db, user_id)
         )
         
         db.add(vote)
-        db.commit()
-        db.refresh(vote)
+        # Flush first so a duplicate vote fails before the tally changes
+        await db.flush()
+        version = await increment_tally(db, vote.content_id, vote.vote_type, weight_delta=vote.weight)
+        await db.commit()
+        
+        # Other workers are invalidated by the commit's notification
+        results_cache.invalidate(vote.content_id, version)
+        vote_velocity.record(vote.content_id, vote.voted_at)
         
         logger.info(f"Vote created: user={current_user['user_id']}, content={vote_data.content_id}")
         
-        return vote
+        background_tasks.add_task(sync_vote_tally, vote_data.content_id)
         
+        return vote
+    
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         logger.warning(f"Duplicate vote attempt: user={current_user['user_id']}, content={vote_data.content_id}")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="You have already voted on this content"
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error submitting vote: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -98,13 +350,14 @@ async def submit_vote(
 @router.get("/content/{content_id}/results", response_model=VoteResults)
 async def get_vote_results(
     content_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get aggregated vote results for a content item.
     
-    Calculates vote counts, percentages, and determines the overall
-    verification status based on vote thresholds.
+    Served from the worker's results cache when possible; otherwise the
+    content's materialized tally is read (a primary key lookup) and
+    percentages and the overall verification status derived from it.
     
     Args:
         content_id: ID of content to get results for
@@ -114,97 +367,158 @@ async def get_vote_results(
         Vote aggregation results with verification status
     """
     try:
-        # Get vote counts by type
-        vote_counts = db.query(
-            Vote.vote_type,
-            func.count(Vote.id).label('count')
-        ).filter(
-            Vote.content_id == content_id
-        ).group_by(
-            Vote.vote_type
-        ).all()
-        
-        # Initialize counts
-        authentic_count = 0
-        false_count = 0
-        unsure_count = 0
-        
-        # Process results
-        for vote_type, count in vote_counts:
-            if vote_type == VoteType.AUTHENTIC:
-                authentic_count = count
-            elif vote_type == VoteType.FALSE:
-                false_count = count
-            elif vote_type == VoteType.UNSURE:
-                unsure_count = count
-        
-        # Calculate totals and percentages
-        total_votes = authentic_count + false_count + unsure_count
-        
-        if total_votes > 0:
-            authentic_percentage = (authentic_count / total_votes) * 100
-            false_percentage = (false_count / total_votes) * 100
-            unsure_percentage = (unsure_count / total_votes) * 100
-        else:
-            authentic_percentage = 0.0
-            false_percentage = 0.0
-            unsure_percentage = 0.0
+        return await compute_vote_results(db, content_id)
+    
+    except Exception as e:
+        logger.error(f"Error getting vote results: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve vote results"
+        )
+
+
+@router.post("/results/batch", response_model=VoteResultsBatch)
+async def get_vote_results_batch(
+    request: VoteResultsBatchRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get aggregated vote results for many content items at once.
+    
+    Cached results are used where available and all other tallies are
+    loaded with a single query, so a feed page needs one request instead
+    of one per item. Items without votes are returned as pending.
+    
+    Args:
+        request: Content IDs to get results for
+        db: Database session
         
-        # Calculate verification status
-        if total_votes == 0:
-            verification_result = "pending"
-        else:
-            verification_result = calculate_verification_status(
-                authentic_percentage / 100,
-                false_percentage / 100
-            )
+    Returns:
+        Vote results keyed by content_id
+    """
+    try:
+        results = {}
+        for content_id in request.content_ids:
+            cached = results_cache.get(content_id)
+            if cached is not None:
+                results[content_id] = cached
         
-        return VoteResults(
-            content_id=content_id,
-            total_votes=total_votes,
-            authentic_count=authentic_count,
-            false_count=false_count,
-            unsure_count=unsure_count,
-            authentic_percentage=round(authentic_percentage, 2),
-            false_percentage=round(false_percentage, 2),
-            unsure_percentage=round(unsure_percentage, 2),
-            verification_result=verification_result
-        )
+        missing = set(request.content_ids) - set(results)
+        generation = results_cache.generation
+        tallies = await get_tallies(db, missing)
         
+        for content_id in missing:
+            tally = tallies.get(content_id)
+            results[content_id] = tally_results(content_id, tally)
+            results_cache.put(content_id, tally.version if tally else 0, results[content_id], generation)
+        
+        return {"results": {content_id: results[content_id] for content_id in request.content_ids}}
+    
     except Exception as e:
-        logger.error(f"Error getting vote results: {e}")
+        logger.error(f"Error getting batch vote results: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve vote results"
         )
 
 
+@router.get("/trending", response_model=TrendingContent)
+async def get_trending_content(
+    window_minutes: int = Query(60, ge=1, le=settings.VOTE_VELOCITY_HOUR_RETENTION_DAYS * 24 * 60),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the content items voted on fastest over a recent window.
+    
+    Answered from the vote_velocity minute/hour rollups rather than the
+    votes table; the window start is rounded down to a whole bucket, and
+    votes appear after the next rollup flush
+    (VOTE_VELOCITY_FLUSH_INTERVAL_SECONDS).
+    
+    Args:
+        window_minutes: Length of the window ending now
+        limit: Maximum number of items to return
+        db: Database session
+        
+    Returns:
+        Content ids with their vote counts and rates, fastest first
+    """
+    try:
+        resolution, rows = await top_velocity(db, window_minutes, limit)
+        
+        return {
+            "window_minutes": window_minutes,
+            "resolution": resolution,
+            "items": [
+                {"content_id": content_id, "votes": votes, "votes_per_hour": round(votes * 60 / window_minutes, 2)}
+                for content_id, votes in rows
+            ]
+        }
+    
+    except Exception as e:
+        logger.error(f"Error getting trending content: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve trending content"
+        )
+
+
 @router.get("/user/votes")
 async def get_user_votes(
+    response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500)
 ):
     """
-    Get all votes cast by the current user.
+    Get the votes cast by the current user, newest first.
+    
+    Pages are keyset-paginated on (voted_at, id) using the
+    ix_votes_user_voted_at_id index, so every page costs the same. When
+    more votes follow, the X-Next-Cursor response header holds the cursor
+    for the next page.
     
     Args:
+        response: Response, for the next-page cursor header
         current_user: Current authenticated user
         db: Database session
-        skip: Number of records to skip
+        cursor: Cursor from the previous page's X-Next-Cursor header
+        skip: Number of records to skip (deprecated; ignored with a cursor)
         limit: Maximum number of records to return
         
     Returns:
         List of user's votes
+        
+    Raises:
+        HTTPException: 400 if the cursor is invalid, 500 on database error
     """
     try:
-        votes = db.query(Vote).filter(
-            Vote.user_id == UUID(current_user["user_id"])
-        ).offset(skip).limit(limit).all()
+        query = select(Vote).where(Vote.user_id == UUID(current_user["user_id"]))
+        if cursor:
+            voted_at, vote_id = decode_cursor(cursor)
+            query = query.where(tuple_(Vote.voted_at, Vote.id) < tuple_(voted_at, vote_id))
+        elif skip:
+            query = query.offset(skip)
         
-        return votes
+        # One extra row tells whether another page follows
+        votes = (await db.execute(
+            query.order_by(Vote.voted_at.desc(), Vote.id.desc()).limit(limit + 1)
+        )).scalars().all()
         
+        if len(votes) > limit:
+            votes = votes[:limit]
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(votes[-1].voted_at, votes[-1].id)
+        
+        return votes
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         logger.error(f"Error getting user votes: {e}")
         raise HTTPException(
@@ -213,11 +527,51 @@ async def get_user_votes(
         )
 
 
+@router.post("/user/votes/batch", response_model=UserVotesBatch)
+async def get_user_votes_batch(
+    request: UserVotesBatchRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Check which of many content items the current user has voted on.
+    
+    Answered with one query on the (user_id, content_id) unique index, so
+    a feed page can highlight the user's choices without a request per
+    content card.
+    
+    Args:
+        request: Content IDs to look up
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        The user's vote type keyed by content_id; content the user has
+        not voted on is omitted
+    """
+    try:
+        rows = (await db.execute(
+            select(Vote.content_id, Vote.vote_type).where(
+                Vote.user_id == UUID(current_user["user_id"]),
+                Vote.content_id.in_(set(request.content_ids))
+            )
+        )).all()
+        
+        return {"votes": {row.content_id: row.vote_type for row in rows}}
+    
+    except Exception as e:
+        logger.error(f"Error checking user votes: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to check vote status"
+        )
+
+
 @router.get("/content/{content_id}/user-vote")
 async def get_user_vote_on_content(
     content_id: UUID,
     current_user: Dict[str, Any] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Check if the current user has voted on a specific content item.
@@ -231,19 +585,189 @@ async def get_user_vote_on_content(
         User's vote if exists, None otherwise
     """
     try:
-        vote = db.query(Vote).filter(
-            Vote.user_id == UUID(current_user["user_id"]),
-            Vote.content_id == content_id
-        ).first()
+        vote = (await db.execute(
+            select(Vote).where(
+                Vote.user_id == UUID(current_user["user_id"]),
+                Vote.content_id == content_id
+            )
+        )).scalars().first()
         
         if vote:
             return VoteOut.from_orm(vote)
         else:
             return {"voted": False}
-        
+    
     except Exception as e:
         logger.error(f"Error checking user vote: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to check vote status"
         )
+
+
+@router.put("/content/{content_id}/user-vote", response_model=VoteOut)
+async def change_vote(
+    content_id: UUID,
+    vote_data: VoteUpdate,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Change the current user's vote on a content item, or cast it.
+    
+    The vote is updated with one statement that locks it and returns its
+    previous type and weight, so the tally is adjusted by a delta
+    (decrement the old type, increment the new) without recounting the
+    content's votes. The changed vote takes the voter's current weight.
+    Without an existing vote, one is created. A vote still queued by
+    write-behind ingestion is flushed first, so the change applies to it.
+    
+    Args:
+        content_id: ID of the voted content
+        vote_data: New vote type and reasoning
+        background_tasks: Background task queue for search sync
+        response: Response, for the 201 status of created votes
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Updated or created vote
+        
+    Raises:
+        HTTPException: 409 if the vote was cast concurrently, 503 if a
+            queued vote could not be stored yet, 500 on database error
+    """
+    user_id = UUID(current_user["user_id"])
+    await flush_queued_vote(user_id, content_id)
+    
+    try:
+        weight = await get_voter_weight(db, user_id)
+        previous = select(Vote.id, Vote.vote_type, Vote.weight).where(
+            Vote.user_id == user_id,
+            Vote.content_id == content_id
+        ).with_for_update().subquery()
+        
+        row = (await db.execute(
+            update(Vote).where(
+                Vote.id == previous.c.id
+            ).values(
+                vote_type=vote_data.vote_type,
+                reasoning=vote_data.reasoning,
+                weight=weight,
+                voted_at=datetime.utcnow()
+            ).returning(
+                Vote.id, Vote.user_id, Vote.content_id, Vote.vote_type, Vote.reasoning, Vote.voted_at,
+                previous.c.vote_type.label("previous_type"),
+                previous.c.weight.label("previous_weight")
+            )
+        )).first()
+        
+        version = None
+        if row is None:
+            vote = Vote(
+                user_id=user_id,
+                content_id=content_id,
+                vote_type=vote_data.vote_type,
+                reasoning=vote_data.reasoning,
+                weight=weight
+            )
+            db.add(vote)
+            await db.flush()
+            version = await increment_tally(db, content_id, vote.vote_type, weight_delta=weight)
+            response.status_code = status.HTTP_201_CREATED
+        else:
+            vote = VoteOut.model_validate(row)
+            if (row.previous_type, row.previous_weight) != (row.vote_type, weight):
+                await increment_tally(db, content_id, row.previous_type, delta=-1, weight_delta=-row.previous_weight)
+                version = await increment_tally(db, content_id, row.vote_type, weight_delta=weight)
+        
+        await db.commit()
+        
+        logger.info(f"Vote changed: user={user_id}, content={content_id}, type={vote_data.vote_type.value}")
+        
+        if version is not None:
+            results_cache.invalidate(content_id, version)
+            background_tasks.add_task(sync_vote_tally, content_id)
+        if row is None:
+            vote_velocity.record(content_id, vote.voted_at)
+        
+        return vote
+    
+    except IntegrityError:
+        await db.rollback()
+        logger.warning(f"Concurrent vote change: user={user_id}, content={content_id}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Your vote on this content changed concurrently, please retry"
+        )
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error changing vote: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to change vote"
+        )
+
+
+@router.delete("/content/{content_id}/user-vote", status_code=status.HTTP_204_NO_CONTENT)
+async def retract_vote(
+    content_id: UUID,
+    background_tasks: BackgroundTasks,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retract the current user's vote on a content item.
+    
+    The vote is deleted with one statement returning its type and weight,
+    and both are subtracted from the tally. A vote still queued by
+    write-behind ingestion is flushed first, so it is not inserted after
+    the retraction.
+    
+    Args:
+        content_id: ID of the voted content
+        background_tasks: Background task queue for search sync
+        current_user: Current authenticated user
+        db: Database session
+        
+    Raises:
+        HTTPException: 404 if the user has not voted, 503 if a queued vote
+            could not be stored yet, 500 on database error
+    """
+    user_id = UUID(current_user["user_id"])
+    await flush_queued_vote(user_id, content_id)
+    
+    try:
+        row = (await db.execute(
+            delete(Vote).where(
+                Vote.user_id == user_id,
+                Vote.content_id == content_id
+            ).returning(Vote.vote_type, Vote.weight)
+        )).first()
+        
+        if row is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="You have not voted on this content"
+            )
+        
+        version = await increment_tally(db, content_id, row.vote_type, delta=-1, weight_delta=-row.weight)
+        await db.commit()
+        
+        logger.info(f"Vote retracted: user={user_id}, content={content_id}")
+        
+        results_cache.invalidate(content_id, version)
+        background_tasks.add_task(sync_vote_tally, content_id)
+    
+    except HTTPException:
+        await db.rollback()
+        raise
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error retracting vote: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retract vote"
+        )
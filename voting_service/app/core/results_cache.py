@@ -0,0 +1,204 @@
+from app.core.config import settings
+from app.db.tallies import TALLY_CHANNEL
+from app.schemas.vote import VoteResults
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+import asyncio
+import asyncpg
+import contextlib
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def listener_dsn(url: str) -> str:
+    """
+    Convert DATABASE_URL into a DSN asyncpg can connect to directly.
+    
+    Args:
+        url: Database URL, optionally naming a SQLAlchemy driver
+        
+    Returns:
+        Plain postgresql:// DSN
+    """
+    for prefix in ("postgresql+asyncpg://", "postgresql+psycopg2://"):
+        if url.startswith(prefix):
+            return "postgresql://" + url[len(prefix):]
+    return url
+
+
+class ResultsCache:
+    """
+    Per-worker LRU cache of vote results, kept fresh by LISTEN/NOTIFY.
+    
+    Every tally change sends "content_id:version" on TALLY_CHANNEL when
+    its transaction commits. A dedicated asyncpg connection listens on
+    the channel and drops cached results older than the announced
+    version, so every worker and replica forgets a changed tally as soon
+    as the notification arrives. The newest announced version of each
+    item is remembered, so results read before a change but stored after
+    its notification are refused.
+    
+    The cache is bypassed while the listener is disconnected and cleared
+    on every (re)connect, since notifications sent meanwhile are lost.
+    Entries also expire after RESULTS_CACHE_TTL_SECONDS as a safety net.
+    """
+    
+    def __init__(self):
+        self._entries: "OrderedDict[UUID, Tuple[int, float, VoteResults]]" = OrderedDict()
+        self._versions: "OrderedDict[UUID, int]" = OrderedDict()
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self.listening = False
+        self.generation = 0
+        self.counters: Counter = Counter()
+    
+    @property
+    def active(self) -> bool:
+        """Whether results may be served from and stored in the cache."""
+        return settings.RESULTS_CACHE_ENABLED and self.listening
+    
+    def get(self, content_id: UUID) -> Optional[VoteResults]:
+        """
+        Look up the cached results of a content item.
+        
+        Args:
+            content_id: ID of the content
+            
+        Returns:
+            Cached results, or None on a miss or while the cache is inactive
+        """
+        if not self.active:
+            self.counters["bypassed"] += 1
+            return None
+        
+        entry = self._entries.get(content_id)
+        if entry is None:
+            self.counters["misses"] += 1
+            return None
+        
+        version, expires_at, results = entry
+        if expires_at <= time.monotonic():
+            del self._entries[content_id]
+            self.counters["expired"] += 1
+            self.counters["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(content_id)
+        self.counters["hits"] += 1
+        return results
+    
+    def put(self, content_id: UUID, version: int, results: VoteResults, generation: int):
+        """
+        Store results read from the database.
+        
+        Args:
+            content_id: ID of the content
+            version: Tally version the results were built from (0 without a tally)
+            results: Vote results to cache
+            generation: Value of generation taken before the tally was read
+        """
+        if not self.active or generation != self.generation:
+            return
+        
+        if self._versions.get(content_id, -1) > version:
+            self.counters["stale_puts"] += 1
+            return
+        
+        self._entries[content_id] = (version, time.monotonic() + settings.RESULTS_CACHE_TTL_SECONDS, results)
+        self._entries.move_to_end(content_id)
+        while len(self._entries) > settings.RESULTS_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+    
+    def invalidate(self, content_id: UUID, version: int):
+        """
+        Drop cached results older than a tally version.
+        
+        Args:
+            content_id: ID of the content whose tally changed
+            version: New tally version
+        """
+        if version > self._versions.get(content_id, -1):
+            self._versions[content_id] = version
+        self._versions.move_to_end(content_id)
+        while len(self._versions) > settings.RESULTS_CACHE_MAX_ENTRIES:
+            self._versions.popitem(last=False)
+        
+        entry = self._entries.get(content_id)
+        if entry is not None and entry[0] < version:
+            del self._entries[content_id]
+            self.counters["invalidations"] += 1
+    
+    def clear(self):
+        """Drop all entries and refuse results read before this call."""
+        self._entries.clear()
+        self._versions.clear()
+        self.generation += 1
+    
+    def _on_notification(self, connection, pid: int, channel: str, payload: str):
+        self.counters["notifications"] += 1
+        try:
+            content_id, version = payload.rsplit(":", 1)
+            self.invalidate(UUID(content_id), int(version))
+        except ValueError:
+            logger.warning(f"Ignoring malformed tally notification: {payload!r}")
+    
+    async def _listen(self):
+        while True:
+            try:
+                self._connection = await asyncpg.connect(listener_dsn(settings.DATABASE_URL))
+                await self._connection.add_listener(TALLY_CHANNEL, self._on_notification)
+                self.clear()
+                self.listening = True
+                logger.info(f"Results cache listening on {TALLY_CHANNEL}")
+                
+                # A dead connection delivers no notifications and raises no
+                # error on its own, so probe it
+                while True:
+                    await asyncio.sleep(settings.RESULTS_CACHE_PING_SECONDS)
+                    await self._connection.fetchval("SELECT 1", timeout=settings.RESULTS_CACHE_PING_SECONDS)
+            
+            except Exception as e:
+                logger.error(f"Results cache listener disconnected: {e}")
+                self.counters["listener_errors"] += 1
+            
+            finally:
+                self.listening = False
+                self.clear()
+                if self._connection is not None:
+                    self._connection.terminate()
+                    self._connection = None
+            
+            await asyncio.sleep(settings.RESULTS_CACHE_RECONNECT_SECONDS)
+    
+    def start(self):
+        """Start the notification listener."""
+        if settings.RESULTS_CACHE_ENABLED:
+            self._task = asyncio.create_task(self._listen())
+    
+    async def stop(self):
+        """Stop the listener and drop all entries."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Return cache counters, size and listener state."""
+        lookups = self.counters["hits"] + self.counters["misses"]
+        return {
+            "enabled": settings.RESULTS_CACHE_ENABLED,
+            "listening": self.listening,
+            "size": len(self._entries),
+            "max_entries": settings.RESULTS_CACHE_MAX_ENTRIES,
+            "hit_rate": round(self.counters["hits"] / lookups, 4) if lookups else 0.0,
+            **self.counters
+        }
+
+
+# Global vote results cache
+results_cache = ResultsCache()
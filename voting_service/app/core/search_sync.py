@@ -0,0 +1,43 @@
+from app.core.config import settings
+from app.core.security import create_service_token
+from app.schemas.vote import VoteResults
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+async def publish_vote_tally(results: VoteResults, version: int):
+    """
+    Send a content item's vote tally to the Search Service.
+    
+    The Search Service coalesces tallies per content item and writes
+    them into search documents in batches. The version is the tally
+    row's version, incremented in the same transaction as every count
+    change, so a tally read earlier never overwrites a later one, however
+    deliveries are reordered. Failures are logged; the next vote on the
+    item resends the full tally.
+    
+    Args:
+        results: Aggregated vote results for the content item
+        version: VoteTally.version the results were read from
+    """
+    tally = {
+        "content_id": str(results.content_id),
+        "authentic_count": results.authentic_count,
+        "false_count": results.false_count,
+        "total_votes": results.total_votes,
+        "status": results.verification_result,
+        "version": version
+    }
+    
+    try:
+        async with httpx.AsyncClient(timeout=settings.SEARCH_SYNC_TIMEOUT_SECONDS) as client:
+            response = await client.post(
+                f"{settings.SEARCH_SERVICE_URL}/api/v1/search/index/tallies",
+                json={"tallies": [tally]},
+                headers={"Authorization": f"Bearer {create_service_token()}"}
+            )
+            response.raise_for_status()
+    except Exception as e:
+        logger.error(f"Failed to publish vote tally for {results.content_id}: {e}")
@@ -0,0 +1,418 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.results_cache import results_cache
+from app.core.vote_velocity import vote_velocity
+from app.db.base import SessionLocal
+from app.db.tallies import increment_tally
+from app.db.reputation import get_voter_weights
+from app.models.vote import Vote, VoteType
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+import asyncio
+import fcntl
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Write-ahead segments live in VOTE_INGEST_WAL_DIR as votes-<pid>-<seq>.wal
+WAL_PATTERN = "votes-*.wal"
+
+
+class IngestQueueFull(Exception):
+    """Raised when VOTE_INGEST_MAX_PENDING votes are already waiting."""
+
+
+class WalSegment:
+    """
+    An append-only file of queued votes, one JSON object per line.
+    
+    The file is exclusively locked (flock) while its owner holds it, so
+    recovery never replays the segment of a running worker.
+    """
+    
+    def __init__(self, path: Path, file):
+        self.path = path
+        self.file = file
+    
+    @classmethod
+    def create(cls, directory: Path, sequence: int) -> "WalSegment":
+        """Create and lock a new segment; it gets its final name only once locked."""
+        path = directory / f"votes-{os.getpid()}-{sequence}.wal"
+        pending_path = path.with_suffix(".tmp")
+        file = open(pending_path, "a", encoding="utf-8")
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        os.rename(pending_path, path)
+        return cls(path, file)
+    
+    @classmethod
+    def claim(cls, path: Path) -> Optional["WalSegment"]:
+        """Lock an existing segment, or return None if a running worker holds it."""
+        file = open(path, "r+", encoding="utf-8")
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return None
+        return cls(path, file)
+    
+    def append(self, line: str):
+        self.file.write(line + "\n")
+        self.file.flush()
+    
+    def fsync(self):
+        try:
+            os.fsync(self.file.fileno())
+        except (ValueError, OSError):
+            # A segment removed meanwhile has all of its votes committed
+            if not self.file.closed:
+                raise
+    
+    def remove(self):
+        """Delete the segment once all of its votes are committed."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        self.file.close()
+
+
+def encode_vote(vote: Dict[str, Any]) -> str:
+    """Serialize a queued vote as one write-ahead log line."""
+    return json.dumps({
+        "id": str(vote["id"]),
+        "user_id": str(vote["user_id"]),
+        "content_id": str(vote["content_id"]),
+        "vote_type": vote["vote_type"].value,
+        "reasoning": vote["reasoning"],
+        "voted_at": vote["voted_at"].isoformat()
+    })
+
+
+def decode_vote(line: str) -> Dict[str, Any]:
+    """Parse a write-ahead log line back into vote column values."""
+    record = json.loads(line)
+    return {
+        "id": UUID(record["id"]),
+        "user_id": UUID(record["user_id"]),
+        "content_id": UUID(record["content_id"]),
+        "vote_type": VoteType(record["vote_type"]),
+        "reasoning": record["reasoning"],
+        "voted_at": datetime.fromisoformat(record["voted_at"])
+    }
+
+
+class VoteIngestor:
+    """
+    Queue votes in memory and insert them in batches (write-behind).
+    
+    A submitted vote is rejected as a duplicate if the same user already
+    has a vote on the content, queued or stored. Accepted votes are
+    appended to a write-ahead segment and fsynced (one fsync covers
+    every vote appended before it starts) before the caller is answered,
+    then inserted every VOTE_INGEST_FLUSH_INTERVAL_SECONDS, or sooner
+    once VOTE_INGEST_BATCH_SIZE votes are waiting.
+    
+    A flush weights the queued votes by their voters' current reputation,
+    inserts them in one transaction with multi-row INSERT ... ON CONFLICT
+    DO NOTHING on uq_user_content_vote, and bumps tallies only by the
+    rows actually inserted. Replaying a vote is
+    therefore harmless, which makes recovery simple: on startup, segments
+    left behind by a stopped worker are replayed and deleted. It also means
+    the rare vote accepted by two workers at once is stored only once.
+    """
+    
+    def __init__(self):
+        self._pending: List[Dict[str, Any]] = []
+        self._keys: Set[Tuple[UUID, UUID]] = set()
+        self._segment: Optional[WalSegment] = None
+        self._sealed: List[WalSegment] = []
+        self._unsynced: List[WalSegment] = []
+        self._sequence = 0
+        self._appended = 0
+        self._synced = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+        self._on_flushed: Optional[Callable[[UUID], Awaitable[None]]] = None
+        self._callbacks: Set[asyncio.Task] = set()
+        self.counters: Counter = Counter()
+    
+    def _open_segment(self):
+        self._sequence += 1
+        self._segment = WalSegment.create(Path(settings.VOTE_INGEST_WAL_DIR), self._sequence)
+    
+    def _queue(self, vote: Dict[str, Any]):
+        self._pending.append(vote)
+        self._keys.add((vote["user_id"], vote["content_id"]))
+    
+    async def submit(
+        self,
+        db: AsyncSession,
+        user_id: UUID,
+        content_id: UUID,
+        vote_type: VoteType,
+        reasoning: Optional[str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Validate, deduplicate and durably queue a vote.
+        
+        Args:
+            db: Database session for the duplicate check
+            user_id: ID of the voting user
+            content_id: ID of the voted content
+            vote_type: Type of vote
+            reasoning: Optional reasoning for the vote
+            
+        Returns:
+            ("accepted" or "duplicate", vote column values)
+            
+        Raises:
+            IngestQueueFull: If VOTE_INGEST_MAX_PENDING votes are waiting
+        """
+        vote = {
+            "id": uuid4(),
+            "user_id": user_id,
+            "content_id": content_id,
+            "vote_type": vote_type,
+            "reasoning": reasoning,
+            "voted_at": datetime.utcnow()
+        }
+        
+        if (user_id, content_id) in self._keys:
+            self.counters["duplicates"] += 1
+            return "duplicate", vote
+        
+        existing = (await db.execute(
+            select(Vote.id).where(Vote.user_id == user_id, Vote.content_id == content_id)
+        )).first()
+        # Checked again: a concurrent request may have queued it meanwhile
+        if existing is not None or (user_id, content_id) in self._keys:
+            self.counters["duplicates"] += 1
+            return "duplicate", vote
+        
+        if len(self._pending) >= settings.VOTE_INGEST_MAX_PENDING:
+            self.counters["rejected"] += 1
+            raise IngestQueueFull()
+        
+        self._segment.append(encode_vote(vote))
+        self._appended += 1
+        self._queue(vote)
+        self.counters["accepted"] += 1
+        
+        if len(self._pending) >= settings.VOTE_INGEST_BATCH_SIZE:
+            self._wakeup.set()
+        
+        if settings.VOTE_INGEST_FSYNC:
+            await self._sync()
+        return "accepted", vote
+    
+    async def _sync(self):
+        """Wait until every line appended so far is on disk (group commit)."""
+        target = self._appended
+        while self._synced < target:
+            if self._sync_task is None:
+                self._sync_task = asyncio.create_task(self._fsync())
+            await asyncio.shield(self._sync_task)
+    
+    async def _fsync(self):
+        appended = self._appended
+        # Segments rotated out by flush() since the last fsync may still
+        # hold lines counted in appended
+        segments, self._unsynced = [*self._unsynced, self._segment], []
+        try:
+            for segment in segments:
+                await asyncio.to_thread(segment.fsync)
+            self._synced = max(self._synced, appended)
+            self.counters["fsyncs"] += 1
+        except BaseException:
+            self._unsynced = segments[:-1] + self._unsynced
+            raise
+        finally:
+            self._sync_task = None
+    
+    def recover(self):
+        """Queue the votes of segments left behind by stopped workers."""
+        directory = Path(settings.VOTE_INGEST_WAL_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        
+        for path in sorted(directory.glob(WAL_PATTERN)):
+            segment = WalSegment.claim(path)
+            if segment is None:
+                continue
+            
+            for line in segment.file:
+                try:
+                    self._queue(decode_vote(line))
+                    self.counters["recovered"] += 1
+                except (ValueError, KeyError):
+                    # A torn final line from a crash mid-write
+                    logger.warning(f"Skipping unreadable vote in {path.name}: {line.strip()[:200]!r}")
+            self._sealed.append(segment)
+        
+        if self._sealed:
+            logger.info(f"Recovered {self.counters['recovered']} queued votes from {len(self._sealed)} segments")
+    
+    async def flush(self):
+        """
+        Insert every queued vote in one transaction.
+        
+        Flushes run one at a time. On failure the votes stay queued and
+        their segments on disk, and the next flush retries them.
+        """
+        async with self._flush_lock:
+            await self._flush()
+    
+    async def flush_vote(self, user_id: UUID, content_id: UUID) -> bool:
+        """
+        Flush the queue if it holds a user's vote on a content item.
+        
+        Lets a queued vote be changed or retracted with a plain database
+        statement afterwards, instead of being inserted after it.
+        
+        Args:
+            user_id: ID of the voting user
+            content_id: ID of the voted content
+            
+        Returns:
+            False if the vote is still queued because the flush failed
+        """
+        key = (user_id, content_id)
+        if key not in self._keys:
+            return True
+        
+        self.counters["vote_flushes"] += 1
+        await self.flush()
+        return key not in self._keys
+    
+    async def _flush(self):
+        if not self._pending:
+            return
+        
+        # Votes submitted from here on go to a new segment, so the sealed
+        # ones can be deleted as soon as this batch commits
+        if self._segment is not None:
+            self._sealed.append(self._segment)
+            if settings.VOTE_INGEST_FSYNC:
+                self._unsynced.append(self._segment)
+            self._open_segment()
+        batch, self._pending = self._pending, []
+        sealed, self._sealed = self._sealed, []
+        
+        try:
+            async with SessionLocal() as db:
+                weights = await get_voter_weights(db, (vote["user_id"] for vote in batch))
+                inserted = Counter()
+                inserted_weight = Counter()
+                inserted_at = Counter()
+                for start in range(0, len(batch), settings.VOTE_INGEST_BATCH_SIZE):
+                    rows = (await db.execute(
+                        insert(Vote).values([
+                            {**vote, "weight": weights[vote["user_id"]]}
+                            for vote in batch[start:start + settings.VOTE_INGEST_BATCH_SIZE]
+                        ]).on_conflict_do_nothing(
+                            constraint="uq_user_content_vote"
+                        ).returning(Vote.content_id, Vote.vote_type, Vote.weight, Vote.voted_at)
+                    )).all()
+                    for row in rows:
+                        inserted[(row.content_id, row.vote_type)] += 1
+                        inserted_weight[(row.content_id, row.vote_type)] += row.weight
+                        inserted_at[(row.content_id, row.voted_at)] += 1
+                
+                # Fixed lock order so concurrent flushes cannot deadlock
+                versions = {}
+                for (content_id, vote_type), count in sorted(inserted.items(), key=lambda item: (str(item[0][0]), item[0][1].value)):
+                    versions[content_id] = await increment_tally(
+                        db, content_id, vote_type, delta=count, weight_delta=inserted_weight[(content_id, vote_type)]
+                    )
+                await db.commit()
+        
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} queued votes: {e}")
+            self.counters["flush_errors"] += 1
+            self._pending = batch + self._pending
+            self._sealed = sealed + self._sealed
+            return
+        
+        for vote in batch:
+            self._keys.discard((vote["user_id"], vote["content_id"]))
+        for segment in sealed:
+            segment.remove()
+        
+        total = sum(inserted.values())
+        self.counters["flushes"] += 1
+        self.counters["inserted"] += total
+        self.counters["conflicts"] += len(batch) - total
+        for (content_id, voted_at), count in inserted_at.items():
+            vote_velocity.record(content_id, voted_at, count)
+        
+        for content_id, version in versions.items():
+            results_cache.invalidate(content_id, version)
+            if self._on_flushed is not None:
+                task = asyncio.create_task(self._on_flushed(content_id))
+                self._callbacks.add(task)
+                task.add_done_callback(self._callbacks.discard)
+    
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.VOTE_INGEST_FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+    
+    def start(self, on_flushed: Optional[Callable[[UUID], Awaitable[None]]] = None):
+        """
+        Recover left-behind segments and start the flush loop.
+        
+        Args:
+            on_flushed: Coroutine run for each content item with new votes
+        """
+        if not settings.VOTE_WRITE_BEHIND_ENABLED:
+            return
+        
+        self._on_flushed = on_flushed
+        self.recover()
+        self._open_segment()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop after a final flush of the queue."""
+        if self._task:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        
+        if self._sync_task is not None:
+            await asyncio.shield(self._sync_task)
+        if self._callbacks:
+            await asyncio.gather(*self._callbacks, return_exceptions=True)
+        
+        # Votes whose final flush failed stay on disk for the next start
+        if not self._pending and self._segment is not None:
+            self._segment.remove()
+            self._segment = None
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Return ingestion counters, queue length and segment count."""
+        return {
+            "enabled": settings.VOTE_WRITE_BEHIND_ENABLED,
+            "pending": len(self._pending),
+            "segments": len(self._sealed) + (self._segment is not None),
+            **self.counters
+        }
+
+
+# Global write-behind vote ingestor
+vote_ingestor = VoteIngestor()
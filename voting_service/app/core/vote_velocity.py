@@ -0,0 +1,220 @@
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.vote import VoteVelocity
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row upsert, and how often old buckets are deleted
+FLUSH_BATCH_ROWS = 1000
+PRUNE_INTERVAL = timedelta(minutes=5)
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """
+    Truncate a timestamp to the start of its bucket.
+    
+    Args:
+        timestamp: Naive UTC timestamp
+        resolution: "minute" or "hour"
+        
+    Returns:
+        Start of the bucket containing the timestamp
+    """
+    if resolution == "hour":
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(second=0, microsecond=0)
+
+
+def window_resolution(window_minutes: int) -> str:
+    """Pick the finest resolution still retained for a whole window."""
+    if window_minutes <= settings.VOTE_VELOCITY_MINUTE_RETENTION_HOURS * 60:
+        return "minute"
+    return "hour"
+
+
+class VelocityAggregator:
+    """
+    Count new votes per content item and minute in memory, and add the
+    counts to the vote_velocity rollup table periodically.
+    
+    Each flush upserts one row per (content, minute) and per
+    (content, hour) with vote_count = vote_count + the new count, so
+    every worker and replica can flush its own counts without
+    coordination. Rows are written in key order, keeping concurrent
+    flushes from deadlocking. Counts not yet flushed are lost if a worker
+    is killed; trending is a ranking signal, not an audit record.
+    """
+    
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._pruned_at: Optional[datetime] = None
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.counters: Counter = Counter()
+    
+    def record(self, content_id: UUID, voted_at: datetime, count: int = 1):
+        """
+        Count new votes on a content item.
+        
+        Args:
+            content_id: ID of the voted content
+            voted_at: When the votes were cast
+            count: Number of votes
+        """
+        self._counts[(content_id, bucket_start(voted_at, "minute"))] += count
+    
+    def _rows(self, counts: Counter) -> List[Dict[str, Any]]:
+        """Expand minute counts into sorted minute and hour bucket rows."""
+        buckets = Counter()
+        for (content_id, minute), count in counts.items():
+            buckets[("minute", minute, content_id)] += count
+            buckets[("hour", bucket_start(minute, "hour"), content_id)] += count
+        
+        return [
+            {"resolution": resolution, "bucket_start": start, "content_id": content_id, "vote_count": count}
+            for (resolution, start, content_id), count in sorted(
+                buckets.items(), key=lambda item: (item[0][0], item[0][1], str(item[0][2]))
+            )
+        ]
+    
+    async def prune(self, db: AsyncSession) -> int:
+        """
+        Delete buckets older than their resolution's retention.
+        
+        Args:
+            db: Database session (committed by the caller)
+            
+        Returns:
+            Number of deleted rows
+        """
+        now = datetime.utcnow()
+        retention = {
+            "minute": timedelta(hours=settings.VOTE_VELOCITY_MINUTE_RETENTION_HOURS),
+            "hour": timedelta(days=settings.VOTE_VELOCITY_HOUR_RETENTION_DAYS)
+        }
+        
+        deleted = 0
+        for resolution, age in retention.items():
+            result = await db.execute(
+                delete(VoteVelocity).where(
+                    VoteVelocity.resolution == resolution,
+                    VoteVelocity.bucket_start < bucket_start(now - age, resolution)
+                )
+            )
+            deleted += result.rowcount
+        return deleted
+    
+    async def flush(self):
+        """
+        Add the counted votes to the rollup table in one transaction, and
+        prune old buckets every PRUNE_INTERVAL.
+        
+        On failure the counts are kept and retried by the next flush.
+        """
+        now = datetime.utcnow()
+        prune_due = self._pruned_at is None or now - self._pruned_at >= PRUNE_INTERVAL
+        if not self._counts and not prune_due:
+            return
+        
+        counts, self._counts = self._counts, Counter()
+        rows = self._rows(counts)
+        
+        try:
+            async with SessionLocal() as db:
+                for start in range(0, len(rows), FLUSH_BATCH_ROWS):
+                    statement = insert(VoteVelocity).values(rows[start:start + FLUSH_BATCH_ROWS])
+                    await db.execute(statement.on_conflict_do_update(
+                        index_elements=[VoteVelocity.resolution, VoteVelocity.bucket_start, VoteVelocity.content_id],
+                        set_={"vote_count": VoteVelocity.vote_count + statement.excluded.vote_count}
+                    ))
+                
+                pruned = await self.prune(db) if prune_due else 0
+                await db.commit()
+        
+        except Exception as e:
+            logger.error(f"Error flushing vote velocity of {len(counts)} buckets: {e}")
+            self.counters["flush_errors"] += 1
+            self._counts.update(counts)
+            return
+        
+        if prune_due:
+            self._pruned_at = now
+            self.counters["pruned"] += pruned
+        self.counters["flushes"] += 1
+        self.counters["flushed_votes"] += sum(counts.values())
+    
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), settings.VOTE_VELOCITY_FLUSH_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+    
+    def start(self):
+        """Start the periodic flush loop."""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the flush loop after a final flush of the counts."""
+        if self._task:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Return flush counters and the number of unflushed buckets."""
+        return {
+            "pending_buckets": len(self._counts),
+            **self.counters
+        }
+
+
+async def top_velocity(db: AsyncSession, window_minutes: int, limit: int) -> Tuple[str, List[Tuple[UUID, int]]]:
+    """
+    Find the content items with the most votes in a recent window.
+    
+    Sums the rollup buckets that start within the window (rounded down to
+    a whole bucket), using minute buckets while they are retained for the
+    whole window and hour buckets otherwise.
+    
+    Args:
+        db: Database session
+        window_minutes: Length of the window ending now
+        limit: Maximum number of items
+        
+    Returns:
+        (resolution, [(content_id, votes), ...]) ordered by votes, highest first
+    """
+    resolution = window_resolution(window_minutes)
+    since = bucket_start(datetime.utcnow() - timedelta(minutes=window_minutes), resolution)
+    votes = func.sum(VoteVelocity.vote_count).label("votes")
+    
+    rows = (await db.execute(
+        select(VoteVelocity.content_id, votes).where(
+            VoteVelocity.resolution == resolution,
+            VoteVelocity.bucket_start >= since
+        ).group_by(
+            VoteVelocity.content_id
+        ).order_by(
+            votes.desc(), VoteVelocity.content_id
+        ).limit(limit)
+    )).all()
+    return resolution, [(row.content_id, int(row.votes)) for row in rows]
+
+
+# Global vote velocity aggregator
+vote_velocity = VelocityAggregator()
@@ -1,31 +1,55 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create database engine
-engine = create_engine(
-    settings.DATABASE_URL,
+
+def async_database_url(url: str) -> str:
+    """
+    Select the asyncpg driver for a PostgreSQL URL.
+    
+    DATABASE_URL stays a plain postgresql:// URL so Alembic can keep
+    using the synchronous psycopg2 driver.
+    
+    Args:
+        url: Database URL
+        
+    Returns:
+        URL using the postgresql+asyncpg driver
+    """
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+# Create async database engine
+engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
     echo=False
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory; objects stay usable after commit without a
+# lazy refresh, which async sessions cannot do implicitly
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Create base class for models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
     Dependency function to get database session.
     
     Yields:
-        Database session
+        Async database session
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,310 @@
+"""
+Recompute every voter's reputation weight from vote outcomes.
+
+A content item's outcome is final once it has at least
+REPUTATION_MIN_OUTCOME_VOTES votes and its weighted authentic or false
+share reaches VERIFIED_THRESHOLD or FALSE_THRESHOLD. A voter's
+agreement rate is the share of their authentic/false votes on finalized
+content that match the outcome (unsure votes count neither way),
+smoothed towards 50% with REPUTATION_PRIOR_VOTES pseudo-votes, and
+mapped linearly onto REPUTATION_MIN_WEIGHT..REPUTATION_MAX_WEIGHT.
+New voters therefore start halfway between the two.
+
+Tallies and votes are streamed in partitions into NumPy arrays and all
+matching and aggregation is vectorized. New weights apply to votes cast
+afterwards; existing votes keep the weight they were cast with.
+
+Usage (from the voting_service directory):
+    python -m app.db.reputation --dry-run
+"""
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+import argparse
+import asyncio
+import json
+import logging
+import numpy as np
+
+from app.core.config import settings
+from app.db.base import SessionLocal, engine
+from app.models.vote import Vote, VoteType, VoteTally, VoterReputation
+
+logger = logging.getLogger(__name__)
+
+# Vote types as small integers, in tally column order
+VOTE_CODES = {VoteType.AUTHENTIC: 0, VoteType.FALSE: 1, VoteType.UNSURE: 2}
+NO_OUTCOME = -1
+
+
+def reputation_weight(agreed, decided):
+    """
+    Map agreement counts to weights; works on scalars and arrays.
+    
+    Args:
+        agreed: Votes that agreed with a final outcome
+        decided: Votes on content with a final outcome
+        
+    Returns:
+        Weight between REPUTATION_MIN_WEIGHT and REPUTATION_MAX_WEIGHT
+    """
+    prior = settings.REPUTATION_PRIOR_VOTES
+    rate = (agreed + 0.5 * prior) / (decided + prior)
+    return settings.REPUTATION_MIN_WEIGHT + (settings.REPUTATION_MAX_WEIGHT - settings.REPUTATION_MIN_WEIGHT) * rate
+
+
+def neutral_weight() -> float:
+    """Weight of a voter without a reputation."""
+    return float(reputation_weight(0, 0))
+
+
+async def get_voter_weights(db: AsyncSession, user_ids: Iterable[UUID]) -> Dict[UUID, float]:
+    """
+    Look up the current weights of several voters with one query.
+    
+    Args:
+        db: Database session
+        user_ids: IDs of the voters
+        
+    Returns:
+        Weights keyed by user_id; voters without a reputation get the
+        neutral weight
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+    
+    rows = (await db.execute(
+        select(VoterReputation.user_id, VoterReputation.weight).where(VoterReputation.user_id.in_(user_ids))
+    )).all()
+    weights = {row.user_id: row.weight for row in rows}
+    return {user_id: weights.get(user_id, neutral_weight()) for user_id in user_ids}
+
+
+async def get_voter_weight(db: AsyncSession, user_id: UUID) -> float:
+    """
+    Look up a voter's current weight.
+    
+    Args:
+        db: Database session
+        user_id: ID of the voter
+        
+    Returns:
+        The voter's weight, or the neutral weight without a reputation
+    """
+    weight = (await db.execute(
+        select(VoterReputation.weight).where(VoterReputation.user_id == user_id)
+    )).scalar_one_or_none()
+    return neutral_weight() if weight is None else weight
+
+
+def uuid_array(values: List[UUID]) -> np.ndarray:
+    """Pack UUIDs into a sortable array of 16-byte strings."""
+    return np.array([value.bytes for value in values], dtype="S16")
+
+
+def tally_outcomes(weights: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Decide the final outcome of each tally.
+    
+    Args:
+        weights: (n, 3) weighted sums in VOTE_CODES order
+        counts: Total vote count of each tally
+        
+    Returns:
+        Outcome vote code per tally, or NO_OUTCOME
+    """
+    totals = weights.sum(axis=1)
+    shares = np.divide(weights, totals[:, None], out=np.zeros_like(weights), where=totals[:, None] > 0)
+    final = counts >= settings.REPUTATION_MIN_OUTCOME_VOTES
+    
+    outcomes = np.full(len(weights), NO_OUTCOME, dtype=np.int8)
+    # Verified wins when both shares pass, as in calculate_verification_status
+    outcomes[final & (shares[:, VOTE_CODES[VoteType.FALSE]] >= settings.FALSE_THRESHOLD)] = VOTE_CODES[VoteType.FALSE]
+    outcomes[final & (shares[:, VOTE_CODES[VoteType.AUTHENTIC]] >= settings.VERIFIED_THRESHOLD)] = VOTE_CODES[VoteType.AUTHENTIC]
+    return outcomes
+
+
+def agreement_counts(
+    vote_users: np.ndarray,
+    vote_contents: np.ndarray,
+    vote_codes: np.ndarray,
+    content_ids: np.ndarray,
+    outcomes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count each voter's agreeing and decided votes in a partition of votes.
+    
+    Args:
+        vote_users: Voter of each vote (16-byte UUIDs)
+        vote_contents: Content of each vote (16-byte UUIDs)
+        vote_codes: Vote code of each vote
+        content_ids: Sorted content ids of all tallies
+        outcomes: Outcome of each tally, aligned with content_ids
+        
+    Returns:
+        (voters, agreed, decided) with one entry per distinct voter
+    """
+    vote_outcomes = np.full(len(vote_contents), NO_OUTCOME, dtype=np.int8)
+    if len(content_ids):
+        positions = np.minimum(np.searchsorted(content_ids, vote_contents), len(content_ids) - 1)
+        known = content_ids[positions] == vote_contents
+        vote_outcomes[known] = outcomes[positions[known]]
+    
+    decided = (vote_outcomes != NO_OUTCOME) & (vote_codes != VOTE_CODES[VoteType.UNSURE])
+    agreed = decided & (vote_codes == vote_outcomes)
+    
+    voters, inverse = np.unique(vote_users, return_inverse=True)
+    return (
+        voters,
+        np.bincount(inverse, weights=agreed, minlength=len(voters)),
+        np.bincount(inverse, weights=decided, minlength=len(voters))
+    )
+
+
+async def load_outcomes(db: AsyncSession) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stream all tallies and decide their outcomes.
+    
+    Returns:
+        (content_ids, outcomes) sorted by content id
+    """
+    ids, weights, counts = [], [], []
+    result = await db.stream(
+        select(
+            VoteTally.content_id,
+            VoteTally.authentic_weight, VoteTally.false_weight, VoteTally.unsure_weight,
+            VoteTally.authentic_count + VoteTally.false_count + VoteTally.unsure_count
+        ).execution_options(yield_per=settings.REPUTATION_BATCH_SIZE)
+    )
+    async for rows in result.partitions():
+        ids.append(uuid_array([row[0] for row in rows]))
+        weights.append(np.array([row[1:4] for row in rows], dtype=np.float64))
+        counts.append(np.array([row[4] for row in rows], dtype=np.int64))
+    
+    if not ids:
+        return np.array([], dtype="S16"), np.array([], dtype=np.int8)
+    
+    content_ids = np.concatenate(ids)
+    outcomes = tally_outcomes(np.concatenate(weights), np.concatenate(counts))
+    order = np.argsort(content_ids)
+    return content_ids[order], outcomes[order]
+
+
+async def compute_reputations(db: AsyncSession) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Count every voter's agreement with final outcomes.
+    
+    Returns:
+        (voters, agreed, decided, vote count), one entry per voter
+    """
+    content_ids, outcomes = await load_outcomes(db)
+    
+    partials = []
+    total = 0
+    result = await db.stream(
+        select(Vote.user_id, Vote.content_id, Vote.vote_type).execution_options(
+            yield_per=settings.REPUTATION_BATCH_SIZE
+        )
+    )
+    async for rows in result.partitions():
+        total += len(rows)
+        partials.append(agreement_counts(
+            uuid_array([row.user_id for row in rows]),
+            uuid_array([row.content_id for row in rows]),
+            np.array([VOTE_CODES[row.vote_type] for row in rows], dtype=np.int8),
+            content_ids,
+            outcomes
+        ))
+    
+    if not partials:
+        return np.array([], dtype="S16"), np.array([]), np.array([]), 0
+    
+    # A voter can appear in several partitions; merge their counts
+    voters, inverse = np.unique(np.concatenate([partial[0] for partial in partials]), return_inverse=True)
+    agreed = np.bincount(inverse, weights=np.concatenate([partial[1] for partial in partials]), minlength=len(voters))
+    decided = np.bincount(inverse, weights=np.concatenate([partial[2] for partial in partials]), minlength=len(voters))
+    return voters, agreed, decided, total
+
+
+async def save_reputations(db: AsyncSession, voters: np.ndarray, agreed: np.ndarray, decided: np.ndarray, weights: np.ndarray):
+    """Upsert the reputations of all voters, one batch at a time."""
+    statement = insert(VoterReputation)
+    statement = statement.on_conflict_do_update(
+        index_elements=[VoterReputation.user_id],
+        set_={
+            "weight": statement.excluded.weight,
+            "agreed_votes": statement.excluded.agreed_votes,
+            "decided_votes": statement.excluded.decided_votes,
+            "updated_at": statement.excluded.updated_at
+        }
+    )
+    
+    now = datetime.utcnow()
+    for start in range(0, len(voters), settings.REPUTATION_BATCH_SIZE):
+        end = start + settings.REPUTATION_BATCH_SIZE
+        await db.execute(statement, [
+            {
+                # Numpy drops trailing NUL bytes from S16 values
+                "user_id": UUID(bytes=voter.ljust(16, b"\0")),
+                "weight": float(weight),
+                "agreed_votes": int(agreed_count),
+                "decided_votes": int(decided_count),
+                "updated_at": now
+            }
+            for voter, agreed_count, decided_count, weight in zip(
+                voters[start:end], agreed[start:end], decided[start:end], weights[start:end]
+            )
+        ])
+
+
+async def recompute_reputations(dry_run: bool = False) -> Dict[str, float]:
+    """
+    Recompute and store the reputation weight of every voter.
+    
+    Args:
+        dry_run: Compute and summarize weights without storing them
+        
+    Returns:
+        Summary with vote and voter counts and the weight distribution
+    """
+    async with SessionLocal() as db:
+        voters, agreed, decided, votes = await compute_reputations(db)
+        weights = reputation_weight(agreed, decided)
+        
+        if not dry_run and len(voters):
+            await save_reputations(db, voters, agreed, decided, weights)
+            await db.commit()
+    
+    report = {"votes": votes, "voters": len(voters)}
+    if len(voters):
+        report.update({
+            "decided_votes": int(decided.sum()),
+            "agreement_rate": round(float(agreed.sum() / decided.sum()), 4) if decided.sum() else None,
+            "weight_min": round(float(weights.min()), 4),
+            "weight_median": round(float(np.median(weights)), 4),
+            "weight_max": round(float(weights.max()), 4)
+        })
+    
+    logger.info(f"Reputation recomputation finished: {report}")
+    return report
+
+
+async def main(dry_run: bool):
+    try:
+        report = await recompute_reputations(dry_run)
+        print(json.dumps(report, indent=2))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dry-run", action="store_true", help="Report weights without storing them")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(main(args.dry_run))
@@ -0,0 +1,266 @@
+"""
+Maintain and repair the materialized vote_tallies table.
+
+Vote writes call increment_tally in the same transaction as the vote
+change, so vote_tallies always matches the votes table once committed.
+The repair job recomputes tallies from raw votes in batches of content
+ids, fixing drift (e.g. rows edited by hand) and backfilling tallies
+for votes cast before the table existed.
+
+Besides counts, each tally keeps the sum of the reputation weights of
+its votes per vote type. Every vote stores the weight it was cast with,
+so changes and retractions subtract exactly what was added.
+
+Usage (from the voting_service directory):
+    python -m app.db.tallies --dry-run
+"""
+from sqlalchemy import func, select, text, union
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+import argparse
+import asyncio
+import json
+import logging
+import math
+
+from app.core.config import settings
+from app.db.base import SessionLocal, engine
+from app.models.vote import Vote, VoteType, VoteTally
+
+logger = logging.getLogger(__name__)
+
+# vote_tallies column holding the count of each vote type
+TALLY_COLUMNS = {
+    VoteType.AUTHENTIC: "authentic_count",
+    VoteType.FALSE: "false_count",
+    VoteType.UNSURE: "unsure_count"
+}
+
+# vote_tallies column holding the weighted sum of each vote type
+TALLY_WEIGHT_COLUMNS = {
+    VoteType.AUTHENTIC: "authentic_weight",
+    VoteType.FALSE: "false_weight",
+    VoteType.UNSURE: "unsure_weight"
+}
+
+# Postgres NOTIFY channel announcing tally changes as "content_id:version"
+TALLY_CHANNEL = "vote_tallies_changed"
+
+
+async def notify_tally_changed(db: AsyncSession, content_id: UUID, version: int):
+    """
+    Announce a tally change to every worker listening on TALLY_CHANNEL.
+    
+    Postgres delivers the notification only when the surrounding
+    transaction commits, so listeners never see uncommitted changes.
+    
+    Args:
+        db: Database session in the transaction that changed the tally
+        content_id: ID of the content whose tally changed
+        version: New tally version
+    """
+    await db.execute(select(func.pg_notify(TALLY_CHANNEL, f"{content_id}:{version}")))
+
+
+async def increment_tally(
+    db: AsyncSession,
+    content_id: UUID,
+    vote_type: VoteType,
+    delta: int = 1,
+    weight_delta: Optional[float] = None
+) -> int:
+    """
+    Adjust one vote type's count of a content item with an upsert.
+    
+    Must run in the transaction that changes the vote so both commit
+    together; the row lock taken by the upsert serializes concurrent
+    votes on the same item. Listening workers are notified on commit.
+    
+    Args:
+        db: Database session
+        content_id: ID of the voted content
+        vote_type: Type of the vote added or removed
+        delta: +1 for an added vote, -1 for a removed one
+        weight_delta: Change of the weighted sum, i.e. the signed weight
+            of the added or removed votes (default: delta, weight 1.0)
+            
+    Returns:
+        New tally version
+    """
+    if weight_delta is None:
+        weight_delta = float(delta)
+    
+    column = TALLY_COLUMNS[vote_type]
+    weight_column = TALLY_WEIGHT_COLUMNS[vote_type]
+    counts = {name: 0 for name in TALLY_COLUMNS.values()}
+    counts.update({name: 0.0 for name in TALLY_WEIGHT_COLUMNS.values()})
+    counts[column] = max(delta, 0)
+    counts[weight_column] = max(weight_delta, 0.0)
+    
+    statement = insert(VoteTally).values(
+        content_id=content_id,
+        version=1,
+        updated_at=datetime.utcnow(),
+        **counts
+    ).on_conflict_do_update(
+        index_elements=[VoteTally.content_id],
+        set_={
+            column: getattr(VoteTally, column) + delta,
+            weight_column: getattr(VoteTally, weight_column) + weight_delta,
+            "version": VoteTally.version + 1,
+            "updated_at": datetime.utcnow()
+        }
+    ).returning(VoteTally.version)
+    
+    version = (await db.execute(statement)).scalar_one()
+    await notify_tally_changed(db, content_id, version)
+    return version
+
+
+async def get_tallies(db: AsyncSession, content_ids: Iterable[UUID]) -> Dict[UUID, VoteTally]:
+    """
+    Load the tallies of several content items with one query.
+    
+    Args:
+        db: Database session
+        content_ids: IDs of content to look up
+        
+    Returns:
+        Tallies keyed by content_id; items without votes are absent
+    """
+    content_ids = list(content_ids)
+    if not content_ids:
+        return {}
+    
+    tallies = (await db.execute(
+        select(VoteTally).where(VoteTally.content_id.in_(content_ids))
+    )).scalars().all()
+    return {tally.content_id: tally for tally in tallies}
+
+
+async def repair_batch(db: AsyncSession, content_ids: List[UUID], dry_run: bool) -> Counter:
+    """
+    Recompute the tallies of a batch of content items from raw votes.
+    
+    vote_tallies is locked against concurrent upserts for the batch, so a
+    vote committed while the batch is counted cannot be lost; vote
+    inserts only wait for the length of one batch.
+    
+    Args:
+        db: Database session (its transaction is committed by the caller)
+        content_ids: IDs of content to recompute
+        dry_run: Count differences without writing them
+        
+    Returns:
+        Counters of checked, fixed and created tallies
+    """
+    report = Counter(checked=len(content_ids))
+    if not dry_run:
+        await db.execute(text("LOCK TABLE vote_tallies IN SHARE ROW EXCLUSIVE MODE"))
+    
+    rows = (await db.execute(
+        select(
+            Vote.content_id,
+            *[
+                func.count(Vote.id).filter(Vote.vote_type == vote_type).label(column)
+                for vote_type, column in TALLY_COLUMNS.items()
+            ],
+            *[
+                func.coalesce(func.sum(Vote.weight).filter(Vote.vote_type == vote_type), 0.0).label(column)
+                for vote_type, column in TALLY_WEIGHT_COLUMNS.items()
+            ]
+        ).where(
+            Vote.content_id.in_(content_ids)
+        ).group_by(
+            Vote.content_id
+        )
+    )).all()
+    columns = [*TALLY_COLUMNS.values(), *TALLY_WEIGHT_COLUMNS.values()]
+    expected = {row.content_id: {column: getattr(row, column) for column in columns} for row in rows}
+    current = await get_tallies(db, content_ids)
+    
+    for content_id in content_ids:
+        # Tallies left without votes are zeroed rather than deleted so
+        # their version keeps increasing
+        counts = expected.get(content_id, {column: 0 for column in columns})
+        tally = current.get(content_id)
+        
+        # Weighted sums depend on addition order, so compare them loosely
+        if tally is not None and all(
+            math.isclose(getattr(tally, column), count, rel_tol=1e-9, abs_tol=1e-9)
+            for column, count in counts.items()
+        ):
+            continue
+        
+        report["created" if tally is None else "fixed"] += 1
+        logger.info(f"Repairing tally of {content_id}: {counts}")
+        if not dry_run:
+            version = (await db.execute(
+                insert(VoteTally).values(
+                    content_id=content_id, version=1, updated_at=datetime.utcnow(), **counts
+                ).on_conflict_do_update(
+                    index_elements=[VoteTally.content_id],
+                    set_={**counts, "version": VoteTally.version + 1, "updated_at": datetime.utcnow()}
+                ).returning(VoteTally.version)
+            )).scalar_one()
+            await notify_tally_changed(db, content_id, version)
+    
+    return report
+
+
+async def repair_tallies(batch_size: Optional[int] = None, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Recompute every tally from raw votes, one batch of content ids at a time.
+    
+    Content ids are walked in order across both tables, so tallies with
+    no remaining votes are zeroed as well as missing tallies created.
+    
+    Args:
+        batch_size: Content ids per transaction (default: TALLY_REPAIR_BATCH_SIZE)
+        dry_run: Report differences without writing them
+        
+    Returns:
+        Counters of checked, fixed and created tallies
+    """
+    batch_size = batch_size or settings.TALLY_REPAIR_BATCH_SIZE
+    report = Counter()
+    after = None
+    
+    while True:
+        async with SessionLocal() as db:
+            ids = union(select(Vote.content_id), select(VoteTally.content_id)).subquery()
+            query = select(ids.c.content_id).order_by(ids.c.content_id).limit(batch_size)
+            if after is not None:
+                query = query.where(ids.c.content_id > after)
+            content_ids = (await db.execute(query)).scalars().all()
+            if not content_ids:
+                break
+            
+            report.update(await repair_batch(db, content_ids, dry_run))
+            await db.commit()
+            after = content_ids[-1]
+    
+    logger.info(f"Tally repair finished: {dict(report)}")
+    return dict(report)
+
+
+async def main(batch_size: int, dry_run: bool):
+    try:
+        report = await repair_tallies(batch_size, dry_run)
+        print(json.dumps(report, indent=2))
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=settings.TALLY_REPAIR_BATCH_SIZE, help="Content ids per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Report differences without repairing them")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(main(args.batch_size, args.dry_run))
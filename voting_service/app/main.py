@@ -1,8 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.db.base import engine, Base
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.results_cache import results_cache
+from app.core.vote_ingest import vote_ingestor
+from app.core.vote_velocity import vote_velocity
+from app.api.v1.endpoints.votes import sync_vote_tally
 import logging
 
 # Configure logging
@@ -12,13 +18,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for FastAPI application.
+    Creates database tables and starts the results cache listener,
+    write-behind vote ingestion and vote velocity rollups on startup;
+    flushes queued votes and velocity counts, stops the listener and
+    closes the pool on shutdown.
+    """
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    results_cache.start()
+    vote_ingestor.start(on_flushed=sync_vote_tally)
+    vote_velocity.start()
+    
+    yield
+    
+    await vote_ingestor.stop()
+    await vote_velocity.stop()
+    await results_cache.stop()
+    await engine.dispose()
+
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -28,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Include API router
@@ -51,3 +80,14 @@ async def health():
         "status": "healthy",
         "service": "voting_service"
     }
+
+
+@app.get("/metrics")
+async def metrics():
+    """Vote results cache, write-behind ingestion and velocity rollup counters."""
+    return {
+        "service": "voting_service",
+        "results_cache": results_cache.metrics(),
+        "vote_ingest": vote_ingestor.metrics(),
+        "vote_velocity": vote_velocity.metrics()
+    }
@@ -1,4 +1,4 @@
 """Models package initialization."""
-from app.models.vote import Vote, VoteType
+from app.models.vote import Vote, VoteType, VoteTally, VoterReputation, VoteVelocity
 
-__all__ = ["Vote", "VoteType"]
+__all__ = ["Vote", "VoteType", "VoteTally", "VoterReputation", "VoteVelocity"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, DateTime, Enum, UniqueConstraint
+from sqlalchemy import Column, String, Text, DateTime, Enum, Integer, BigInteger, Float, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -23,6 +23,7 @@ class Vote(Base):
         content_id: ID of the content being voted on (UUID)
         vote_type: Type of vote (authentic, false, unsure)
         reasoning: Optional text explanation for the vote
+        weight: Voter's reputation weight when the vote was cast
         voted_at: Timestamp when vote was cast
     """
     __tablename__ = "votes"
@@ -32,12 +33,109 @@ class Vote(Base):
     content_id = Column(UUID(as_uuid=True), nullable=False, index=True)
     vote_type = Column(Enum(VoteType), nullable=False)
     reasoning = Column(Text, nullable=True)
+    weight = Column(Float, default=1.0, server_default="1", nullable=False)
     voted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    # Unique constraint to prevent multiple votes from same user on same content
     __table_args__ = (
+        # Unique constraint to prevent multiple votes from same user on same content
         UniqueConstraint('user_id', 'content_id', name='uq_user_content_vote'),
+        # Keyset pagination of a user's vote history, newest first
+        Index('ix_votes_user_voted_at_id', 'user_id', 'voted_at', 'id'),
     )
     
     def __repr__(self):
         return f"<Vote(id={self.id}, user={self.user_id}, content={self.content_id}, type={self.vote_type})>"
+
+
+class VoteTally(Base):
+    """
+    SQLAlchemy model for the materialized vote counts of a content item.
+    
+    Updated with an upsert in the same transaction as every vote change,
+    so reading a content item's results is a primary key lookup instead
+    of a count over its votes.
+    
+    Attributes:
+        content_id: ID of the content (UUID, primary key)
+        authentic_count: Number of authentic votes
+        false_count: Number of false votes
+        unsure_count: Number of unsure votes
+        authentic_weight: Sum of the weights of authentic votes
+        false_weight: Sum of the weights of false votes
+        unsure_weight: Sum of the weights of unsure votes
+        version: Incremented on every change to the counts
+        updated_at: Timestamp of the last change
+    """
+    __tablename__ = "vote_tallies"
+    
+    content_id = Column(UUID(as_uuid=True), primary_key=True)
+    authentic_count = Column(Integer, default=0, nullable=False)
+    false_count = Column(Integer, default=0, nullable=False)
+    unsure_count = Column(Integer, default=0, nullable=False)
+    authentic_weight = Column(Float, default=0.0, server_default="0", nullable=False)
+    false_weight = Column(Float, default=0.0, server_default="0", nullable=False)
+    unsure_weight = Column(Float, default=0.0, server_default="0", nullable=False)
+    version = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return (
+            f"<VoteTally(content={self.content_id}, authentic={self.authentic_count}, "
+            f"false={self.false_count}, unsure={self.unsure_count}, version={self.version})>"
+        )
+
+
+class VoterReputation(Base):
+    """
+    SQLAlchemy model for a voter's reputation weight.
+    
+    Recomputed for all voters by the reputation job
+    (python -m app.db.reputation) from how often their votes agreed with
+    the final outcome of the content they voted on. Voters without a row
+    get the neutral weight.
+    
+    Attributes:
+        user_id: ID of the voter (UUID, primary key)
+        weight: Weight applied to the voter's new votes
+        agreed_votes: Votes that agreed with a final outcome
+        decided_votes: Votes on content with a final outcome
+        updated_at: Timestamp of the last recomputation
+    """
+    __tablename__ = "voter_reputations"
+    
+    user_id = Column(UUID(as_uuid=True), primary_key=True)
+    weight = Column(Float, nullable=False)
+    agreed_votes = Column(Integer, default=0, nullable=False)
+    decided_votes = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<VoterReputation(user={self.user_id}, weight={self.weight:.3f}, agreed={self.agreed_votes}/{self.decided_votes})>"
+
+
+class VoteVelocity(Base):
+    """
+    SQLAlchemy model for the number of votes a content item received in
+    one time bucket.
+    
+    Each worker counts new votes in memory and periodically adds its
+    counts to both the minute and the hour bucket, so trending content is
+    ranked from these rollups instead of scanning votes.voted_at. The
+    primary key leads with (resolution, bucket_start), serving both the
+    time-range scan of a trending query and the pruning of old buckets.
+    
+    Attributes:
+        resolution: Bucket length, "minute" or "hour"
+        bucket_start: Start of the bucket (UTC)
+        content_id: ID of the voted content (UUID)
+        vote_count: Votes cast on the content within the bucket
+    """
+    __tablename__ = "vote_velocity"
+    
+    resolution = Column(String(10), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    content_id = Column(UUID(as_uuid=True), primary_key=True)
+    vote_count = Column(Integer, default=0, nullable=False)
+    
+    def __repr__(self):
+        return f"<VoteVelocity(content={self.content_id}, {self.resolution}={self.bucket_start}, votes={self.vote_count})>"
@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List, Dict
 from datetime import datetime
 from uuid import UUID
 from app.models.vote import VoteType
+from app.core.config import settings
 
 
 class VoteCreate(BaseModel):
@@ -12,6 +13,12 @@ class VoteCreate(BaseModel):
     reasoning: Optional[str] = Field(None, max_length=1000, description="Optional reasoning for the vote")
 
 
+class VoteUpdate(BaseModel):
+    """Schema for changing a vote."""
+    vote_type: VoteType = Field(..., description="New type of vote (authentic, false, unsure)")
+    reasoning: Optional[str] = Field(None, max_length=1000, description="Optional reasoning for the vote")
+
+
 class VoteOut(BaseModel):
     """Schema for vote response."""
     id: UUID
@@ -35,9 +42,56 @@ class VoteResults(BaseModel):
     authentic_percentage: float
     false_percentage: float
     unsure_percentage: float
+    weighted_authentic_percentage: float
+    weighted_false_percentage: float
+    weighted_unsure_percentage: float
     verification_result: str
 
 
+class VoteResultsBatchRequest(BaseModel):
+    """Schema for requesting the vote results of many content items."""
+    content_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.VOTE_RESULTS_BATCH_MAX_IDS,
+        description="IDs of content to get results for"
+    )
+
+
+class VoteResultsBatch(BaseModel):
+    """Schema for vote results keyed by content_id."""
+    results: Dict[UUID, VoteResults]
+
+
+class UserVotesBatchRequest(BaseModel):
+    """Schema for looking up the current user's votes on many content items."""
+    content_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.VOTE_RESULTS_BATCH_MAX_IDS,
+        description="IDs of content to look up"
+    )
+
+
+class UserVotesBatch(BaseModel):
+    """Schema for the current user's vote types keyed by content_id."""
+    votes: Dict[UUID, VoteType] = Field(..., description="Vote type per voted content; unvoted content is omitted")
+
+
+class TrendingItem(BaseModel):
+    """Schema for a content item's vote velocity."""
+    content_id: UUID
+    votes: int = Field(..., description="Votes cast within the window")
+    votes_per_hour: float = Field(..., description="Average votes per hour over the window")
+
+
+class TrendingContent(BaseModel):
+    """Schema for the fastest-moving content over a window."""
+    window_minutes: int
+    resolution: str = Field(..., description="Rollup buckets used (minute or hour)")
+    items: List[TrendingItem]
+
+
 class VerificationResult(BaseModel):
     """Schema for verification status."""
     status: str = Field(..., description="Verification status (verified, false, disputed, pending)")
@@ -0,0 +1,59 @@
+# Set test environment variables BEFORE any app imports
+# This ensures settings are loaded with test configuration
+import os
+os.environ["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "test-secret-key-for-testing-only-do-not-use-in-production")
+
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import uuid4
+from app.core.config import settings
+from app.core.vote_ingest import VoteIngestor
+from app.models.vote import VoteType
+
+
+class FailingSession:
+    """Async session stand-in whose queries fail once released."""
+    
+    def __init__(self, release: asyncio.Event):
+        self.release = release
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    async def execute(self, *args, **kwargs):
+        await self.release.wait()
+        raise RuntimeError("database unavailable")
+
+
+@pytest.fixture
+def wal_dir(tmp_path, monkeypatch):
+    """Point the write-ahead log at a temporary directory."""
+    monkeypatch.setattr(settings, "VOTE_INGEST_WAL_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def ingestor(wal_dir):
+    """A vote ingestor with an open write-ahead segment."""
+    ingestor = VoteIngestor()
+    ingestor._open_segment()
+    return ingestor
+
+
+@pytest.fixture
+def make_vote():
+    """Build vote column values as queued by the ingestor."""
+    def make_vote(vote_type: VoteType = VoteType.AUTHENTIC, reasoning=None) -> dict:
+        return {
+            "id": uuid4(),
+            "user_id": uuid4(),
+            "content_id": uuid4(),
+            "vote_type": vote_type,
+            "reasoning": reasoning,
+            "voted_at": datetime(2024, 3, 1, 12, 30, 15, 250000)
+        }
+    return make_vote
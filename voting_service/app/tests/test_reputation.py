@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+from collections import namedtuple
+from uuid import UUID, uuid4
+from app.core.config import settings
+from app.db.reputation import (
+    NO_OUTCOME, VOTE_CODES, agreement_counts, compute_reputations, reputation_weight,
+    save_reputations, tally_outcomes, uuid_array
+)
+from app.models.vote import VoteType
+
+AUTHENTIC, FALSE, UNSURE = (VOTE_CODES[vote_type] for vote_type in (VoteType.AUTHENTIC, VoteType.FALSE, VoteType.UNSURE))
+
+VoteRow = namedtuple("VoteRow", "user_id content_id vote_type")
+
+
+class StreamSession:
+    """Async session stand-in streaming canned partitions, one list per stream() call."""
+    
+    def __init__(self, *streams):
+        self.streams = list(streams)
+        self.executed = []
+    
+    async def stream(self, statement):
+        return StreamResult(self.streams.pop(0))
+    
+    async def execute(self, statement, params=None):
+        self.executed.extend(params)
+
+
+class StreamResult:
+    def __init__(self, partitions):
+        self._partitions = partitions
+    
+    async def partitions(self):
+        for rows in self._partitions:
+            yield rows
+
+
+@pytest.fixture(autouse=True)
+def reputation_settings(monkeypatch):
+    """Pin the thresholds and weight range the expectations are based on."""
+    for name, value in {
+        "VERIFIED_THRESHOLD": 0.7,
+        "FALSE_THRESHOLD": 0.7,
+        "REPUTATION_MIN_OUTCOME_VOTES": 5,
+        "REPUTATION_PRIOR_VOTES": 10.0,
+        "REPUTATION_MIN_WEIGHT": 0.2,
+        "REPUTATION_MAX_WEIGHT": 1.8
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+
+
+def sorted_outcomes(outcomes: dict):
+    """Sorted content id array and aligned outcomes, as load_outcomes returns them."""
+    content_ids = uuid_array(list(outcomes))
+    codes = np.array(list(outcomes.values()), dtype=np.int8)
+    order = np.argsort(content_ids)
+    return content_ids[order], codes[order]
+
+
+def test_tally_outcomes_thresholds(monkeypatch):
+    """Test outcome thresholds, the vote minimum and unsure dilution."""
+    weights = np.array([
+        [7.0, 3.0, 0.0],
+        [6.9, 3.1, 0.0],
+        [3.0, 7.0, 0.0],
+        [7.0, 3.0, 0.0],
+        [0.0, 0.0, 0.0],
+        [7.0, 0.0, 3.5]
+    ])
+    counts = np.array([10, 10, 10, 4, 5, 10])
+    
+    assert tally_outcomes(weights, counts).tolist() == [AUTHENTIC, NO_OUTCOME, FALSE, NO_OUTCOME, NO_OUTCOME, NO_OUTCOME]
+    
+    # Verified wins when both shares pass
+    monkeypatch.setattr(settings, "FALSE_THRESHOLD", 0.25)
+    assert tally_outcomes(np.array([[0.7, 0.3, 0.0]]), np.array([5])).tolist() == [AUTHENTIC]
+
+
+def test_agreement_counts_ignores_unsure_and_undecided():
+    """Test that only authentic/false votes on final outcomes count."""
+    decided_content, open_content, unknown_content = uuid4(), uuid4(), uuid4()
+    content_ids, outcomes = sorted_outcomes({decided_content: AUTHENTIC, open_content: NO_OUTCOME})
+    agreeing, disagreeing, outsider = uuid4(), uuid4(), uuid4()
+    votes = [
+        (agreeing, decided_content, AUTHENTIC),
+        (agreeing, open_content, FALSE),
+        (disagreeing, decided_content, FALSE),
+        (disagreeing, open_content, UNSURE),
+        (outsider, decided_content, UNSURE),
+        (outsider, unknown_content, AUTHENTIC)
+    ]
+    
+    voters, agreed, decided = agreement_counts(
+        uuid_array([vote[0] for vote in votes]),
+        uuid_array([vote[1] for vote in votes]),
+        np.array([vote[2] for vote in votes], dtype=np.int8),
+        content_ids,
+        outcomes
+    )
+    
+    counts = {voter: (agreed_count, decided_count) for voter, agreed_count, decided_count in zip(voters.tolist(), agreed, decided)}
+    assert counts == {agreeing.bytes: (1, 1), disagreeing.bytes: (0, 1), outsider.bytes: (0, 0)}
+
+
+def test_agreement_counts_without_tallies():
+    """Test that votes without any tallies are all undecided."""
+    voters, agreed, decided = agreement_counts(
+        uuid_array([uuid4()]), uuid_array([uuid4()]), np.array([AUTHENTIC], dtype=np.int8),
+        np.array([], dtype="S16"), np.array([], dtype=np.int8)
+    )
+    assert len(voters) == 1
+    assert (agreed.tolist(), decided.tolist()) == ([0], [0])
+
+
+def test_reputation_weight():
+    """Test the neutral weight and smoothing towards 50% agreement."""
+    assert reputation_weight(0, 0) == pytest.approx(1.0)
+    assert reputation_weight(10, 10) == pytest.approx(1.4)
+    assert reputation_weight(0, 10) == pytest.approx(0.6)
+    weights = reputation_weight(np.array([1000.0, 0.0]), np.array([1000.0, 1000.0]))
+    assert weights[0] < 1.8 and weights[0] == pytest.approx(1.8, abs=0.01)
+    assert weights[1] > 0.2 and weights[1] == pytest.approx(0.2, abs=0.01)
+
+
+async def test_compute_reputations_merges_partitions():
+    """Test that a voter's counts are merged across vote partitions."""
+    content, other_content = uuid4(), uuid4()
+    voter, other = uuid4(), uuid4()
+    tallies = [[(content, 8.0, 2.0, 0.0, 10)], [(other_content, 1.0, 9.0, 0.0, 10)]]
+    votes = [
+        [VoteRow(voter, content, VoteType.AUTHENTIC), VoteRow(other, content, VoteType.FALSE)],
+        [VoteRow(voter, uuid4(), VoteType.FALSE), VoteRow(voter, other_content, VoteType.FALSE)]
+    ]
+    
+    voters, agreed, decided, total = await compute_reputations(StreamSession(tallies, votes))
+    
+    counts = {voter_id: (agreed_count, decided_count) for voter_id, agreed_count, decided_count in zip(voters.tolist(), agreed, decided)}
+    assert counts == {voter.bytes: (2, 2), other.bytes: (0, 1)}
+    assert total == 4
+
+
+async def test_uuids_ending_in_nul_bytes():
+    """Test that UUIDs whose last bytes are NUL match and are saved intact."""
+    content = UUID(bytes=b"\x07" * 15 + b"\0")
+    voter = UUID(bytes=b"\x05" * 13 + b"\0" * 3)
+    session = StreamSession(
+        [[(content, 0.0, 6.0, 0.0, 6)]],
+        [[VoteRow(voter, content, VoteType.FALSE)]]
+    )
+    
+    voters, agreed, decided, _ = await compute_reputations(session)
+    assert (agreed.tolist(), decided.tolist()) == ([1], [1])
+    
+    await save_reputations(session, voters, agreed, decided, reputation_weight(agreed, decided))
+    assert [params["user_id"] for params in session.executed] == [voter]
@@ -0,0 +1,109 @@
+import asyncio
+import app.core.vote_ingest as vote_ingest
+from app.core.vote_ingest import VoteIngestor, WalSegment, encode_vote, decode_vote
+from app.models.vote import VoteType
+from app.tests.conftest import FailingSession
+
+
+def queue_vote(ingestor: VoteIngestor, vote: dict):
+    """Append and queue a vote the way submit() does after its checks."""
+    ingestor._segment.append(encode_vote(vote))
+    ingestor._appended += 1
+    ingestor._queue(vote)
+
+
+def test_encode_decode_round_trip(make_vote):
+    """Test that a vote survives a write-ahead log line unchanged."""
+    for vote in (make_vote(), make_vote(VoteType.UNSURE, reasoning='Quote "out of context"\nsecond line')):
+        line = encode_vote(vote)
+        assert "\n" not in line
+        assert decode_vote(line) == vote
+
+
+def test_recover_skips_torn_line(wal_dir, make_vote):
+    """Test that recovery queues complete lines and skips a torn last one."""
+    votes = [make_vote(), make_vote(VoteType.FALSE)]
+    torn = encode_vote(make_vote())[:40]
+    (wal_dir / "votes-1-1.wal").write_text("".join(encode_vote(vote) + "\n" for vote in votes) + torn)
+    
+    ingestor = VoteIngestor()
+    ingestor.recover()
+    
+    assert ingestor._pending == votes
+    assert (votes[1]["user_id"], votes[1]["content_id"]) in ingestor._keys
+    assert ingestor.counters["recovered"] == 2
+    assert ingestor.metrics()["segments"] == 1
+
+
+def test_recover_skips_locked_segment(ingestor, make_vote):
+    """Test that a segment held by a running worker is not replayed."""
+    queue_vote(ingestor, make_vote())
+    
+    other = VoteIngestor()
+    other.recover()
+    
+    assert other._pending == []
+
+
+async def test_flush_failure_requeues(ingestor, make_vote, monkeypatch):
+    """Test that a failed flush keeps the votes queued and their segment."""
+    release = asyncio.Event()
+    release.set()
+    monkeypatch.setattr(vote_ingest, "SessionLocal", lambda: FailingSession(release))
+    votes = [make_vote(), make_vote()]
+    for vote in votes:
+        queue_vote(ingestor, vote)
+    segment = ingestor._segment
+    
+    await ingestor.flush()
+    
+    assert ingestor._pending == votes
+    assert ingestor._sealed == [segment]
+    assert segment.path.exists()
+    assert ingestor._segment is not segment
+    assert ingestor.counters["flush_errors"] == 1
+    
+    # Votes queued meanwhile are kept behind the retried batch
+    later = make_vote()
+    queue_vote(ingestor, later)
+    await ingestor.flush()
+    assert ingestor._pending == votes + [later]
+    assert len(ingestor._sealed) == 2
+
+
+async def test_sync_covers_segment_rotated_by_flush(ingestor, make_vote, monkeypatch):
+    """Test that a group fsync started before a flush rotates still syncs the old segment."""
+    synced = []
+    monkeypatch.setattr(WalSegment, "fsync", lambda segment: synced.append(segment.path))
+    release = asyncio.Event()
+    monkeypatch.setattr(vote_ingest, "SessionLocal", lambda: FailingSession(release))
+    queue_vote(ingestor, make_vote())
+    segment = ingestor._segment
+    
+    # The fsync task is created first but only runs after flush() rotated
+    sync = asyncio.ensure_future(ingestor._sync())
+    flush = asyncio.ensure_future(ingestor.flush())
+    await sync
+    
+    assert ingestor._segment is not segment
+    assert segment.path in synced
+    assert ingestor._synced == 1
+    
+    release.set()
+    await flush
+
+
+async def test_flush_vote_only_when_queued(ingestor, make_vote, monkeypatch):
+    """Test that flush_vote flushes for a queued vote and reports a failed flush."""
+    release = asyncio.Event()
+    release.set()
+    monkeypatch.setattr(vote_ingest, "SessionLocal", lambda: FailingSession(release))
+    vote = make_vote()
+    queue_vote(ingestor, vote)
+    
+    assert await ingestor.flush_vote(vote["user_id"], make_vote()["content_id"]) is True
+    assert ingestor.counters["flush_errors"] == 0
+    
+    assert await ingestor.flush_vote(vote["user_id"], vote["content_id"]) is False
+    assert ingestor.counters["flush_errors"] == 1
+    assert ingestor._pending == [vote]
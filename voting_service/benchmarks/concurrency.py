@@ -0,0 +1,183 @@
+"""
+Compare vote throughput of async and blocking database sessions under load.
+
+Runs the same mixed workload, vote submissions (--write-ratio) and vote
+result reads otherwise, with N concurrent workers in one event loop:
+once through the async session stack the endpoints use, and once with
+the synchronous Session and count queries they used before. Blocking calls stall the event
+loop for every query, so their throughput stays flat as concurrency
+grows; async sessions can overlap queries across the connection pool,
+which pays off only when database round trips outweigh the extra
+event loop and driver overhead. --query-latency-ms adds one pg_sleep
+query of that length to every operation, standing in for network round
+trips and slow queries of a remote database.
+
+Run against a scratch database (DATABASE_URL); votes written by the
+benchmark are deleted afterwards.
+
+Usage (from the voting_service directory):
+    python -m benchmarks.concurrency --concurrency 1 10 50 --seconds 10 --query-latency-ms 5
+"""
+from sqlalchemy import create_engine, delete, func, text
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Awaitable, Callable, List
+from uuid import UUID, uuid4
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from app.core.config import settings
+from app.db.base import Base, SessionLocal, engine
+from app.models.vote import Vote, VoteType, VoteTally
+from app.db.tallies import increment_tally
+from app.api.v1.endpoints.votes import compute_vote_results
+
+VOTE_TYPES = list(VoteType)
+
+# Server-side wait simulating database latency
+SLOW_QUERY = text("SELECT pg_sleep(:seconds)")
+
+
+def legacy_vote_counts(db: Session, content_id: UUID) -> list:
+    """Run the vote count query the way the endpoints did before."""
+    return db.query(
+        Vote.vote_type,
+        func.count(Vote.id).label('count')
+    ).filter(
+        Vote.content_id == content_id
+    ).group_by(
+        Vote.vote_type
+    ).all()
+
+
+def new_vote(content_ids: List[UUID]) -> Vote:
+    """Build a vote by a new user on a random benchmark content item."""
+    return Vote(
+        user_id=uuid4(),
+        content_id=random.choice(content_ids),
+        vote_type=random.choice(VOTE_TYPES)
+    )
+
+
+async def async_operation(content_ids: List[UUID], write_ratio: float, latency: float):
+    """One request's database work using an async session."""
+    async with SessionLocal() as db:
+        if latency:
+            await db.execute(SLOW_QUERY, {"seconds": latency})
+        if random.random() < write_ratio:
+            vote = new_vote(content_ids)
+            db.add(vote)
+            await db.flush()
+            await increment_tally(db, vote.content_id, vote.vote_type)
+            await db.commit()
+        else:
+            await compute_vote_results(db, random.choice(content_ids))
+
+
+def blocking_operation_factory(content_ids: List[UUID], write_ratio: float, latency: float) -> Callable[[], Awaitable]:
+    """Build the same operation on a synchronous session, called from async code."""
+    sync_engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
+    BlockingSession = sessionmaker(bind=sync_engine, autoflush=False)
+    
+    async def blocking_operation():
+        db = BlockingSession()
+        try:
+            if latency:
+                db.execute(SLOW_QUERY, {"seconds": latency})
+            if random.random() < write_ratio:
+                db.add(new_vote(content_ids))
+                db.commit()
+            else:
+                legacy_vote_counts(db, random.choice(content_ids))
+        finally:
+            db.close()
+            
+    return blocking_operation
+
+
+async def run_load(operation: Callable[[], Awaitable], concurrency: int, seconds: float) -> List[float]:
+    """
+    Call an operation from concurrent workers until the time is up.
+    
+    Args:
+        operation: Zero-argument coroutine function
+        concurrency: Number of concurrent workers
+        seconds: Duration of the run
+        
+    Returns:
+        Latencies of all completed operations in milliseconds
+    """
+    deadline = time.perf_counter() + seconds
+    latencies = []
+    
+    async def worker():
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await operation()
+            latencies.append((time.perf_counter() - started) * 1000)
+            
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def summarize(name: str, latencies: List[float], seconds: float) -> str:
+    """
+    Format throughput and latency percentiles for a run.
+    
+    Args:
+        name: Label for the run
+        latencies: Latencies in milliseconds
+        seconds: Duration of the run
+        
+    Returns:
+        Single-line summary with throughput, mean, p50, p95 and p99
+    """
+    ordered = sorted(latencies)
+    
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))]
+        
+    return (
+        f"{name:<20} {len(ordered) / seconds:9.1f} ops/s "
+        f"mean={statistics.mean(ordered):8.2f}ms p50={percentile(0.50):8.2f}ms "
+        f"p95={percentile(0.95):8.2f}ms p99={percentile(0.99):8.2f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seconds", type=float, default=10.0, help="Duration of each run")
+    parser.add_argument("--contents", type=int, default=200, help="Content items voted on")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Share of operations that submit votes")
+    parser.add_argument("--query-latency-ms", type=float, default=0.0, help="Extra pg_sleep per operation")
+    args = parser.parse_args()
+    
+    content_ids = [uuid4() for _ in range(args.contents)]
+    latency = args.query_latency_ms / 1000
+    blocking_operation = blocking_operation_factory(content_ids, args.write_ratio, latency)
+    
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    
+    try:
+        for concurrency in args.concurrency:
+            for name, operation in [
+                ("blocking", blocking_operation),
+                ("async", lambda: async_operation(content_ids, args.write_ratio, latency))
+            ]:
+                latencies = await run_load(operation, concurrency, args.seconds)
+                print(summarize(f"{name} c={concurrency}", latencies, args.seconds))
+    
+    finally:
+        async with SessionLocal() as db:
+            await db.execute(delete(Vote).where(Vote.content_id.in_(content_ids)))
+            await db.execute(delete(VoteTally).where(VoteTally.content_id.in_(content_ids)))
+            await db.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())